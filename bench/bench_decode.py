@@ -0,0 +1,63 @@
+"""프레임 디코더 벤치마크 (chat_decoder 백엔드별)
+
+chat_data_example.txt 샘플로 도배 프레임을 만들어 ChatWorker._handle_frame 경로
+(프레임 디코드 + profile/extras 파싱)를 백엔드별로 측정한다.
+
+    python bench/bench_decode.py [--frames 2000] [--per-frame 20]
+"""
+
+import argparse
+import asyncio
+import time
+
+from samples import spam_frames
+
+from chat_decoder import available_backends, get_decoder
+from chat_worker import ChatWorker
+
+
+async def _noop(chat_data):
+    pass
+
+
+def run_backend(name: str, frames: list[bytes], as_str: bool = False) -> tuple[float, int]:
+    worker = ChatWorker('bench', {}, _noop, lambda msg: None)
+    worker.decoder = get_decoder(name)
+    payloads = [f.decode('utf-8') for f in frames] if as_str else frames
+
+    async def go():
+        for payload in payloads:
+            await worker._handle_frame(payload)
+
+    start = time.perf_counter()
+    asyncio.run(go())
+    return time.perf_counter() - start, len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--frames', type=int, default=2000)
+    parser.add_argument('--per-frame', type=int, default=20)
+    args = parser.parse_args()
+
+    frames = spam_frames(args.frames, args.per_frame)
+    messages = args.frames * args.per_frame
+
+    cases = [('json (str, 기존 방식)', 'json', True)]
+    cases += [(name, name, False) for name in reversed(available_backends())]
+
+    baseline = None
+    print(f'{messages} messages ({args.frames} frames x {args.per_frame})')
+    print(f'{"backend":<24}{"total(s)":>10}{"us/msg":>10}{"msg/s":>12}{"speedup":>9}')
+    for label, name, as_str in cases:
+        run_backend(name, frames[:100], as_str)  # 워밍업
+        elapsed, _ = run_backend(name, frames, as_str)
+        baseline = baseline or elapsed
+        print(
+            f'{label:<24}{elapsed:>10.3f}{elapsed / messages * 1e6:>10.2f}'
+            f'{messages / elapsed:>12.0f}{baseline / elapsed:>8.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""검색 입력 1글자당 필터 비용 벤치마크 (전체 lower() 재검사 vs ChatFilter)
+
+버퍼에 메시지를 채운 뒤 검색창에 한 글자씩 입력하는 상황을 재현해 키 입력마다 걸린 시간을
+잰다. 기존 방식은 매번 모든 메시지의 닉네임/메시지를 lower()해서 검사,
+새 방식은 ChatFilter.set() + ChatViewport.refresh() (화면 row 150개, 2글자부터 n-gram 역색인).
+
+    python bench/bench_filter.py [--messages 100000] [--query 사용자12]
+    python bench/bench_filter.py --query "hello world 9"   # 거의 모든 메시지가 걸리는 검색어
+"""
+
+import argparse
+import time
+
+import samples  # noqa: F401 — src/ 경로 추가
+
+from chat_filter import ChatFilter
+from chat_message import ChatMessage
+from chat_view import ChatViewport
+
+
+def make_chats(count: int) -> list[ChatMessage]:
+    return [
+        ChatMessage(time='00:00:00', type='후원' if i % 50 == 0 else '채팅', uid=f'uid{i % 3000}',
+                    nickname=f'사용자{i % 3000}', message=f'안녕하세요 Hello World {i}')
+        for i in range(count)
+    ]
+
+
+def legacy_cost(chats: list[ChatMessage], query: str) -> list[float]:
+    """변경 전 _item_matches_filter 방식: 키 입력마다 전체 메시지 lower() 후 검사"""
+    times = []
+    for n in range(1, len(query) + 1):
+        q = query[:n].lower()
+        start = time.perf_counter()
+        [cd for cd in chats if q in cd.nickname.lower() or q in cd.message.lower()]
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def filter_cost(chats: list[ChatMessage], query: str) -> list[float]:
+    chat_filter = ChatFilter(len(chats))
+    viewport = ChatViewport([], lambda seq, entry: object(), capacity=len(chats), index=chat_filter)
+    for chat in chats:
+        viewport.append(chat)
+
+    times = []
+    for n in range(1, len(query) + 1):
+        start = time.perf_counter()
+        chat_filter.set(False, query[:n])
+        viewport.refresh()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--messages', type=int, default=100_000)
+    parser.add_argument('--query', default='사용자12')
+    args = parser.parse_args()
+
+    chats = make_chats(args.messages)
+    legacy = legacy_cost(chats, args.query)
+    engine = filter_cost(chats, args.query)
+
+    print(f'{"query":>10}{"lower() 재검사 ms":>20}{"ChatFilter ms":>16}')
+    for n, (a, b) in enumerate(zip(legacy, engine), 1):
+        print(f'{args.query[:n]:>10}{a * 1000:>20.2f}{b * 1000:>16.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""메시지 레코드 메모리 측정 (기존 12키 dict vs ChatMessage)
+
+도배 프레임을 실제와 같이 한 프레임씩 디코드/파싱하고 결과 레코드만 보관했을 때
+tracemalloc으로 남는 메모리를 재서 메시지당 바이트로 비교한다.
+
+    python bench/bench_message_memory.py [--messages 10000]
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import tracemalloc
+
+from samples import spam_frames
+
+from chat_worker import ChatWorker
+
+
+def legacy_parse(chat_data, chat_type):
+    """변경 전 _process_chat_data가 만들던 dict (비교용 재현)"""
+    profile_data = json.loads(chat_data['profile'])
+    streaming_prop = profile_data.get('streamingProperty', {})
+    subscription = streaming_prop.get('subscription', {})
+    badges = []
+    if subscription.get('badge', {}).get('imageUrl'):
+        badges.append(subscription['badge']['imageUrl'])
+    for badge in profile_data.get('activityBadges', []):
+        if badge.get('imageUrl') and badge.get('activated'):
+            badges.append(badge['imageUrl'])
+    extras = json.loads(chat_data['extras'])
+    return {
+        'time': datetime.datetime.fromtimestamp(chat_data['msgTime'] / 1000).strftime('%H:%M:%S'),
+        'type': chat_type,
+        'uid': chat_data['uid'],
+        'nickname': profile_data['nickname'],
+        'message': chat_data['msg'],
+        'colorCode': streaming_prop.get('nicknameColor', {}).get('colorCode'),
+        'badges': badges,
+        'emojis': extras.get('emojis', {}),
+        'subscription_month': subscription.get('accumulativeMonth'),
+        'subscription_tier': subscription.get('tier'),
+        'os_type': extras.get('osType'),
+        'user_role': profile_data.get('userRoleCode'),
+    }
+
+
+def measure(frames, build) -> int:
+    """frames를 모두 처리해 레코드를 보관했을 때 증가한 메모리 (bytes)"""
+    kept = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    build(frames, kept)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, len(kept)
+
+
+def build_legacy(frames, kept):
+    for payload in frames:
+        frame = json.loads(payload)
+        for chat in frame['bdy']:
+            kept.append(legacy_parse(chat, '채팅'))
+
+
+def build_new(frames, kept):
+    async def on_chat(message):
+        kept.append(message)
+
+    worker = ChatWorker('bench', {}, on_chat, lambda msg: None)
+
+    async def go():
+        for payload in frames:
+            await worker._handle_frame(payload)
+
+    asyncio.run(go())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--messages', type=int, default=10_000)
+    args = parser.parse_args()
+
+    per_frame = 20
+    frames = spam_frames(args.messages // per_frame, per_frame)
+
+    print(f'{"record":<14}{"messages":>10}{"total(KB)":>12}{"bytes/msg":>12}')
+    for label, build in (('dict (기존)', build_legacy), ('ChatMessage', build_new)):
+        size, count = measure(frames, build)
+        print(f'{label:<14}{count:>10}{size / 1024:>12.1f}{size / count:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
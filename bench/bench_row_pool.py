@@ -0,0 +1,87 @@
+"""row 위젯 풀 벤치마크 (매번 생성 vs ChatRow 재사용)
+
+화면 구간(150 row)을 유지하며 메시지를 계속 추가할 때의 처리 시간, GC 횟수,
+tracemalloc 최대 메모리, 생성한 ChatRow 수를 비교한다.
+
+    python bench/bench_row_pool.py [--messages 20000]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import samples  # noqa: F401 — src/ 경로 추가
+
+from chat_message import ChatMessage
+from chat_row import ChatRow, RowPool, message_segments
+from chat_view import ChatViewport
+
+WINDOW = 150
+EMOJIS = {'d_94': 'https://e/d_94.png'}
+
+
+def make_messages(count: int) -> list[ChatMessage]:
+    messages = []
+    for i in range(count):
+        if i % 3 == 0:
+            messages.append(ChatMessage(time='12:00:00', type='채팅', uid=f'u{i % 50}', nickname='닉',
+                                        message='{:d_94:}{:d_94:} ㅋㅋ', emojis=EMOJIS))
+        else:
+            messages.append(ChatMessage(time='12:00:00', type='채팅', uid=f'u{i % 50}', nickname='닉',
+                                        message=f'메시지 {i}', badges=('b',)))
+    return messages
+
+
+def run(messages, pooled: bool) -> dict:
+    created = 0
+
+    def new_row():
+        nonlocal created
+        created += 1
+        return ChatRow(lambda uid, nick: None)
+
+    pool = RowPool(new_row)
+
+    def build(seq, message):
+        row = pool.acquire() if pooled else new_row()
+        segments = None
+        if message.emojis:
+            segments = message_segments(message.message, message.emojis)
+        row.bind(seq, message, '#fff', message.badges[:3], segments, True, True)
+        return row.control
+
+    release = (lambda control: pool.release(control.data)) if pooled else None
+    viewport = ChatViewport([], build, capacity=100_000, window=WINDOW, release_row=release)
+
+    gc.collect()
+    collections = sum(s['collections'] for s in gc.get_stats())
+    tracemalloc.start()
+    start = time.perf_counter()
+    for message in messages:
+        viewport.append(message)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'us_per_msg': elapsed / len(messages) * 1e6,
+        'gc': sum(s['collections'] for s in gc.get_stats()) - collections,
+        'peak_kb': peak / 1024,
+        'rows_created': created,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--messages', type=int, default=20_000)
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages)
+    print(f'{"mode":<10}{"µs/msg":>10}{"gc runs":>10}{"peak(KB)":>12}{"ChatRow 생성":>14}')
+    for label, pooled in (('매번 생성', False), ('풀 재사용', True)):
+        r = run(messages, pooled)
+        print(f'{label:<10}{r["us_per_msg"]:>10.1f}{r["gc"]:>10}{r["peak_kb"]:>12.0f}{r["rows_created"]:>14}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""이모지 메시지 레이아웃 캐시 벤치마크 (매번 message_segments vs SegmentCache)
+
+도배 상황을 흉내 낸 말뭉치에서 메시지 1건의 조각 분리 비용과 캐시 적중률을 잰다.
+    spam     같은 이모지 도배 몇 종류가 반복 (반복 횟수만 조금씩 다름)
+    mixed    도배 70% + 텍스트가 섞인 고유 이모지 메시지 30%
+    unique   모든 메시지가 다름 (캐시 최악의 경우)
+
+    python bench/bench_segments.py [--messages 100000]
+"""
+
+import argparse
+import random
+import time
+
+import samples  # noqa: F401 — src/ 경로 추가
+
+from chat_row import SegmentCache, message_segments
+
+EMOJIS = {f'd_{n}': f'https://ssl.pstatic.net/static/nng/glive/icon/b_{n}.gif' for n in range(40, 100)}
+SPAM_NAMES = ['d_94', 'd_44', 'd_61', 'd_77', 'd_88']
+
+
+def _emojis_for(message: str) -> dict:
+    """서버처럼 메시지에 쓰인 이모지만 매핑에 넣음"""
+    return {name: url for name, url in EMOJIS.items() if f'{{:{name}:}}' in message}
+
+
+def _spam(rng: random.Random) -> str:
+    name = rng.choice(SPAM_NAMES)
+    return f'{{:{name}:}}' * rng.randint(1, 8)
+
+
+def _unique(rng: random.Random, i: int) -> str:
+    name = rng.choice(list(EMOJIS))
+    return f'ㅋㅋㅋ {i} {{:{name}:}} 이거 실화냐 {{:{name}:}}'
+
+
+def corpus(kind: str, count: int) -> list[tuple[str, dict]]:
+    rng = random.Random(0)
+    messages = []
+    for i in range(count):
+        if kind == 'spam' or (kind == 'mixed' and rng.random() < 0.7):
+            message = _spam(rng)
+        else:
+            message = _unique(rng, i)
+        messages.append((message, _emojis_for(message)))
+    return messages
+
+
+def run(messages, cached: bool) -> tuple[float, float]:
+    cache = SegmentCache()
+    start = time.perf_counter()
+    if cached:
+        for message, emojis in messages:
+            cache.get(message, emojis)
+    else:
+        for message, emojis in messages:
+            message_segments(message, emojis)
+    elapsed = (time.perf_counter() - start) / len(messages)
+    return elapsed, cache.stats()['hit_rate']
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--messages', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f'{"corpus":>8}{"split µs/msg":>15}{"cache µs/msg":>15}{"hit rate":>10}')
+    for kind in ('spam', 'mixed', 'unique'):
+        messages = corpus(kind, args.messages)
+        plain, _ = run(messages, cached=False)
+        cached, hit_rate = run(messages, cached=True)
+        print(f'{kind:>8}{plain * 1e6:>15.2f}{cached * 1e6:>15.2f}{hit_rate:>10.1%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""메시지 저장소 축출 비용 벤치마크 (list.pop(0) vs RingBuffer)
+
+용량이 가득 찬 정상 상태에서 메시지 1건 추가(+ 가장 오래된 1건 축출)에 드는 시간을
+용량별로 잰다. 기존 방식은 all_items.pop(0) + chat_list.controls.remove(widget),
+새 방식은 ChatViewport(링 버퍼 + 화면 row 150개) 경로.
+
+    python bench/bench_store.py [--caps 10000,50000,100000] [--messages 20000]
+"""
+
+import argparse
+import time
+
+import samples  # noqa: F401 — src/ 경로 추가
+
+from chat_view import ChatViewport
+
+
+def legacy_cost(cap: int, messages: int) -> float:
+    """변경 전 main.py 방식 재현: 메시지마다 위젯 1개, 두 list를 같이 유지"""
+    all_items, controls = [], []
+    for i in range(cap):
+        widget = object()
+        all_items.append((False, widget, i, None))
+        controls.append(widget)
+
+    start = time.perf_counter()
+    for i in range(messages):
+        widget = object()
+        all_items.append((False, widget, i, None))
+        if len(all_items) > cap:
+            _, removed_widget, _, _ = all_items.pop(0)
+            controls.remove(removed_widget)
+        controls.append(widget)
+    return (time.perf_counter() - start) / messages
+
+
+def viewport_cost(cap: int, messages: int) -> float:
+    viewport = ChatViewport([], lambda seq, entry: object(), capacity=cap)
+    for i in range(cap):
+        viewport.append(i)
+
+    start = time.perf_counter()
+    for i in range(messages):
+        viewport.append(i)
+    return (time.perf_counter() - start) / messages
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--caps', default='10000,50000,100000')
+    parser.add_argument('--messages', type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f'{"cap":>8}{"list.pop(0) µs/msg":>22}{"RingBuffer µs/msg":>20}')
+    for cap in (int(c) for c in args.caps.split(',')):
+        legacy = legacy_cost(cap, args.messages)
+        ring = viewport_cost(cap, args.messages)
+        print(f'{cap:>8}{legacy * 1e6:>22.2f}{ring * 1e6:>20.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""벤치마크 공용 샘플 로더
+
+chat_data_example.txt는 사람이 읽기 좋게 문자열 안에 줄바꿈/들여쓰기를 넣어둔 형태라
+그대로는 JSON이 아니다. 줄바꿈+들여쓰기를 제거하고 '#' 주석 줄을 건너뛰어
+서버가 보내는 것과 같은 compact 프레임(bytes)으로 복원한다.
+"""
+
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+EXAMPLE_PATH = os.path.join(ROOT, 'chat_data_example.txt')
+
+
+def load_example_frames(path: str = EXAMPLE_PATH) -> list[dict]:
+    """chat_data_example.txt → 프레임 dict 목록"""
+    with open(path, encoding='utf-8') as f:
+        lines = [line for line in f if not line.lstrip().startswith('#')]
+
+    frames, depth, buf = [], 0, []
+    for ch in ''.join(lines):
+        if depth == 0 and ch != '{':
+            continue
+        buf.append(ch)
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                frames.append(json.loads(re.sub(r'\n\s*', '', ''.join(buf))))
+                buf = []
+    return frames
+
+
+def example_chats() -> list[dict]:
+    """샘플 프레임들의 bdy 항목(채팅 1건씩)"""
+    return [chat for frame in load_example_frames() for chat in frame['bdy']]
+
+
+def spam_frames(frame_count: int, per_frame: int = 20, cmd: int = 93101) -> list[bytes]:
+    """샘플 채팅을 반복해 도배 상황의 프레임(bytes) 생성"""
+    chats = example_chats()
+    frames = []
+    for i in range(frame_count):
+        bdy = [chats[(i * per_frame + j) % len(chats)] for j in range(per_frame)]
+        frame = {'svcid': 'game', 'ver': '1', 'bdy': bdy, 'cmd': cmd, 'tid': str(i), 'cid': 'N2GB1p'}
+        frames.append(json.dumps(frame, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    return frames
@@ -1,39 +1,185 @@
-"""Chzzk API 호출"""
-import requests
+"""Chzzk API 호출
+
+ChatWorker는 async 함수(*_async)를 사용한다. 공용 httpx.AsyncClient가 호스트별
+keep-alive 연결을 유지하므로 주기적인 방송 상태 확인이나 여러 채널 동시 연결에서
+매번 TCP+TLS 핸드셰이크를 하지 않고, 스레드 풀도 차지하지 않는다.
+
+동기 함수(fetch_*)는 테스트/스크립트용 얇은 래퍼 — 같은 파싱 로직을 공용 httpx.Client로 호출.
+
+- 타임아웃: 연결 3초 / 전체 5초
+- 재시도: 연결 오류, 타임아웃, 429/5xx 응답만 최대 RETRIES회 (지수 백오프)
+- 쿠키는 요청마다 Cookie 헤더로 보냄 (클라이언트 쿠키 저장소에 남지 않게)
+"""
+import asyncio
+import logging
+import time
+
+import httpx
+
+logger = logging.getLogger(__name__)
 
 HEADERS = {'User-Agent': ''}
+USER_STATUS_URL = 'https://comm-api.game.naver.com/nng_main/v1/user/getUserStatus'
+TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+RETRIES = 2
+BACKOFF = 0.3  # 초 — 재시도마다 2배
 
+_client: httpx.Client | None = None
+_async_client: httpx.AsyncClient | None = None
+_async_loop: asyncio.AbstractEventLoop | None = None
 
-def fetch_chatChannelId(streamer: str, cookies: dict) -> str:
-    url = f'https://api.chzzk.naver.com/polling/v2/channels/{streamer}/live-status'
-    response = requests.get(url, cookies=cookies, headers=HEADERS)
-    response.raise_for_status()
-    data = response.json()
+
+# ── URL / 응답 파싱 (동기·비동기 공용) ──
+
+def _live_status_url(streamer: str) -> str:
+    return f'https://api.chzzk.naver.com/polling/v2/channels/{streamer}/live-status'
+
+
+def _channel_url(streamer: str) -> str:
+    return f'https://api.chzzk.naver.com/service/v1/channels/{streamer}'
+
+
+def _access_token_url(chatChannelId: str) -> str:
+    return f'https://comm-api.game.naver.com/nng_main/v1/chats/access-token?channelId={chatChannelId}&chatType=STREAMING'
+
+
+def _parse_chatChannelId(data: dict) -> str:
     chat_channel_id = data['content']['chatChannelId']
     if chat_channel_id is None:
         raise ValueError('chatChannelId가 없습니다 (방송이 꺼져 있을 수 있음)')
     return chat_channel_id
 
 
-def fetch_channelName(streamer: str) -> str:
-    url = f'https://api.chzzk.naver.com/service/v1/channels/{streamer}'
-    response = requests.get(url, headers=HEADERS)
-    response.raise_for_status()
-    data = response.json()
+def _parse_channelName(data: dict) -> str:
     return data['content']['channelName']
 
 
-def fetch_accessToken(chatChannelId: str, cookies: dict) -> tuple[str, str]:
-    url = f'https://comm-api.game.naver.com/nng_main/v1/chats/access-token?channelId={chatChannelId}&chatType=STREAMING'
-    response = requests.get(url, cookies=cookies, headers=HEADERS)
-    response.raise_for_status()
-    data = response.json()
+def _parse_accessToken(data: dict) -> tuple[str, str]:
     return data['content']['accessToken'], data['content']['extraToken']
 
 
-def fetch_userIdHash(cookies: dict) -> str:
-    url = 'https://comm-api.game.naver.com/nng_main/v1/user/getUserStatus'
-    response = requests.get(url, cookies=cookies, headers=HEADERS)
-    response.raise_for_status()
-    data = response.json()
+def _parse_userIdHash(data: dict) -> str:
     return data['content']['userIdHash']
+
+
+# ── 요청 + 재시도 ──
+
+def _headers(cookies: dict | None) -> dict:
+    if not cookies:
+        return HEADERS
+    return dict(HEADERS, Cookie='; '.join(f'{k}={v}' for k, v in cookies.items()))
+
+
+def _is_retryable(response: httpx.Response) -> bool:
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def _backoff(attempt: int) -> float:
+    return BACKOFF * (2 ** attempt)
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        _client = httpx.Client(timeout=TIMEOUT, limits=LIMITS)
+    return _client
+
+
+async def _get_async_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프용 AsyncClient (루프가 바뀌면 이전 클라이언트를 닫고 새로 생성 — 연결은 루프에 묶임)"""
+    global _async_client, _async_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is not None and _async_loop is not loop:
+        old_client, old_loop = _async_client, _async_loop
+        _async_client = _async_loop = None
+        await _close_on_loop(old_client, old_loop)
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(timeout=TIMEOUT, limits=LIMITS)
+        _async_loop = loop
+    return _async_client
+
+
+async def _close_on_loop(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop):
+    """다른 루프에 묶인 클라이언트 종료 — 그 루프가 돌고 있으면 그 루프에서, 아니면 여기서 (실패는 무시)"""
+    try:
+        if loop.is_running() and not loop.is_closed():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+        else:
+            await client.aclose()
+    except Exception:
+        logger.debug('이전 AsyncClient 종료 실패', exc_info=True)
+
+
+def _get_json(url: str, cookies: dict | None = None) -> dict:
+    client = _get_client()
+    for attempt in range(RETRIES + 1):
+        try:
+            response = client.get(url, headers=_headers(cookies))
+        except httpx.TransportError:
+            if attempt == RETRIES:
+                raise
+        else:
+            if not _is_retryable(response) or attempt == RETRIES:
+                response.raise_for_status()
+                return response.json()
+        time.sleep(_backoff(attempt))
+
+
+async def _get_json_async(url: str, cookies: dict | None = None) -> dict:
+    client = await _get_async_client()
+    for attempt in range(RETRIES + 1):
+        try:
+            response = await client.get(url, headers=_headers(cookies))
+        except httpx.TransportError:
+            if attempt == RETRIES:
+                raise
+        else:
+            if not _is_retryable(response) or attempt == RETRIES:
+                response.raise_for_status()
+                return response.json()
+        await asyncio.sleep(_backoff(attempt))
+
+
+async def aclose():
+    """공용 AsyncClient 연결 종료 (앱 종료 시)"""
+    global _async_client, _async_loop
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = _async_loop = None
+
+
+# ── async API ──
+
+async def fetch_chatChannelId_async(streamer: str, cookies: dict) -> str:
+    return _parse_chatChannelId(await _get_json_async(_live_status_url(streamer), cookies))
+
+
+async def fetch_channelName_async(streamer: str) -> str:
+    return _parse_channelName(await _get_json_async(_channel_url(streamer)))
+
+
+async def fetch_accessToken_async(chatChannelId: str, cookies: dict) -> tuple[str, str]:
+    return _parse_accessToken(await _get_json_async(_access_token_url(chatChannelId), cookies))
+
+
+async def fetch_userIdHash_async(cookies: dict) -> str:
+    return _parse_userIdHash(await _get_json_async(USER_STATUS_URL, cookies))
+
+
+# ── 동기 래퍼 ──
+
+def fetch_chatChannelId(streamer: str, cookies: dict) -> str:
+    return _parse_chatChannelId(_get_json(_live_status_url(streamer), cookies))
+
+
+def fetch_channelName(streamer: str) -> str:
+    return _parse_channelName(_get_json(_channel_url(streamer)))
+
+
+def fetch_accessToken(chatChannelId: str, cookies: dict) -> tuple[str, str]:
+    return _parse_accessToken(_get_json(_access_token_url(chatChannelId), cookies))
+
+
+def fetch_userIdHash(cookies: dict) -> str:
+    return _parse_userIdHash(_get_json(USER_STATUS_URL, cookies))
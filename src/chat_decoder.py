@@ -0,0 +1,261 @@
+"""채팅 프레임 디코더
+
+채팅 1건마다 바깥 프레임 / profile 문자열 / extras 문자열을 각각 JSON 파싱해야 한다.
+빠른 JSON 라이브러리가 설치되어 있으면 그것을 쓰고, 없으면 표준 json으로 동작한다.
+
+백엔드 우선순위 (get_decoder()가 자동 선택):
+    msgspec  profile/extras를 필요한 필드만 가진 Struct로 바로 디코드 (나머지 필드는 건너뜀)
+    orjson   dict로 디코드 (표준 json보다 수 배 빠름)
+    json     표준 라이브러리 (의존성 없음)
+
+wants_bytes: orjson/msgspec은 bytes를 그대로 받는 편이 빨라 ws.recv(decode=False)로 UTF-8 변환을
+건너뛴다. 표준 json은 str 파싱이 더 빠르므로(bytes면 내부에서 인코딩 감지 + 디코드) str로 받는다.
+"""
+
+import json
+import logging
+import sys
+from collections import OrderedDict
+from typing import NamedTuple
+
+try:
+    import msgspec
+except ImportError:  # 선택 의존성
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileFields(NamedTuple):
+    """profile JSON에서 앱이 사용하는 필드"""
+    nickname: str
+    user_role: str | None
+    color_code: str | None
+    badges: tuple[str, ...]
+    subscription_month: int | None
+    subscription_tier: int | None
+
+
+class ExtrasFields(NamedTuple):
+    """extras JSON에서 앱이 사용하는 필드"""
+    emojis: dict
+    os_type: str | None
+
+
+def _profile_from_dict(profile_data: dict) -> ProfileFields:
+    streaming_prop = profile_data.get('streamingProperty') or {}
+    nickname_color = streaming_prop.get('nicknameColor') or {}
+    subscription = streaming_prop.get('subscription') or {}
+
+    badges = []
+    sub_badge = subscription.get('badge') or {}
+    if sub_badge.get('imageUrl'):
+        badges.append(sub_badge['imageUrl'])
+
+    for badge in profile_data.get('activityBadges') or []:
+        if badge.get('imageUrl') and badge.get('activated'):
+            badges.append(badge['imageUrl'])
+
+    return ProfileFields(
+        nickname=profile_data['nickname'],
+        user_role=profile_data.get('userRoleCode'),
+        color_code=nickname_color.get('colorCode'),
+        badges=tuple(badges),
+        subscription_month=subscription.get('accumulativeMonth'),
+        subscription_tier=subscription.get('tier'),
+    )
+
+
+def _extras_from_dict(extras: dict) -> ExtrasFields:
+    return ExtrasFields(emojis=extras.get('emojis') or {}, os_type=extras.get('osType'))
+
+
+class JsonDecoder:
+    """표준 json 백엔드"""
+    name = 'json'
+    wants_bytes = False  # 프레임을 str로 받음 (json.loads(bytes)가 더 느림)
+
+    def loads(self, data: bytes | str):
+        return json.loads(data)
+
+    def profile(self, raw: str) -> ProfileFields:
+        return _profile_from_dict(self.loads(raw))
+
+    def extras(self, raw: str) -> ExtrasFields:
+        return _extras_from_dict(self.loads(raw))
+
+
+class OrjsonDecoder(JsonDecoder):
+    """orjson 백엔드"""
+    name = 'orjson'
+    wants_bytes = True
+
+    def loads(self, data: bytes | str):
+        return orjson.loads(data)
+
+
+if msgspec is not None:
+    class _Badge(msgspec.Struct):
+        imageUrl: str | None = None
+        activated: bool = False
+
+    class _NicknameColor(msgspec.Struct):
+        colorCode: str | None = None
+
+    class _Subscription(msgspec.Struct):
+        accumulativeMonth: int | None = None
+        tier: int | None = None
+        badge: _Badge | None = None
+
+    class _StreamingProperty(msgspec.Struct):
+        nicknameColor: _NicknameColor | None = None
+        subscription: _Subscription | None = None
+
+    class _Profile(msgspec.Struct):
+        nickname: str
+        userRoleCode: str | None = None
+        streamingProperty: _StreamingProperty | None = None
+        activityBadges: list[_Badge] | None = None
+
+    class _Extras(msgspec.Struct):
+        emojis: dict[str, str] | None = None
+        osType: str | None = None
+
+
+class MsgspecDecoder(JsonDecoder):
+    """msgspec 백엔드 — profile/extras는 필요한 필드만 Struct로 디코드"""
+    name = 'msgspec'
+    wants_bytes = True
+
+    def __init__(self):
+        self._loads = msgspec.json.Decoder().decode
+        self._profile = msgspec.json.Decoder(_Profile).decode
+        self._extras = msgspec.json.Decoder(_Extras).decode
+
+    def loads(self, data: bytes | str):
+        return self._loads(data)
+
+    def profile(self, raw: str) -> ProfileFields:
+        try:
+            p = self._profile(raw)
+        except msgspec.ValidationError:
+            # 스키마와 타입이 다른 필드가 섞여 오면 dict 경로로 한 번 더 시도
+            return _profile_from_dict(self._loads(raw))
+
+        streaming_prop = p.streamingProperty
+        color_code = subscription = None
+        if streaming_prop is not None:
+            if streaming_prop.nicknameColor is not None:
+                color_code = streaming_prop.nicknameColor.colorCode
+            subscription = streaming_prop.subscription
+
+        badges = []
+        if subscription is not None and subscription.badge is not None and subscription.badge.imageUrl:
+            badges.append(subscription.badge.imageUrl)
+        for badge in p.activityBadges or ():
+            if badge.imageUrl and badge.activated:
+                badges.append(badge.imageUrl)
+
+        return ProfileFields(
+            nickname=p.nickname,
+            user_role=p.userRoleCode,
+            color_code=color_code,
+            badges=tuple(badges),
+            subscription_month=subscription.accumulativeMonth if subscription else None,
+            subscription_tier=subscription.tier if subscription else None,
+        )
+
+    def extras(self, raw: str) -> ExtrasFields:
+        try:
+            e = self._extras(raw)
+        except msgspec.ValidationError:
+            return _extras_from_dict(self._loads(raw))
+        return ExtrasFields(emojis=e.emojis or {}, os_type=e.osType)
+
+
+class ProfileCache:
+    """(uid, profile 원본 문자열) → ProfileFields LRU 캐시
+
+    한 방송에서 같은 시청자는 매번 바이트 단위로 동일한 profile 문자열을 보내므로
+    문자열 자체를 키로 써서 JSON 파싱과 streamingProperty/배지 순회를 건너뛴다.
+    닉네임/배지가 바뀌면 문자열도 달라지므로 새 항목으로 취급된다.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], ProfileFields] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def profile(self, uid: str, raw: str, decoder: JsonDecoder) -> ProfileFields:
+        """캐시 조회, 없으면 decoder.profile()로 파싱 후 저장 (파싱 실패는 저장하지 않음)"""
+        key = (uid, raw)
+        entries = self._entries
+        fields = entries.get(key)
+        if fields is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return fields
+
+        self.misses += 1
+        fields = decoder.profile(raw)
+        # 오래 보관되는 문자열은 intern → 같은 닉네임/배지 URL은 메모리에 한 벌만
+        fields = fields._replace(
+            nickname=sys.intern(fields.nickname),
+            badges=tuple(sys.intern(url) for url in fields.badges),
+        )
+        entries[key] = fields
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return fields
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_BACKENDS = {
+    'msgspec': (MsgspecDecoder, lambda: msgspec is not None),
+    'orjson': (OrjsonDecoder, lambda: orjson is not None),
+    'json': (JsonDecoder, lambda: True),
+}
+
+
+def available_backends() -> list[str]:
+    """설치된 백엔드 이름 (우선순위 순)"""
+    return [name for name, (_, available) in _BACKENDS.items() if available()]
+
+
+def get_decoder(name: str = '') -> JsonDecoder:
+    """이름으로 디코더 생성. 빈 문자열이면 설치된 것 중 가장 빠른 백엔드
+
+    지정한 백엔드가 설치되어 있지 않으면 경고 후 자동 선택으로 대체.
+    """
+    if name:
+        if name not in _BACKENDS:
+            raise ValueError(f'알 수 없는 디코더: {name}')
+        cls, available = _BACKENDS[name]
+        if available():
+            return cls()
+        logger.warning('%s 미설치 — 기본 디코더 사용', name)
+    cls, _ = _BACKENDS[available_backends()[0]]
+    return cls()
@@ -0,0 +1,193 @@
+"""후원만 보기 / 검색 필터 엔진
+
+메시지가 들어올 때 검색 키(닉네임 + 메시지, casefold)를 한 번만 만들어 n-gram 역색인
+(search_index.NgramIndex)에 넣고, 후원 메시지 seq는 별도 목록으로 관리한다.
+필터가 바뀌면 아래 후보 중 가장 작은 것만 키 포함 검사해 통과 seq 목록을 다시 만든다.
+
+- 좁히는 변경(검색어에 글자 추가, 후원만 보기 켜기): 직전 통과 목록
+- 검색어가 2글자 이상: 검색어 n-gram 중 가장 짧은 posting
+- 후원만 보기: 후원 목록
+- 후보가 없으면(1글자 검색어): 버퍼 전체 (문자열 포함 검사만 — lower() 호출 없음)
+
+ChatViewport의 index로 넘기면 viewport가 seqs()를 이분 탐색해 화면 구간을 채운다.
+"""
+
+import time
+from bisect import bisect_left, bisect_right
+
+from chat_message import ChatMessage
+from perf_stats import LatencyStats
+from search_index import NgramIndex
+
+
+def search_key(chat_data: ChatMessage) -> str:
+    return f"{chat_data.nickname}\x00{chat_data.message}".casefold()
+
+
+class ChatFilter:
+    def __init__(self, capacity: int = 100_000):
+        self.capacity = capacity
+        self._keys: list[str] = []          # 검색 키 — _keys[seq - _base] (viewport 버퍼와 같은 seq)
+        self._base = 0                      # _keys[0]의 seq
+        self.first_seq = 0                  # 버퍼에 남은 가장 오래된 seq
+        self._donations: list[int] = []     # 후원 메시지 seq (오름차순)
+        self._index = NgramIndex()
+        self._matches: list[int] | None = None  # 현재 필터 통과 seq, 필터 없으면 None
+        self.donation_only = False
+        self.query = ""                     # casefold된 검색어
+        self.narrowed = 0                   # 직전 통과 목록만 검사한 갱신 횟수
+        self.indexed = 0                    # 역색인 posting만 검사한 갱신 횟수
+        self.donation_scans = 0             # 후원 목록만 검사한 갱신 횟수
+        self.full_scans = 0                 # 버퍼 전체를 검사한 갱신 횟수
+        self.scanned = 0                    # 직전 갱신에서 검사한 메시지 수
+        self.update_stats = LatencyStats(max_samples=1000)
+
+    def __len__(self):
+        return len(self._keys) - (self.first_seq - self._base)
+
+    @property
+    def active(self) -> bool:
+        return self.donation_only or bool(self.query)
+
+    def add(self, seq: int, chat_data: ChatMessage) -> bool:
+        """새 메시지 등록. 반환: 현재 필터 통과 여부"""
+        if not self._keys:
+            self._base = self.first_seq = seq
+        key = search_key(chat_data)
+        self._keys.append(key)
+        self._index.add(seq, key)
+        if len(self) > self.capacity:
+            self.first_seq += 1
+            self._compact()
+        is_donation = chat_data.is_donation
+        if is_donation:
+            self._donations.append(seq)
+        if self._matches is None:
+            return True
+        if (is_donation or not self.donation_only) and self.query in key:
+            self._matches.append(seq)
+            return True
+        return False
+
+    def seqs(self) -> list[int] | None:
+        return self._matches
+
+    def step_match(self, seq: int | None, step: int) -> int | None:
+        """검색 결과 이동: seq 다음(step>0) / 이전(step<0) 통과 seq, 끝에서는 반대쪽으로 순환
+
+        seq가 None이면 가장 최근 결과. 필터가 없거나 결과가 없으면 None.
+        """
+        matches = self._matches
+        if not matches:
+            return None
+        lo = bisect_left(matches, self.first_seq)
+        if lo == len(matches):
+            return None
+        if seq is None:
+            return matches[-1]
+        if step > 0:
+            i = max(bisect_right(matches, seq), lo)  # seq가 이미 축출됐으면 남은 가장 오래된 결과부터
+            return matches[i if i < len(matches) else lo]
+        i = bisect_left(matches, seq) - 1
+        return matches[i if i >= lo else -1]
+
+    def match_position(self, seq: int) -> tuple[int, int]:
+        """(seq가 통과 목록에서 몇 번째인지 1부터, 전체 개수)"""
+        matches = self._matches or []
+        lo = bisect_left(matches, self.first_seq)
+        return bisect_left(matches, seq) - lo + 1, len(matches) - lo
+
+    def set(self, donation_only: bool, query: str) -> bool:
+        """필터 변경. 반환: 통과 목록이 바뀌었는지 (같은 조건이면 False)"""
+        query = query.casefold()
+        if donation_only == self.donation_only and query == self.query:
+            return False
+
+        start = time.perf_counter()
+        previous = self._matches
+        narrower = (
+            previous is not None
+            and donation_only >= self.donation_only
+            and self.query in query
+        )
+        donation_added = donation_only and not self.donation_only
+        self.donation_only = donation_only
+        self.query = query
+
+        if not self.active:
+            self._matches = None
+            self.scanned = 0
+        else:
+            # (후보 seq 목록, 후원 여부도 검사해야 하는지, 통계 항목)
+            plans = []
+            if narrower:
+                plans.append((previous, donation_added, 'narrowed'))
+            posting = self._index.candidates(query) if query else None
+            if posting is not None:
+                plans.append((posting, donation_only, 'indexed'))
+            if donation_only:
+                plans.append((self._donations, False, 'donation_scans'))
+            if plans:
+                seqs, check_donation, plan = min(plans, key=lambda p: len(p[0]))
+                self._matches = self._scan(seqs, check_donation)
+            else:
+                self._matches = self._scan_all()
+                plan = 'full_scans'
+            setattr(self, plan, getattr(self, plan) + 1)
+
+        self.update_stats.add(time.perf_counter() - start)
+        return True
+
+    def _scan(self, seqs: list[int], check_donation: bool = False) -> list[int]:
+        """seqs(오름차순) 중 검색어를 포함하는(+ 후원인) seq — 축출된 seq는 건너뜀"""
+        seqs = seqs[bisect_left(seqs, self.first_seq):]
+        self.scanned = len(seqs)
+        if check_donation:
+            donations = set(self._donations)
+            seqs = [seq for seq in seqs if seq in donations]
+        query, keys, base = self.query, self._keys, self._base
+        if not query:
+            return seqs
+        return [seq for seq in seqs if query in keys[seq - base]]
+
+    def _scan_all(self) -> list[int]:
+        offset = self.first_seq - self._base
+        self.scanned = len(self._keys) - offset
+        query, keys, base = self.query, self._keys, self._base
+        return [base + i for i in range(offset, len(keys)) if query in keys[i]]
+
+    def _compact(self):
+        """축출된 항목을 목록 앞에서 제거 (용량의 1/4만큼 쌓일 때마다 — 분할 상환 O(1))"""
+        first = self.first_seq
+        if first - self._base < max(1, self.capacity // 4):
+            return
+        del self._keys[:first - self._base]
+        self._base = first
+        del self._donations[:bisect_left(self._donations, first)]
+        self._index.compact(first)
+        if self._matches is not None:
+            del self._matches[:bisect_left(self._matches, first)]
+
+    def clear(self):
+        """등록된 메시지 비우기 (필터 조건은 유지, 다음 add()의 seq부터 다시 시작)"""
+        self._keys.clear()
+        self._base = self.first_seq  # 정리 전 축출분이 남아 있어도 len()이 음수가 되지 않게
+        self._donations.clear()
+        self._index.clear()
+        if self._matches is not None:
+            self._matches = []
+
+    def stats(self) -> dict:
+        matches = len(self) if self._matches is None else len(self._matches) - bisect_left(self._matches, self.first_seq)
+        return {
+            'donation_only': self.donation_only,
+            'query': self.query,
+            'matches': matches,
+            'scanned': self.scanned,
+            'narrowed': self.narrowed,
+            'indexed': self.indexed,
+            'donation_scans': self.donation_scans,
+            'full_scans': self.full_scans,
+            'update': self.update_stats.summary(),
+            'index': self._index.stats(),
+        }
@@ -8,7 +8,9 @@ import datetime
 import logging
 import os
 
+from chat_message import ChatMessage
 from config import LOG_DIR
+from time_format import DEFAULT_TIME_FORMAT, TimeFormatter
 
 
 class ChatLogger:
@@ -19,6 +21,7 @@ class ChatLogger:
         self._handler = None
         self._current_date = None
         self._channel_name = None
+        self._time = TimeFormatter(DEFAULT_TIME_FORMAT)  # 로그는 화면 표시 형식과 무관하게 고정
 
     def setup(self, channel_name: str):
         """채널 로거 초기화. 연결 성공 시 호출."""
@@ -44,18 +47,18 @@ class ChatLogger:
         self._logger.addHandler(self._handler)
         self._current_date = today
 
-    def log(self, chat_data: dict):
+    def log(self, chat_data: ChatMessage):
         """채팅 한 건 기록"""
         if not self._channel_name:
             return
 
         self._update_handler()
 
-        time_str = chat_data['time']
-        chat_type = chat_data['type']
-        uid = chat_data['uid']
-        nickname = chat_data['nickname']
-        message = chat_data['message']
+        time_str = self._time.format(chat_data.msg_time) if chat_data.msg_time else chat_data.time
+        chat_type = chat_data.type
+        uid = chat_data.uid
+        nickname = chat_data.nickname
+        message = chat_data.message
 
         self._logger.info('[%s][%s][%s] %s: %s', time_str, chat_type, uid, nickname, message)
 
@@ -0,0 +1,40 @@
+"""채팅 메시지 레코드
+
+ChatWorker가 만드는 메시지 1건. main.py는 이를 메시지 버퍼와 user_messages에 동시에
+보관하므로 (최대 100,000건 + 유저당 500건) 건당 크기를 줄인다.
+
+- dict 대신 __slots__ dataclass: 키 해시 테이블 없이 고정 슬롯만 사용
+- frozen: 여러 곳에서 같은 객체를 공유해도 안전
+- 배지/이모지가 없으면 공용 빈 컨테이너(EMPTY_BADGES, EMPTY_EMOJIS)를 참조
+"""
+
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
+
+EMPTY_BADGES: tuple[str, ...] = ()
+EMPTY_EMOJIS: Mapping[str, str] = MappingProxyType({})
+
+intern = sys.intern
+
+
+@dataclass(frozen=True, slots=True)
+class ChatMessage:
+    time: str                       # 표시용 'HH:MM:SS'
+    type: str                       # '채팅' / '후원'
+    uid: str
+    nickname: str
+    message: str
+    color_code: str | None = None
+    badges: tuple[str, ...] = EMPTY_BADGES
+    emojis: Mapping[str, str] = field(default_factory=lambda: EMPTY_EMOJIS)  # 공용 빈 매핑 공유
+    subscription_month: int | None = None
+    subscription_tier: int | None = None
+    os_type: str | None = None
+    user_role: str | None = None
+    msg_time: int = 0               # 원본 msgTime (epoch ms) — 정렬/지연 계산용
+
+    @property
+    def is_donation(self) -> bool:
+        return self.type == '후원'
@@ -0,0 +1,106 @@
+"""수신 → 렌더링 사이의 bounded 메시지 큐
+
+ChatWorker의 수신 태스크(ws.recv + 디코드 + pong)는 메시지를 큐에 넣기만 하고,
+렌더링 태스크가 큐에서 꺼내 UI 콜백을 호출한다. UI가 느려도 수신 루프(pong 응답)는
+막히지 않는다.
+
+큐가 가득 찼을 때 정책:
+    block        빈 자리가 날 때까지 수신 태스크가 대기 (메시지 유실 없음, pong 지연 가능)
+    drop_oldest  가장 오래된 메시지를 버림 (화면에서만 빠지고 on_drop으로는 전달됨)
+    summarize    drop_oldest와 같지만 버린 건수를 렌더링 쪽에 넘겨 "N건 생략" 줄로 표시
+
+close(): 워커 종료 시 호출. block 정책에서 대기 중인 put도 깨어나 바로 반환하고,
+이후 put으로 들어온 메시지는 on_drop으로 넘긴다. 남은 메시지는 drain()으로 꺼낸다.
+"""
+
+import asyncio
+from collections import deque
+
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'summarize')
+
+
+class ChatQueue:
+    def __init__(self, maxsize: int = 2000, policy: str = 'summarize', on_drop=None):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f'알 수 없는 overflow 정책: {policy}')
+        if maxsize <= 0:
+            raise ValueError('maxsize는 1 이상이어야 합니다')
+        self.maxsize = maxsize
+        self.policy = policy
+        self.on_drop = on_drop  # 버려진 메시지 list를 받는 동기 콜백 (로그 기록 등)
+        self._items = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._skipped = 0  # summarize: 아직 렌더링 쪽에 알리지 않은 생략 건수
+        self.dropped = 0
+        self.max_depth = 0
+        self.closed = False
+
+    def __len__(self):
+        return len(self._items)
+
+    async def put(self, messages: list):
+        dropped = []
+        for i, message in enumerate(messages):
+            if len(self._items) >= self.maxsize and not self.closed:
+                if self.policy == 'block':
+                    while len(self._items) >= self.maxsize and not self.closed:
+                        self._not_full.clear()
+                        self._not_empty.set()
+                        await self._not_full.wait()
+                else:
+                    dropped.append(self._items.popleft())
+            if self.closed:  # 닫힌 뒤에는 쌓지 않음
+                dropped.extend(messages[i:])
+                break
+            self._items.append(message)
+
+        if dropped:
+            self.dropped += len(dropped)
+            if self.policy == 'summarize':
+                self._skipped += len(dropped)
+            if self.on_drop:
+                self.on_drop(dropped)
+
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._not_empty.set()
+
+    async def get_batch(self, max_items: int = 500, window: float = 0.0) -> tuple[int, list]:
+        """최소 1건이 들어올 때까지 대기 후 (생략 건수, 메시지 list) 반환
+
+        window > 0이면 첫 메시지 이후 그 시간만큼 더 모은 뒤 꺼낸다.
+        """
+        while not self._items and not self._skipped:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        if window > 0 and len(self._items) < max_items:
+            await asyncio.sleep(window)
+
+        count = min(max_items, len(self._items))
+        batch = [self._items.popleft() for _ in range(count)]
+        skipped, self._skipped = self._skipped, 0
+        self._not_full.set()
+        return skipped, batch
+
+    def close(self):
+        """block 정책으로 대기 중인 put을 깨우고 이후 put은 쌓지 않음"""
+        self.closed = True
+        self._not_full.set()
+
+    def drain(self) -> list:
+        """남은 메시지를 모두 꺼냄 (렌더링되지 못한 메시지)"""
+        items = list(self._items)
+        self._items.clear()
+        self._skipped = 0
+        return items
+
+    def stats(self) -> dict:
+        return {
+            'depth': len(self._items),
+            'max_depth': self.max_depth,
+            'maxsize': self.maxsize,
+            'policy': self.policy,
+            'dropped': self.dropped,
+        }
@@ -0,0 +1,278 @@
+"""채팅 1줄 위젯 + 재사용 풀
+
+메시지마다 Text/Image/GestureDetector/Row/Container를 새로 만들고 화면 구간 밖으로 나가면
+버리는 대신, 미리 모양을 갖춘 ChatRow를 풀에 돌려놓고 새 메시지를 bind()로 다시 써넣는다.
+채팅이 계속 몰릴 때 컨트롤 생성과 GC 부담이 화면 row 수(VIEWPORT_ROWS) 수준으로 고정된다.
+
+글자 크기는 row마다 지정하지 않고 chat_theme()로 만든 공용 테마(목록을 감싼 Container.theme)에서
+상속받는다 — 크기를 바꿀 때 row 수와 무관하게 테마 1개만 전송된다.
+
+배지/이모지는 image_loader.ImageLoader.get()으로 조회만 하고 기다리지 않는다. 아직 받는 중인
+이미지는 같은 크기의 빈 자리표시자로 두었다가 patch_image()로 src만 바꿔 끼운다.
+"""
+
+import re
+
+import flet as ft
+
+from chat_message import ChatMessage
+from image_loader import PENDING
+
+EMOJI_PATTERN = re.compile(r"\{:([^:]+):\}")
+MAX_BADGES = 3
+DONATION_COLOR = "#ffcc00"
+DONATION_BGCOLOR = ft.Colors.with_opacity(0.15, DONATION_COLOR)
+DONATION_PADDING = ft.Padding(left=4, right=4, top=2, bottom=2)
+BADGE_SIZE = 18
+EMOJI_SIZE = 20
+SEARCH_CURRENT_BORDER = ft.Border.all(1, "#ffff00")  # 검색 결과 이동 중 현재 위치
+CHAT_TEXT_STYLE = ft.TextThemeStyle.BODY_MEDIUM  # 채팅 텍스트가 상속받는 테마 스타일
+
+
+def chat_theme(font_size: int) -> ft.Theme:
+    """채팅 목록 Container.theme — 모든 채팅 텍스트의 글자 크기"""
+    return ft.Theme(text_theme=ft.TextTheme(body_medium=ft.TextStyle(size=font_size)))
+
+
+def message_segments(message: str, emojis) -> list[tuple[bool, str]]:
+    """이모지 메시지 → [(이모지 여부, 텍스트 또는 이모지 URL), ...]
+
+    emojis에 없는 이름은 원본 표기({:name:})를 텍스트로 남긴다.
+    첫 조각이 텍스트면 ": " 접두사를 붙인다.
+    """
+    segments = []
+    for i, part in enumerate(EMOJI_PATTERN.split(message)):
+        if i % 2 == 0:  # 짝수: 텍스트, 홀수: 이모지 이름
+            if part:
+                segments.append((False, part))
+        elif part in emojis:
+            segments.append((True, emojis[part]))
+        else:
+            segments.append((False, f"{{:{part}:}}"))
+
+    if segments and not segments[0][0] and not segments[0][1].startswith(": "):
+        segments[0] = (False, f": {segments[0][1]}")
+    return segments
+
+
+class SegmentCache:
+    """(메시지, 이모지 매핑) → message_segments() 결과 캐시 (LRU, 최대 maxsize개)
+
+    이모지 도배({:d_94:}{:d_94:}...)는 같은 메시지+매핑이 반복되므로 split/매핑 조회/접두사
+    처리를 한 번만 한다. 결과는 여러 row가 공유하는 tuple (읽기 전용).
+    매핑 지문은 items() tuple — 같은 도배는 서버가 같은 순서로 보내므로 그대로 일치한다.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._cache: dict[tuple, tuple[tuple[bool, str], ...]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, message: str, emojis) -> tuple[tuple[bool, str], ...]:
+        key = (message, tuple(emojis.items()))
+        cache = self._cache
+        segments = cache.pop(key, None)
+        if segments is None:
+            self.misses += 1
+            segments = tuple(message_segments(message, emojis))
+            if len(cache) >= self.maxsize:
+                del cache[next(iter(cache))]  # 가장 오래 안 쓰인 항목
+        else:
+            self.hits += 1
+        cache[key] = segments  # 맨 뒤로 (최근 사용)
+        return segments
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'size': len(self._cache),
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+
+def _resolve_as_path(url: str) -> str:
+    return url
+
+
+def _placeholder_image(size: int) -> ft.Image:
+    """src가 비어 있는 동안(받는 중/실패) 같은 크기의 빈 칸으로 보이는 Image"""
+    return ft.Image(src=PENDING, width=size, height=size,
+                    error_content=ft.Container(width=size, height=size))
+
+
+class ChatRow:
+    """채팅 1줄 컨트롤 묶음 — control(ft.Container)을 chat_list에 넣고, control.data는 자신
+
+    resolve_badge / resolve_emoji(url): 경로 | PENDING(받는 중) | None(실패), 기본은 url을 그대로 경로로 사용
+    """
+
+    def __init__(self, on_nick_tap, resolve_badge=None, resolve_emoji=None):
+        self.on_nick_tap = on_nick_tap  # (uid, nickname) → 유저 기록 다이얼로그
+        self.resolve_badge = resolve_badge or _resolve_as_path
+        self.resolve_emoji = resolve_emoji or _resolve_as_path
+        self.seq = None
+        self.uid = None
+        self.nickname = None
+        self.time_text = ft.Text(color=ft.Colors.GREY_500, selectable=True, no_wrap=True,
+                                 theme_style=CHAT_TEXT_STYLE)
+        self.badges = [_placeholder_image(BADGE_SIZE) for _ in range(MAX_BADGES)]
+        self.badge_count = 0
+        self.nick_text = ft.Text(weight=ft.FontWeight.BOLD, no_wrap=True, theme_style=CHAT_TEXT_STYLE)
+        self.nick = ft.GestureDetector(
+            content=self.nick_text,
+            on_tap=self._on_nick_tap,
+            mouse_cursor=ft.MouseCursor.CLICK,
+        )
+        self.message_text = ft.Text(color=ft.Colors.WHITE, selectable=True, expand=True,
+                                    theme_style=CHAT_TEXT_STYLE)
+        self.count_text = ft.Text(color=ft.Colors.AMBER_300, weight=ft.FontWeight.BOLD, no_wrap=True,
+                                  theme_style=CHAT_TEXT_STYLE)
+        self.count = 1  # 도배 합치기로 합쳐진 메시지 수
+        self._segment_texts: list[ft.Text] = []    # 이모지 메시지용 조각 (재사용)
+        self._segment_images: list[ft.Image] = []
+        self.message_texts: list[ft.Text] = []     # 현재 메시지의 텍스트 컨트롤
+        self._waiting: list[tuple[ft.Image, str]] = []  # 받는 중인 이미지 자리 (컨트롤, URL)
+        self.row = ft.Row(spacing=0, vertical_alignment=ft.CrossAxisAlignment.START)
+        self.control = ft.Container(content=self.row, data=self)
+
+    def _on_nick_tap(self, e):
+        self.on_nick_tap(self.uid, self.nickname)
+
+    @property
+    def active_badges(self) -> list[ft.Image]:
+        return self.badges[:self.badge_count]
+
+    def _segment_text(self, index: int) -> ft.Text:
+        if index == len(self._segment_texts):
+            self._segment_texts.append(ft.Text(color=ft.Colors.WHITE, selectable=True,
+                                               theme_style=CHAT_TEXT_STYLE))
+        return self._segment_texts[index]
+
+    def _segment_image(self, index: int) -> ft.Image:
+        if index == len(self._segment_images):
+            self._segment_images.append(_placeholder_image(EMOJI_SIZE))
+        return self._segment_images[index]
+
+    def _set_image(self, image: ft.Image, url: str, path: str | None):
+        image.src = path or PENDING
+        if path == PENDING:
+            self._waiting.append((image, url))
+
+    def patch_image(self, url: str, path: str) -> bool:
+        """받기가 끝난 이미지를 자리표시자에 끼움. 반환: 이 row에 해당 이미지가 있었는지"""
+        patched = False
+        for image, waiting_url in self._waiting:
+            if waiting_url == url:
+                image.src = path
+                patched = True
+        if patched:
+            self._waiting = [(image, u) for image, u in self._waiting if u != url]
+        return patched
+
+    def bind(self, seq: int, chat_data: ChatMessage, nick_color: str, badge_urls,
+             segments, show_timestamp: bool, show_badges: bool):
+        """메시지 1건을 써넣음
+
+        badge_urls: 배지 이미지 URL (최대 MAX_BADGES개, 받기 실패한 것은 건너뜀)
+        segments: message_segments() / SegmentCache.get() 결과, 이모지 없는 메시지면 None
+        """
+        is_donation = chat_data.is_donation
+        self._waiting = []
+        self.count = 1
+        self.seq = seq
+        self.uid = chat_data.uid
+        self.nickname = chat_data.nickname
+
+        self.time_text.value = f"[{chat_data.time}] "
+        self.time_text.visible = show_timestamp
+        controls = [self.time_text]
+
+        self.badge_count = 0
+        for url in badge_urls:
+            path = self.resolve_badge(url)
+            if path is None:
+                continue
+            image = self.badges[self.badge_count]
+            self.badge_count += 1
+            self._set_image(image, url, path)
+            image.visible = show_badges
+            controls.append(image)
+
+        prefix = "[후원] " if is_donation else ""
+        self.nick_text.value = f"{prefix}{chat_data.nickname}"
+        self.nick_text.color = nick_color
+        controls.append(self.nick)
+
+        if segments is None:
+            self.message_text.value = f": {chat_data.message}"
+            self.message_texts = [self.message_text]
+            controls.append(self.message_text)
+        else:
+            texts = images = 0
+            for is_emoji, value in segments:
+                if is_emoji:
+                    image = self._segment_image(images)
+                    images += 1
+                    self._set_image(image, value, self.resolve_emoji(value))
+                    controls.append(image)
+                else:
+                    text = self._segment_text(texts)
+                    texts += 1
+                    text.value = value
+                    controls.append(text)
+            self.message_texts = self._segment_texts[:texts]
+
+        self.row.controls = controls
+
+        container = self.control
+        if is_donation:
+            container.bgcolor = DONATION_BGCOLOR
+            container.border_radius = 4
+            container.padding = DONATION_PADDING
+        else:
+            container.bgcolor = container.border_radius = container.padding = None
+        container.border = None
+        container.key = ft.ScrollKey(seq)
+
+    def set_count(self, count: int):
+        """도배 합치기 카운터 "×N" 표시 (bind() 후 호출)"""
+        if self.count == 1:
+            self.row.controls.append(self.count_text)
+        self.count = count
+        self.count_text.value = f" ×{count}"
+
+    def set_current(self, current: bool):
+        """검색 결과 이동의 현재 위치 표시"""
+        self.control.border = SEARCH_CURRENT_BORDER if current else None
+
+
+class RowPool:
+    """재사용 객체 풀 — acquire()는 반납된 것을 먼저 꺼내고, 없으면 factory()로 생성"""
+
+    def __init__(self, factory, maxsize: int = 512):
+        self.factory = factory
+        self.maxsize = maxsize
+        self._free: list = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self):
+        if self._free:
+            self.reused += 1
+            return self._free.pop()
+        self.created += 1
+        return self.factory()
+
+    def release(self, obj):
+        if len(self._free) < self.maxsize:
+            self._free.append(obj)
+
+    def stats(self) -> dict:
+        total = self.created + self.reused
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'free': len(self._free),
+            'reuse_rate': self.reused / total if total else 0.0,
+        }
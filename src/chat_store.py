@@ -0,0 +1,54 @@
+"""고정 크기 링 버퍼 메시지 저장소
+
+용량에 도달한 뒤에도 추가/축출이 O(1): 가장 오래된 칸을 덮어쓰고 시작 위치만 옮긴다.
+(list.pop(0)은 매번 나머지 항목 전체를 한 칸씩 당기므로 용량에 비례)
+
+항목은 메시지마다 1씩 증가하는 seq 번호로 가리킨다 — 축출되어도 남은 항목의 seq는 그대로.
+"""
+
+
+class RingBuffer:
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError('capacity는 1 이상이어야 합니다')
+        self.capacity = capacity
+        self._items: list = [None] * capacity
+        self._start = 0     # 가장 오래된 항목의 물리 위치
+        self._len = 0
+        self.first_seq = 0  # 가장 오래된 항목의 seq
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def end_seq(self) -> int:
+        """다음에 추가될 항목의 seq"""
+        return self.first_seq + self._len
+
+    def append(self, item) -> bool:
+        """추가. 반환: 가장 오래된 항목을 축출했는지"""
+        if self._len < self.capacity:
+            self._items[(self._start + self._len) % self.capacity] = item
+            self._len += 1
+            return False
+        self._items[self._start] = item
+        self._start = (self._start + 1) % self.capacity
+        self.first_seq += 1
+        return True
+
+    def get(self, seq: int):
+        offset = seq - self.first_seq
+        if not 0 <= offset < self._len:
+            raise IndexError(f'seq {seq} 범위 밖 ({self.first_seq}~{self.end_seq - 1})')
+        return self._items[(self._start + offset) % self.capacity]
+
+    def __iter__(self):
+        for offset in range(self._len):
+            yield self._items[(self._start + offset) % self.capacity]
+
+    def clear(self):
+        """비우기 (seq는 이어서 증가)"""
+        self.first_seq = self.end_seq
+        self._items = [None] * self.capacity
+        self._start = 0
+        self._len = 0
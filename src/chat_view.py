@@ -0,0 +1,226 @@
+"""가상화 채팅 목록
+
+전체 메시지는 링 버퍼(chat_store.RingBuffer)에만 두고, Flet 컨트롤은 화면 근처 구간
+(최대 window개)만 만든다. page.update()가 diff/직렬화하는 트리 크기가 기록 길이와
+무관하게 일정해진다.
+
+- 맨 아래를 따라가는 중(following): 새 메시지는 row로 추가되고 위쪽 row는 버림
+- 위로 스크롤해 읽는 중: 새 메시지는 버퍼에만 쌓이고 화면 구간은 고정
+- 구간 위/아래 끝에 닿으면 load_older()/load_newer()가 page_size개씩 구간을 옮김
+
+메시지마다 증가하는 seq 번호로 항목을 가리킨다 (row의 ScrollKey로도 사용).
+
+필터는 index 객체(chat_filter.ChatFilter)가 담당한다:
+    index.add(seq, entry) -> bool   새 항목 등록 + 현재 필터 통과 여부
+    index.seqs() -> list | None     필터를 통과한 seq 오름차순 목록 (None이면 전체)
+    index.clear()
+"""
+
+from bisect import bisect_left
+from collections import deque
+
+from chat_store import RingBuffer
+
+
+class ChatViewport:
+    """메시지 버퍼 + 화면에 올린 row 구간 관리
+
+    controls: row를 넣을 리스트 (ListView.controls를 그대로 넘김)
+    build_row(seq, entry): 항목 1개 → row 컨트롤
+    release_row(control): 화면에서 빠진 row (재사용 풀로 반납)
+    """
+
+    def __init__(self, controls: list, build_row, capacity: int = 100_000,
+                 window: int = 150, page_size: int = 50, release_row=None, index=None):
+        self.controls = controls
+        self.build_row = build_row
+        self.release_row = release_row
+        self.index = index
+        self.capacity = capacity
+        self.window = window
+        self.page_size = page_size
+        self.entries = RingBuffer(capacity)
+        self._row_seqs: deque[int] = deque()  # controls와 같은 순서의 seq
+        self.lo = 0                   # 구체화 범위 [lo, hi) — 이 범위의 필터 통과 항목이 controls에 있음
+        self.hi = 0
+        self.following = True
+        self.last_delta = (0, 0)      # 직전 refresh()/show_around()에서 (새로 만든 row, 내린 row) 수
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def first_seq(self) -> int:
+        return self.entries.first_seq
+
+    @property
+    def end_seq(self) -> int:
+        return self.entries.end_seq
+
+    def get(self, seq: int):
+        return self.entries.get(seq)
+
+    @property
+    def row_count(self) -> int:
+        return len(self._row_seqs)
+
+    def first_row_seq(self) -> int | None:
+        return self._row_seqs[0] if self._row_seqs else None
+
+    def last_row_seq(self) -> int | None:
+        return self._row_seqs[-1] if self._row_seqs else None
+
+    def control_for(self, seq: int):
+        """화면 구간에 있는 seq의 row 컨트롤 (최근 row부터 찾음), 없으면 None"""
+        for row_seq, control in zip(reversed(self._row_seqs), reversed(self.controls)):
+            if row_seq == seq:
+                return control
+            if row_seq < seq:
+                break
+        return None
+
+    def has_older(self) -> bool:
+        return bool(self._seqs_before(self.lo, 1))
+
+    # ── 필터 통과 seq 조회 ──
+
+    def _seqs_before(self, seq: int, count: int) -> list[int]:
+        """seq 이전(버퍼에 남은 것)의 필터 통과 seq를 최대 count개, 오름차순"""
+        seqs = self.index.seqs() if self.index is not None else None
+        if seqs is None:
+            return list(range(max(self.first_seq, seq - count), seq))
+        end = bisect_left(seqs, seq)
+        start = max(bisect_left(seqs, self.first_seq), end - count)
+        return seqs[start:end]
+
+    def _seqs_from(self, seq: int, count: int) -> list[int]:
+        """seq 이후(포함)의 필터 통과 seq를 최대 count개, 오름차순"""
+        seq = max(seq, self.first_seq)
+        seqs = self.index.seqs() if self.index is not None else None
+        if seqs is None:
+            return list(range(seq, min(self.end_seq, seq + count)))
+        start = bisect_left(seqs, seq)
+        return seqs[start:start + count]
+
+    # ── 버퍼 ──
+
+    def append(self, entry) -> bool:
+        """새 메시지 추가. 반환: row를 화면에 추가했는지"""
+        seq = self.end_seq
+        matched = self.index.add(seq, entry) if self.index is not None else True
+        if self.entries.append(entry):
+            self._on_evicted()
+
+        if not self.following:
+            return False
+        self.hi = seq + 1
+        if not matched:
+            return False
+        self._push_tail(seq, entry)
+        self._trim_head()
+        return True
+
+    def _on_evicted(self):
+        while self._row_seqs and self._row_seqs[0] < self.first_seq:
+            self._drop_head()
+        self.lo = max(self.lo, self.first_seq)
+        self.hi = max(self.hi, self.first_seq)
+
+    def clear(self):
+        """버퍼와 화면 비우기 (seq는 이어서 증가 — 이전 ScrollKey와 겹치지 않게)"""
+        self.entries.clear()
+        if self.index is not None:
+            self.index.clear()
+        self._release_all()
+        self.lo = self.hi = self.first_seq
+        self.following = True
+
+    # ── 화면 구간 ──
+
+    def refresh(self):
+        """필터 변경 후: 필터 통과 항목 중 최신 window개로 구간 재구성 (맨 아래로 이동)
+
+        이미 화면에 있던 row는 그대로 두고, 새로 보여야 할 row만 만들고 빠질 row만 반납한다.
+        """
+        self._materialize(self._seqs_before(self.end_seq, self.window))
+
+    def show_around(self, seq: int):
+        """seq를 가운데에 둔 구간으로 이동 (검색 결과 이동용) — seq는 필터를 통과한 항목이어야 함"""
+        newer = self._seqs_from(seq, self.window - self.window // 2)
+        older = self._seqs_before(seq, self.window - len(newer))
+        self._materialize(older + newer)
+
+    def _materialize(self, target: list[int]):
+        current = dict(zip(self._row_seqs, self.controls))
+        built = 0
+        controls = []
+        for seq in target:
+            control = current.pop(seq, None)
+            if control is None:
+                control = self.build_row(seq, self.get(seq))
+                built += 1
+            controls.append(control)
+        if self.release_row:
+            for control in current.values():
+                self.release_row(control)
+
+        self.controls[:] = controls
+        self._row_seqs = deque(target)
+        self.lo = target[0] if target else self.end_seq
+        self.hi = target[-1] + 1 if target else self.end_seq
+        self.following = not self._seqs_from(self.hi, 1)
+        if self.following:
+            self.hi = self.end_seq
+        self.last_delta = (built, len(current))
+
+    def load_older(self, count: int | None = None) -> int:
+        """구간 위쪽으로 최대 count개(기본 page_size) 추가, 넘치는 아래쪽은 버림. 반환: 추가 개수"""
+        found = self._seqs_before(self.lo, count or self.page_size)
+        if found:
+            self.lo = found[0]
+            self.controls[0:0] = [self.build_row(seq, self.get(seq)) for seq in found]
+            self._row_seqs.extendleft(reversed(found))
+            self._trim_tail()
+        return len(found)
+
+    def load_newer(self, count: int | None = None) -> int:
+        """구간 아래쪽으로 최대 count개 추가, 넘치는 위쪽은 버림. 끝까지 오면 following 복귀"""
+        found = self._seqs_from(self.hi, count or self.page_size)
+        for seq in found:
+            self._push_tail(seq, self.get(seq))
+        if found:
+            self.hi = found[-1] + 1
+        if not self._seqs_from(self.hi, 1):
+            self.hi = self.end_seq
+            self.following = True
+        self._trim_head()
+        return len(found)
+
+    def _push_tail(self, seq: int, entry):
+        self.controls.append(self.build_row(seq, entry))
+        self._row_seqs.append(seq)
+
+    def _release(self, control):
+        if self.release_row:
+            self.release_row(control)
+
+    def _release_all(self):
+        if self.release_row:
+            for control in self.controls:
+                self.release_row(control)
+        self.controls.clear()
+        self._row_seqs.clear()
+
+    def _drop_head(self):
+        self._release(self.controls.pop(0))
+        self.lo = self._row_seqs.popleft() + 1
+
+    def _trim_head(self):
+        while len(self._row_seqs) > self.window:
+            self._drop_head()
+
+    def _trim_tail(self):
+        while len(self._row_seqs) > self.window:
+            self._release(self.controls.pop())
+            self.hi = self._row_seqs.pop()
+            self.following = False
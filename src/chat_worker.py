@@ -8,21 +8,60 @@ UI가 실시간 갱신되지 않는 문제가 있다 (Flet GitHub Issue #3571, #
 page.update()가 안전하게 동작한다.
 
 - websockets (async) 라이브러리 사용 (websocket-client 동기 라이브러리 대신)
-- api.py의 동기 HTTP 호출은 asyncio.to_thread()로 감싸서 이벤트 루프 블록 방지
+- api.py의 async 함수(공용 httpx.AsyncClient, keep-alive) 사용 → 스레드 없이 이벤트 루프에서 HTTP 호출
+- 프레임 JSON 디코드는 chat_decoder.py (orjson/msgspec 설치 시 자동 사용)
 """
 
 import asyncio
+import contextlib
 import json
-import datetime
 import logging
+import random
+import time
 
 import websockets
 
 import api
+from chat_decoder import ProfileCache, ProfileFields, get_decoder
+from chat_message import EMPTY_BADGES, EMPTY_EMOJIS, ChatMessage, intern
 from cmd_type import CHZZK_CHAT_CMD
+from config import CHAT_DECODER, LIVE_POLL_INTERVAL, LIVE_POLL_JITTER
+from perf_stats import LatencyStats
+from time_format import TimeFormatter, now_ms
 
 logger = logging.getLogger(__name__)
 
+CHAT_SERVER_URL = 'wss://kr-ss1.chat.naver.com/chat'
+
+# 세션 동안 바뀌지 않는 값 — 재연결/재접속 시 다시 요청하지 않음
+_user_id_hashes: dict[tuple, str] = {}  # 쿠키 → userIdHash
+_channel_names: dict[str, str] = {}     # 스트리머 uid → 채널명
+
+
+def _cookie_key(cookies: dict) -> tuple:
+    return tuple(sorted((cookies or {}).items()))
+
+
+async def _cached(cache: dict, key, fetch, *args):
+    if key not in cache:
+        cache[key] = await fetch(*args)
+    return cache[key]
+
+
+def clear_bootstrap_cache():
+    """userIdHash/채널명 캐시 비우기 (쿠키 변경 등)"""
+    _user_id_hashes.clear()
+    _channel_names.clear()
+
+ANONYMOUS_PROFILE = ProfileFields(
+    nickname='익명의 후원자',
+    user_role=None,
+    color_code=None,
+    badges=EMPTY_BADGES,
+    subscription_month=None,
+    subscription_tier=None,
+)
+
 
 class ChatWorker:
     """WebSocket 채팅 수신을 담당하는 비동기 워커
@@ -31,13 +70,47 @@ class ChatWorker:
         worker = ChatWorker(uid, cookies, on_chat, on_status)
         page.run_task(worker.run)  # Flet 이벤트 루프에서 실행
         await worker.stop()        # 중지
+
+    on_chat_batch를 주면 메시지를 한 건씩이 아니라 프레임 단위 list로 넘긴다.
+    batch_window(초) > 0이면 첫 채팅 프레임 이후 그 시간 동안 들어온 프레임까지 모아서 한 번에 전달.
+
+    queue(ChatQueue)를 주면 수신과 렌더링을 분리한다: 수신 루프는 파싱한 메시지를 큐에 넣기만
+    하고, 별도 렌더링 태스크가 큐를 비우며 콜백을 호출한다 (UI가 느려도 pong이 밀리지 않음).
+    summarize 정책으로 생략된 건수는 on_chat_skipped(count)로 전달.
+
+    방송 상태(chatChannelId 변경)는 수신 루프와 별개인 폴링 태스크가 poll_interval마다 확인한다.
+    직전 poll_interval 동안 채팅이 계속 들어왔다면 방송 중인 것이 확실하므로 그 회차는 건너뛴다.
     """
 
-    def __init__(self, streamer, cookies, on_chat_receive_callback, on_status_callback):
+    decoder = get_decoder(CHAT_DECODER)  # 프레임/profile/extras JSON 디코더 (chat_decoder.py)
+
+    def __init__(self, streamer, cookies, on_chat_receive_callback, on_status_callback, recorder=None,
+                 on_chat_batch=None, batch_window=0.0, queue=None, on_chat_skipped=None,
+                 poll_interval=LIVE_POLL_INTERVAL, poll_jitter=LIVE_POLL_JITTER, time_formatter=None):
         self.streamer = streamer
         self.cookies = cookies
         self.on_chat_receive_callback = on_chat_receive_callback
         self.on_status_callback = on_status_callback
+        self.on_chat_batch = on_chat_batch
+        self.batch_window = batch_window
+        self._pending: list[ChatMessage] = []  # batch_window 동안 모인 메시지
+        self.queue = queue  # ChatQueue: 수신/렌더링 분리 (chat_queue.py)
+        self.on_chat_skipped = on_chat_skipped
+        self._render_task = None
+        self.poll_interval = poll_interval  # 0이면 방송 상태 폴링 안 함
+        self.poll_jitter = poll_jitter
+        self._poll_task = None
+        self._last_message_at = 0.0  # 마지막 채팅 프레임 수신 시각 (monotonic)
+        self.poll_count = 0
+        self.poll_skipped = 0
+        self.connect_count = 0
+        self.bootstrap_stats = LatencyStats()      # connect_chat() 시작 ~ 연결 완료
+        self.first_message_stats = LatencyStats()  # connect_chat() 시작 ~ 첫 채팅 프레임
+        self._connect_started = 0.0
+        self._awaiting_first_message = False
+        self.recorder = recorder  # FrameRecorder: 수신 프레임 원본 캡처 (replay.py로 재생)
+        self.profile_cache = ProfileCache()
+        self.time_formatter = time_formatter or TimeFormatter()  # msgTime → 표시 문자열 (초 단위 캐시)
         self.running = True
         self.ws = None
         self.sid = None
@@ -47,17 +120,34 @@ class ChatWorker:
     async def connect_chat(self):
         """채팅 서버에 연결
 
-        API 호출(requests 동기)은 asyncio.to_thread()로 감싸서
-        이벤트 루프를 블록하지 않도록 한다.
+        서로 의존하지 않는 요청은 동시에 보낸다:
+            chatChannelId → accessToken  (순서 의존)
+            userIdHash / channelName     (세션 동안 불변 → 쿠키/스트리머별 캐시)
+            WebSocket 연결                (토큰과 무관하므로 미리 열어 둠)
+        재연결 시에는 캐시 덕분에 chatChannelId + accessToken만 다시 요청한다.
         """
-        self.userIdHash = await asyncio.to_thread(api.fetch_userIdHash, self.cookies)
-        self.chatChannelId = await asyncio.to_thread(api.fetch_chatChannelId, self.streamer, self.cookies)
-        self.channelName = await asyncio.to_thread(api.fetch_channelName, self.streamer)
-        self.accessToken, self.extraToken = await asyncio.to_thread(api.fetch_accessToken, self.chatChannelId, self.cookies)
+        self._connect_started = time.perf_counter()
+        self._awaiting_first_message = True
+
+        # websockets.connect()는 코루틴이 아닌 awaitable 객체 → create_task 대신 ensure_future
+        ws_task = asyncio.ensure_future(websockets.connect(CHAT_SERVER_URL))
+        try:
+            (self.chatChannelId, (self.accessToken, self.extraToken)), self.userIdHash, self.channelName = (
+                await asyncio.gather(
+                    self._fetch_channel_token(),
+                    _cached(_user_id_hashes, _cookie_key(self.cookies), api.fetch_userIdHash_async, self.cookies),
+                    _cached(_channel_names, self.streamer, api.fetch_channelName_async, self.streamer),
+                )
+            )
+        except BaseException:
+            ws_task.cancel()
+            with contextlib.suppress(BaseException):
+                await (await ws_task).close()
+            raise
 
         self.on_status_callback(f'{self.channelName} 채팅창에 연결 중...')
 
-        self.ws = await websockets.connect('wss://kr-ss1.chat.naver.com/chat')
+        self.ws = await ws_task
 
         default_dict = {
             "ver": "2",
@@ -92,8 +182,15 @@ class ChatWorker:
         await self.ws.send(json.dumps(dict(send_dict, **default_dict)))
         await self.ws.recv()
 
+        self.connect_count += 1
+        self.bootstrap_stats.add(time.perf_counter() - self._connect_started)
         self.on_status_callback(f'{self.channelName} 채팅창 연결 완료')
 
+    async def _fetch_channel_token(self):
+        chat_channel_id = await api.fetch_chatChannelId_async(self.streamer, self.cookies)
+        token = await api.fetch_accessToken_async(chat_channel_id, self.cookies)
+        return chat_channel_id, token
+
     async def run(self):
         """메인 루프 — page.run_task()로 실행됨 (Flet 이벤트 루프 내)"""
         try:
@@ -102,34 +199,23 @@ class ChatWorker:
             self.on_status_callback(f'연결 실패: {str(e)}')
             return
 
+        if self.queue is not None:
+            self._render_task = asyncio.create_task(self._render_loop())
+        if self.poll_interval > 0:
+            self._poll_task = asyncio.create_task(self._live_status_loop())
+        try:
+            await self._receive_loop()
+        finally:
+            for task in (self._render_task, self._poll_task):
+                if task:
+                    task.cancel()
+
+    async def _receive_loop(self):
         while self.running:
             try:
-                raw_message = await self.ws.recv()
-                raw_message = json.loads(raw_message)
-                chat_cmd = raw_message['cmd']
-
-                if chat_cmd == CHZZK_CHAT_CMD['ping']:
-                    await self.ws.send(json.dumps({
-                        "ver": "2",
-                        "cmd": CHZZK_CHAT_CMD['pong']
-                    }))
-
-                    new_channel_id = await asyncio.to_thread(
-                        api.fetch_chatChannelId, self.streamer, self.cookies
-                    )
-                    if self.chatChannelId != new_channel_id:
-                        await self.connect_chat()
-                    continue
-
-                if chat_cmd == CHZZK_CHAT_CMD['chat']:
-                    chat_type = '채팅'
-                elif chat_cmd == CHZZK_CHAT_CMD['donation']:
-                    chat_type = '후원'
-                else:
-                    continue
-
-                for chat_data in raw_message['bdy']:
-                    await self._process_chat_data(chat_data, chat_type)
+                await self._handle_frame(await self._recv())
+                if self._pending:
+                    await self._collect_window()
 
             except websockets.ConnectionClosed:
                 if self.running:
@@ -148,74 +234,220 @@ class ChatWorker:
                         self.on_status_callback('재연결 실패')
                         break
 
-    # 인스턴트 스크롤링을 위해 await 적용
-    async def _process_chat_data(self, chat_data, chat_type):
-        """개별 채팅 데이터 처리"""
-        color_code = None
-        badges = []
-        subscription_month = None
-        subscription_tier = None
-        user_role = None
-
-        if chat_data['uid'] == 'anonymous':
-            nickname = '익명의 후원자'
-        else:
+    async def _recv(self):
+        # orjson/msgspec은 UTF-8 str 변환 없이 bytes 그대로, 표준 json은 str로 받는 편이 빠름
+        raw_message = await self.ws.recv(decode=not self.decoder.wants_bytes)
+        if self.recorder:
+            self.recorder.write(raw_message)
+        return raw_message
+
+    async def _collect_window(self):
+        """batch_window 동안 이어지는 프레임을 더 받은 뒤 모인 메시지를 한 번에 전달"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_window
+        try:
+            while self.running:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    # websockets의 recv()는 취소해도 프레임이 유실되지 않음
+                    raw_message = await asyncio.wait_for(self._recv(), remaining)
+                except TimeoutError:
+                    break
+                await self._handle_frame(raw_message)
+        finally:
+            await self._flush_batch()
+
+    async def _render_loop(self):
+        """렌더링 태스크: 큐에서 묶음을 꺼내 UI 콜백 호출 (queue 사용 시)"""
+        while True:
+            skipped, messages = await self.queue.get_batch(window=self.batch_window)
             try:
-                profile_data = json.loads(chat_data['profile'])
-                nickname = profile_data["nickname"]
-                user_role = profile_data.get('userRoleCode')
+                if skipped and self.on_chat_skipped:
+                    await self.on_chat_skipped(skipped)
+                if not messages:
+                    continue
+                if self.on_chat_batch is not None:
+                    await self.on_chat_batch(messages)
+                else:
+                    for message in messages:
+                        await self.on_chat_receive_callback(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning('채팅 렌더링 실패', exc_info=True)
 
-                streaming_prop = profile_data.get('streamingProperty', {})
-                nickname_color = streaming_prop.get('nicknameColor', {})
-                color_code = nickname_color.get('colorCode')
+    def _drain_queue(self):
+        """종료 시 큐를 닫고 렌더링되지 못한 메시지를 on_drop(없으면 로그)으로 넘김"""
+        self.queue.close()
+        remaining = self.queue.drain()
+        if not remaining:
+            return
+        if self.queue.on_drop:
+            self.queue.on_drop(remaining)
+        else:
+            logger.info('종료 시 렌더링되지 못한 메시지 %d건', len(remaining))
+
+    def _next_poll_delay(self) -> float:
+        return self.poll_interval * (1 + random.uniform(-self.poll_jitter, self.poll_jitter))
+
+    async def _live_status_loop(self):
+        """방송 상태 폴링 태스크: chatChannelId가 바뀌면 소켓을 닫아 수신 루프가 재연결하게 함"""
+        while self.running:
+            await asyncio.sleep(self._next_poll_delay())
+            await self._poll_live_status()
+
+    async def _poll_live_status(self):
+        if time.monotonic() - self._last_message_at < self.poll_interval:
+            self.poll_skipped += 1  # 채팅이 계속 들어오는 중 → 방송 중
+            return
+
+        self.poll_count += 1
+        try:
+            new_channel_id = await api.fetch_chatChannelId_async(self.streamer, self.cookies)
+        except ValueError:
+            # chatChannelId 없음 (방송 종료) → 재연결 시도에서 실패 처리
+            new_channel_id = None
+        except Exception:
+            logger.debug('방송 상태 확인 실패 — 다음 주기에 재시도', exc_info=True)
+            return
+
+        if self.running and new_channel_id != self.chatChannelId:
+            logger.info('chatChannelId 변경: %s → %s, 재연결', self.chatChannelId, new_channel_id)
+            await self._request_reconnect()
+
+    async def _request_reconnect(self):
+        """소켓을 닫으면 수신 루프의 ConnectionClosed 처리에서 connect_chat()이 호출된다"""
+        if self.ws:
+            await self.ws.close()
+
+    async def _flush_batch(self):
+        if self._pending:
+            messages, self._pending = self._pending, []
+            await self.on_chat_batch(messages)
 
-                subscription = streaming_prop.get('subscription', {})
-                subscription_month = subscription.get('accumulativeMonth')
-                subscription_tier = subscription.get('tier')
+    async def _handle_frame(self, raw_message):
+        """수신 프레임 1개 처리 (ReplayWorker도 같은 경로를 사용)"""
+        raw_message = self._decode_frame(raw_message)
+        chat_cmd = raw_message['cmd']
 
-                sub_badge = subscription.get('badge', {})
-                if sub_badge.get('imageUrl'):
-                    badges.append(sub_badge['imageUrl'])
+        if chat_cmd == CHZZK_CHAT_CMD['ping']:
+            await self._on_ping()
+            return
+
+        if chat_cmd == CHZZK_CHAT_CMD['chat']:
+            chat_type = '채팅'
+        elif chat_cmd == CHZZK_CHAT_CMD['donation']:
+            chat_type = '후원'
+        else:
+            return
+        self._last_message_at = time.monotonic()
+        if self._awaiting_first_message:
+            self._awaiting_first_message = False
+            self.first_message_stats.add(time.perf_counter() - self._connect_started)
+
+        if self.on_chat_batch is None and self.queue is None:
+            for chat_data in raw_message['bdy']:
+                await self._process_chat_data(chat_data, chat_type)
+            return
+
+        messages = []
+        for chat_data in raw_message['bdy']:
+            parsed = self._parse_chat_data(chat_data, chat_type)
+            if parsed is not None:
+                messages.append(parsed)
+        if not messages:
+            return
+        if self.queue is not None:
+            await self.queue.put(messages)
+        elif self.batch_window > 0:
+            self._pending.extend(messages)
+        else:
+            await self.on_chat_batch(messages)
 
-                for badge in profile_data.get('activityBadges', []):
-                    if badge.get('imageUrl') and badge.get('activated'):
-                        badges.append(badge['imageUrl'])
+    def _decode_frame(self, raw_message):
+        return self.decoder.loads(raw_message)
 
-                if 'msg' not in chat_data:
-                    return
+    async def _on_ping(self):
+        """서버 ping → 즉시 pong 응답 (방송 상태 확인은 _live_status_loop에서)"""
+        await self.ws.send(json.dumps({
+            "ver": "2",
+            "cmd": CHZZK_CHAT_CMD['pong']
+        }))
+
+    # 인스턴트 스크롤링을 위해 await 적용
+    async def _process_chat_data(self, chat_data, chat_type):
+        """개별 채팅 데이터 처리"""
+        parsed = self._parse_chat_data(chat_data, chat_type)
+        if parsed is not None:
+            await self.on_chat_receive_callback(parsed)
+
+    def _parse_chat_data(self, chat_data, chat_type):
+        """raw chat_data → ChatMessage. 표시할 수 없는 데이터면 None"""
+        if 'msg' not in chat_data:
+            return None
+
+        uid = intern(chat_data['uid'])
+        if uid == 'anonymous':
+            profile = ANONYMOUS_PROFILE
+        else:
+            try:
+                profile = self.profile_cache.profile(uid, chat_data['profile'], self.decoder)
             except Exception:
-                logger.debug('프로필 파싱 실패: uid=%s', chat_data.get('uid'), exc_info=True)
-                return
+                logger.debug('프로필 파싱 실패: uid=%s', uid, exc_info=True)
+                return None
 
-        msg_time = datetime.datetime.fromtimestamp(chat_data['msgTime'] / 1000)
-        msg_time_str = msg_time.strftime('%H:%M:%S')
+        msg_time = chat_data.get('msgTime') or now_ms()
 
-        emojis = {}
+        emojis = EMPTY_EMOJIS
         os_type = None
         try:
-            if 'extras' in chat_data and chat_data['extras']:
-                extras = json.loads(chat_data['extras'])
-                emojis = extras.get('emojis', {})
-                os_type = extras.get('osType')
+            if chat_data.get('extras'):
+                extras = self.decoder.extras(chat_data['extras'])
+                emojis = extras.emojis or EMPTY_EMOJIS
+                os_type = intern(extras.os_type) if extras.os_type else None
         except Exception:
             logger.debug('extras 파싱 실패', exc_info=True)
 
-        await self.on_chat_receive_callback({
-            'time': msg_time_str,
-            'type': chat_type,
-            'uid': chat_data['uid'],
-            'nickname': nickname,
-            'message': chat_data['msg'],
-            'colorCode': color_code,
-            'badges': badges,
-            'emojis': emojis,
-            'subscription_month': subscription_month,
-            'subscription_tier': subscription_tier,
-            'os_type': os_type,
-            'user_role': user_role,
-        })
+        return ChatMessage(
+            time=self.time_formatter.format(msg_time),
+            type=chat_type,
+            uid=uid,
+            nickname=profile.nickname,
+            message=chat_data['msg'],
+            color_code=profile.color_code,
+            badges=profile.badges,
+            emojis=emojis,
+            subscription_month=profile.subscription_month,
+            subscription_tier=profile.subscription_tier,
+            os_type=os_type,
+            user_role=profile.user_role,
+            msg_time=msg_time,
+        )
+
+    def stats(self) -> dict:
+        """런타임 지표 (성능 지표 다이얼로그 / 종료 로그용)"""
+        stats = {'profile_cache': self.profile_cache.stats(), 'time_format': self.time_formatter.stats()}
+        if self.queue is not None:
+            stats['queue'] = self.queue.stats()
+        stats['live_poll'] = {'polls': self.poll_count, 'skipped': self.poll_skipped}
+        stats['connect'] = {
+            'count': self.connect_count,
+            'bootstrap': self.bootstrap_stats.summary(),
+            'first_message': self.first_message_stats.summary(),
+        }
+        return stats
 
     async def stop(self):
         self.running = False
+        logger.info('워커 지표: %s', self.stats())
+        for task in (self._render_task, self._poll_task):
+            if task:
+                task.cancel()
+        if self.queue is not None:
+            self._drain_queue()
         if self.ws:
             await self.ws.close()
+        if self.recorder:
+            self.recorder.close()
@@ -14,6 +14,7 @@ CACHE_DIR = os.path.join(BASE_DIR, 'cache')
 BADGE_CACHE_DIR = os.path.join(CACHE_DIR, 'badges')
 EMOJI_CACHE_DIR = os.path.join(CACHE_DIR, 'emojis')
 LOG_DIR = os.path.join(BASE_DIR, 'log')
+CAPTURE_DIR = os.path.join(BASE_DIR, 'capture')
 SETTINGS_PATH = os.path.join(BASE_DIR, 'settings.json')
 COOKIES_PATH = os.path.join(BASE_DIR, 'cookies.json')
 ENV_PATH = os.path.join(BASE_DIR, '.env')
@@ -35,6 +36,18 @@ def _load_env():
 _env = _load_env()
 BUG_REPORT_EMAIL = _env.get('BUG_REPORT_EMAIL', '')
 
+# 채팅 JSON 디코더 백엔드: msgspec / orjson / json (비우면 자동 선택)
+CHAT_DECODER = _env.get('CHAT_DECODER', '')
+
+# 방송 상태(chatChannelId) 확인 주기(초)와 무작위 분산 비율 (0.2 = ±20%), 주기 0이면 확인 안 함
+LIVE_POLL_INTERVAL = float(_env.get('LIVE_POLL_INTERVAL', '30'))
+LIVE_POLL_JITTER = float(_env.get('LIVE_POLL_JITTER', '0.2'))
+
+# 프레임 캡처/재생 (replay.py)
+CAPTURE_FRAMES = _env.get('CAPTURE_FRAMES', '') in ('1', 'true', 'True')
+REPLAY_PATH = _env.get('REPLAY_PATH', '')
+REPLAY_SPEED = _env.get('REPLAY_SPEED', '1')
+
 # 디렉토리 생성
 os.makedirs(BADGE_CACHE_DIR, exist_ok=True)
 os.makedirs(EMOJI_CACHE_DIR, exist_ok=True)
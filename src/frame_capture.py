@@ -0,0 +1,71 @@
+"""WebSocket 원본 프레임 캡처 파일 읽기/쓰기
+
+ChatWorker가 수신한 프레임(ping, 93101 채팅, 93102 후원 등)을 가공 없이 저장해두고
+나중에 replay.py로 같은 파싱 경로를 통해 재생하기 위한 포맷.
+
+파일 포맷 (gzip 스트림):
+    MAGIC (8바이트)
+    레코드 반복: <f8 수신 시각(초, 캡처 시작 기준)> <u4 길이> <payload (UTF-8 JSON)>
+"""
+
+import gzip
+import logging
+import os
+import struct
+import time
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'CHZCAP1\n'
+_RECORD_HEADER = struct.Struct('<dI')
+
+
+class FrameRecorder:
+    """수신 프레임을 캡처 파일에 순서대로 기록"""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.frame_count = 0
+        self._file = gzip.open(path, 'wb', compresslevel=6)
+        self._file.write(MAGIC)
+        self._start = time.monotonic()
+
+    def write(self, frame: str | bytes):
+        if self._file is None:
+            return
+        if isinstance(frame, str):
+            frame = frame.encode('utf-8')
+        elapsed = time.monotonic() - self._start
+        self._file.write(_RECORD_HEADER.pack(elapsed, len(frame)))
+        self._file.write(frame)
+        self.frame_count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_frames(path: str):
+    """캡처 파일 → (수신 시각, payload bytes) 제너레이터
+
+    앱이 강제 종료되어 마지막 레코드가 잘린 파일은 온전한 레코드까지만 읽는다.
+    """
+    with gzip.open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'캡처 파일 형식이 아닙니다: {path}')
+        while True:
+            try:
+                header = f.read(_RECORD_HEADER.size)
+                if len(header) < _RECORD_HEADER.size:
+                    return
+                elapsed, length = _RECORD_HEADER.unpack(header)
+                payload = f.read(length)
+            except EOFError:
+                logger.warning('캡처 파일이 잘렸습니다: %s', path)
+                return
+            if len(payload) < length:
+                logger.warning('캡처 파일이 잘렸습니다: %s', path)
+                return
+            yield elapsed, payload
@@ -0,0 +1,315 @@
+"""배지/이모지 디스크 캐시 + manifest
+
+캐시 폴더마다 manifest.json에 URL → 파일 정보를 기록한다.
+
+    {"version": 1, "entries": {url: {"file", "size", "content_type",
+                                     "etag", "last_modified", "fetched_at", "last_access"}}}
+
+- 시작할 때 manifest를 한 번 읽어 두므로, 받아 둔 이미지 조회(lookup)는 파일 시스템을 건드리지 않는다
+- fetched_at이 revalidate_after(초)보다 오래되면 is_stale() → 백그라운드에서 조건부 요청
+  (If-None-Match / If-Modified-Since, 304면 파일 그대로 사용)
+- manifest가 없던 이전 캐시 파일은 처음 받을 때 파일이 있으면 그대로 등록 (네트워크 요청 없음)
+  → 저장 전에 종료되어 manifest에서 빠진 항목도 다음 실행에서 같은 방법으로 복구된다
+
+fetch()는 블로킹 — ImageLoader가 스레드에서 호출한다. 여러 스레드가 동시에 호출하므로
+entries 변경과 manifest 저장은 lock으로 묶는다.
+- 같은 URL을 동시에 요청하면 진행 중 요청 표(_inflight)의 Future 하나를 함께 기다린다 (single-flight)
+- 이미지/manifest 모두 같은 폴더의 임시 파일에 쓴 뒤 os.replace → 반쯤 쓰인 파일이 보이지 않음
+
+maintain(max_bytes, max_age): 용량/기간 예산 정리 (블로킹 — 앱에서는 스레드에서 실행)
+- manifest 항목은 last_access, manifest에 없는 파일(manifest 이전 캐시 등)은 mtime을 마지막 사용으로 보고
+  max_age보다 오래된 것 삭제 → 폴더 합계(둘 다 포함)가 max_bytes를 넘으면 오래된 순으로 삭제
+- manifest 이전 파일은 그 사이 fetch()가 요청 없이 등록해 갈 수 있고, 지워졌다면 한 번 다시 받는다
+- 1시간 넘게 남은 임시 파일은 삭제
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+
+import requests
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+REVALIDATE_AFTER = 7 * 24 * 3600  # 초
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+MAX_CACHE_AGE = 30 * 24 * 3600  # 초 — 마지막 사용 기준
+TMP_GRACE = 3600  # 초 — 이보다 오래된 임시 파일만 정리
+SAVE_INTERVAL = 5.0  # 초 — manifest 저장 최소 간격 (그 사이 변경은 다음 저장/flush 때)
+FETCH_TIMEOUT = 5
+
+
+def _file_name(url: str) -> str:
+    """URL → MD5 해시 파일명 (확장자는 URL 기준)"""
+    ext = '.gif' if '.gif' in url else '.png'
+    return hashlib.md5(url.encode()).hexdigest() + ext
+
+
+def _write_atomic(path: str, data: bytes):
+    """같은 폴더 임시 파일에 쓴 뒤 rename (읽는 쪽은 이전 파일 또는 완성된 파일만 봄)"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class DiskImageCache:
+    def __init__(self, cache_dir: str, revalidate_after: float = REVALIDATE_AFTER, http_get=None):
+        """http_get(url, headers=, timeout=) -> Response: 기본은 requests.get (앱에서는 ImageFetchPool.get)"""
+        self.cache_dir = cache_dir
+        self.http_get = http_get
+        self.manifest_path = os.path.join(cache_dir, MANIFEST_NAME)
+        self.revalidate_after = revalidate_after
+        self._lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self.entries: dict[str, dict] = self._load()
+        self._dirty = False
+        self._saved_at = 0.0
+        self.revalidated = 0    # 304 응답 (파일 그대로)
+        self.refreshed = 0      # 재검증 결과 새 파일
+        self.downloaded = 0     # 처음 받은 파일
+        self.deduped = 0        # 진행 중 요청에 합류한 호출
+        self.evicted = 0        # 정리로 삭제한 항목
+        self.untracked = (0, 0)  # 마지막 정리 때 manifest 밖 파일 (개수, 바이트)
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != MANIFEST_VERSION:
+            return {}
+        return data.get('entries', {})
+
+    def save(self):
+        with self._lock:
+            self._dirty = False
+            self._saved_at = time.monotonic()
+            data = {'version': MANIFEST_VERSION, 'entries': dict(self.entries)}
+            _write_atomic(self.manifest_path, json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+    def flush(self):
+        """저장 안 된 변경(새 항목, 마지막 사용 시각)이 있으면 저장"""
+        if self._dirty:
+            self.save()
+
+    def path_of(self, entry: dict) -> str:
+        return os.path.join(self.cache_dir, entry['file'])
+
+    def lookup(self, url: str) -> str | None:
+        """받아 둔 이미지 경로 (메모리 manifest만 조회), 없으면 None"""
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+        entry['last_access'] = time.time()
+        self._dirty = True
+        return self.path_of(entry)
+
+    def is_stale(self, url: str) -> bool:
+        entry = self.entries.get(url)
+        return entry is not None and time.time() - entry.get('fetched_at', 0) > self.revalidate_after
+
+    def fetch(self, url: str) -> str | None:
+        """이미지를 받아 캐시에 저장하고 경로 반환 (실패 시 None)
+
+        manifest에 있으면 조건부 요청으로 재검증, 없으면 이전 캐시 파일이 있는지 먼저 확인.
+        같은 URL을 받는 중인 호출이 있으면 새로 요청하지 않고 그 결과를 기다린다.
+        """
+        with self._lock:
+            future = self._inflight.get(url)
+            leader = future is None
+            if leader:
+                future = self._inflight[url] = Future()
+            else:
+                self.deduped += 1
+        if not leader:
+            return future.result()
+        try:
+            path = self._fetch(url)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(path)
+            return path
+        finally:
+            with self._lock:
+                del self._inflight[url]
+
+    def _fetch(self, url: str) -> str | None:
+        entry = self.entries.get(url)
+        name = entry['file'] if entry else _file_name(url)
+        path = os.path.join(self.cache_dir, name)
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        elif os.path.exists(path):
+            self._store(url, name, os.path.getsize(path), None, None, None)
+            return path
+
+        try:
+            resp = (self.http_get or requests.get)(url, headers=headers, timeout=FETCH_TIMEOUT)
+        except requests.RequestException:
+            return path if entry else None  # 재검증 실패는 기존 파일 유지
+
+        if resp.status_code == 304 and entry:
+            self.revalidated += 1
+            self._store(url, name, entry.get('size', 0), entry.get('content_type'),
+                        entry.get('etag'), entry.get('last_modified'))
+            return path
+        if resp.status_code != 200:
+            return path if entry else None
+
+        try:
+            _write_atomic(path, resp.content)
+        except OSError:
+            return path if entry else None
+        if entry:
+            self.refreshed += 1
+        else:
+            self.downloaded += 1
+        self._store(url, name, len(resp.content), resp.headers.get('Content-Type'),
+                    resp.headers.get('ETag'), resp.headers.get('Last-Modified'))
+        return path
+
+    def _store(self, url, name, size, content_type, etag, last_modified):
+        now = time.time()
+        with self._lock:
+            self.entries[url] = {
+                'file': name,
+                'size': size,
+                'content_type': content_type,
+                'etag': etag,
+                'last_modified': last_modified,
+                'fetched_at': now,
+                'last_access': now,
+            }
+            self._dirty = True
+        if time.monotonic() - self._saved_at >= SAVE_INTERVAL:
+            self.save()
+
+    def usage(self) -> tuple[int, int]:
+        """(항목 수, 합계 바이트) — manifest 기준"""
+        with self._lock:
+            return len(self.entries), sum(entry.get('size', 0) for entry in self.entries.values())
+
+    def maintain(self, max_bytes: int = MAX_CACHE_BYTES, max_age: float = MAX_CACHE_AGE) -> dict:
+        """용량/기간 예산에 맞춰 정리하고 결과 보고
+
+        manifest 항목(last_access)과 manifest에 없는 파일(mtime)을 한 LRU 순서로 보고,
+        max_age보다 오래됐거나 폴더 합계가 max_bytes를 넘는 동안 오래된 것부터 삭제한다.
+        반환: {'removed': [삭제한 url], 'entries', 'files', 'bytes', 'evicted', 'orphans', 'freed'}
+        """
+        now = time.time()
+        with self._lock:
+            known = {entry['file'] for entry in self.entries.values()}
+        freed = 0
+        orphans = 0
+        untracked = []  # (mtime, 크기, 파일명)
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            names = []
+        for name in names:
+            if name == MANIFEST_NAME or name in known:
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if name.endswith('.tmp'):
+                if now - stat.st_mtime > TMP_GRACE:  # 최근 임시 파일은 쓰는 중일 수 있음
+                    freed += self._remove_file(path)
+                    orphans += 1
+                continue
+            untracked.append((stat.st_mtime, stat.st_size, name))
+
+        removed = []
+        with self._lock:
+            known = {entry['file'] for entry in self.entries.values()}
+            untracked = [item for item in untracked if item[2] not in known]  # 스캔 중 fetch()가 등록한 파일 제외
+            inflight = set(self._inflight)
+            candidates = [
+                (entry.get('last_access', 0), entry.get('size', 0), url, None)
+                for url, entry in self.entries.items() if url not in inflight
+            ]
+            candidates += [(mtime, size, None, name) for mtime, size, name in untracked]
+            candidates.sort(key=lambda candidate: candidate[0])
+            total = sum(entry.get('size', 0) for entry in self.entries.values())
+            total += sum(size for _, size, _ in untracked)
+            doomed = []
+            untracked_left = len(untracked)
+            untracked_bytes = sum(size for _, size, _ in untracked)
+            for last_used, size, url, name in candidates:
+                if now - last_used <= max_age and total <= max_bytes:
+                    break  # 사용 시각 오름차순 — 이후 항목은 모두 예산 안
+                if url is not None:
+                    entry = self.entries.pop(url)
+                    removed.append(url)
+                    doomed.append(self.path_of(entry))
+                else:
+                    orphans += 1
+                    untracked_left -= 1
+                    untracked_bytes -= size
+                    doomed.append(os.path.join(self.cache_dir, name))
+                total -= size
+            if removed:
+                self._dirty = True
+            entries = len(self.entries)
+
+        for path in doomed:
+            freed += self._remove_file(path)
+        self.evicted += len(removed)
+        self.untracked = (untracked_left, untracked_bytes)
+        self.flush()
+        return {
+            'removed': removed,
+            'entries': entries,
+            'files': entries + untracked_left,
+            'bytes': total,
+            'evicted': len(removed),
+            'orphans': orphans,
+            'freed': freed,
+        }
+
+    @staticmethod
+    def _remove_file(path: str) -> int:
+        """파일 삭제 후 크기 반환 (없거나 실패하면 0)"""
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return 0
+        return size
+
+    def stats(self) -> dict:
+        entries, size = self.usage()
+        untracked_files, untracked_bytes = self.untracked
+        return {
+            'entries': entries,
+            'bytes': size,
+            'untracked_files': untracked_files,  # 마지막 정리 기준
+            'untracked_bytes': untracked_bytes,
+            'evicted': self.evicted,
+            'downloaded': self.downloaded,
+            'revalidated': self.revalidated,
+            'refreshed': self.refreshed,
+            'deduped': self.deduped,
+        }
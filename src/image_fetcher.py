@@ -0,0 +1,182 @@
+"""이미지 전용 다운로드 풀
+
+배지/이모지 다운로드를 asyncio 기본 executor(API 호출, 로그 I/O와 공유)에서 분리한다.
+
+- 작업 스레드 workers개로 동시 다운로드 수 제한
+- CDN 호스트마다 keep-alive requests.Session 하나를 공유 (연결 재사용)
+- 우선순위 큐: VISIBLE(지금 화면에 보일 이미지) → PREFETCH(곧 보일 수 있는 이미지)
+  PREFETCH로 대기 중인 URL을 VISIBLE로 다시 요청하면 우선순위만 올린다 (promote)
+- 같은 URL은 대기/실행 중 작업 하나만 유지, 같은 Future를 돌려준다
+
+submit(url, fn, priority) → concurrent.futures.Future (fn(url) 결과)
+get(url, headers, timeout) → 호스트 세션으로 GET (DiskImageCache의 http_get으로 사용)
+"""
+
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from perf_stats import LatencyStats
+
+VISIBLE = 0
+PREFETCH = 1
+_STOP = PREFETCH + 1  # 종료 신호 (모든 작업 뒤에 꺼내짐)
+
+IMAGE_FETCH_WORKERS = 4
+
+
+class _Job:
+    __slots__ = ('fn', 'future', 'priority', 'started')
+
+    def __init__(self, fn, priority: int):
+        self.fn = fn
+        self.future: Future = Future()
+        self.priority = priority
+        self.started = False
+
+
+class ImageFetchPool:
+    def __init__(self, workers: int = IMAGE_FETCH_WORKERS):
+        self.workers = max(1, workers)
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._order = itertools.count()  # 같은 우선순위는 요청 순서대로
+        self._jobs: dict[str, _Job] = {}  # 대기 + 실행 중
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._sessions: dict[str, requests.Session] = {}
+        self._closed = False
+        self.latency = LatencyStats(max_samples=10_000)
+        self.bytes_fetched = 0
+        self.requests = 0
+        self.failed = 0
+        self.promoted = 0
+
+    # ── 작업 큐 ──
+
+    def submit(self, url: str, fn, priority: int = VISIBLE) -> Future:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('ImageFetchPool is closed')
+            job = self._jobs.get(url)
+            if job is None:
+                job = self._jobs[url] = _Job(fn, priority)
+            elif not job.started and priority < job.priority:
+                job.priority = priority
+                self.promoted += 1
+            else:
+                return job.future
+            self._queue.put((priority, next(self._order), url))
+            if len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._work, name='image-fetch', daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        return job.future
+
+    def promote(self, url: str, priority: int = VISIBLE):
+        """대기 중인 작업의 우선순위를 올림 (없거나 이미 실행 중이면 무시)"""
+        with self._lock:
+            job = self._jobs.get(url)
+            if job is None or job.started or priority >= job.priority:
+                return
+            job.priority = priority
+            self.promoted += 1
+            self._queue.put((priority, next(self._order), url))
+
+    def _work(self):
+        while True:
+            priority, _, url = self._queue.get()
+            if priority == _STOP:
+                return
+            with self._lock:
+                job = self._jobs.get(url)
+                # promote 이전 항목은 건너뜀 (새 항목이 먼저 처리됨), 닫힌 뒤에는 새 작업을 시작하지 않음
+                if job is None or job.started or job.priority != priority or self._closed:
+                    continue
+                job.started = True
+            try:
+                result = job.fn(url)
+            except BaseException as exc:
+                self._finish(url)
+                job.future.set_exception(exc)
+            else:
+                self._finish(url)
+                job.future.set_result(result)
+
+    def _finish(self, url: str):
+        with self._lock:
+            del self._jobs[url]
+
+    # ── HTTP ──
+
+    def _session(self, url: str) -> requests.Session:
+        host = urlsplit(url).netloc
+        with self._lock:
+            if self._closed:  # 닫은 뒤 새 세션을 만들면 아무도 닫지 않음
+                raise RuntimeError('ImageFetchPool is closed')
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.workers)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._sessions[host] = session
+        return session
+
+    def get(self, url: str, headers=None, timeout=None) -> requests.Response:
+        session = self._session(url)
+        started = time.perf_counter()
+        try:
+            resp = session.get(url, headers=headers, timeout=timeout)
+            size = len(resp.content)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        elapsed = time.perf_counter() - started
+        with self._lock:  # 여러 작업 스레드가 동시에 갱신
+            self.latency.add(elapsed)
+            self.requests += 1
+            self.bytes_fetched += size
+        return resp
+
+    def close(self):
+        """대기 작업은 취소하고 작업 스레드 종료 신호, 세션 닫기 (실행 중인 작업은 기다리지 않음)
+
+        닫은 뒤에는 submit()과 새 세션 생성(_session)을 거부한다.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            waiting = [url for url, job in self._jobs.items() if not job.started]
+            futures = [self._jobs.pop(url).future for url in waiting]
+            for _ in self._threads:
+                self._queue.put((_STOP, next(self._order), ''))
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for future in futures:
+            future.cancel()
+        for session in sessions:
+            session.close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            running = sum(job.started for job in self._jobs.values())
+            queued = len(self._jobs) - running
+            return {
+                'workers': self.workers,
+                'queued': queued,
+                'running': running,
+                'sessions': len(self._sessions),
+                'requests': self.requests,
+                'failed': self.failed,
+                'bytes': self.bytes_fetched,
+                'promoted': self.promoted,
+                'latency_ms': self.latency.summary(),
+            }
@@ -0,0 +1,186 @@
+"""배지/이모지 이미지 백그라운드 로더
+
+row를 만들 때 이미지를 기다리지 않는다. get(url)은 즉시 반환하고, 아직 없는 이미지는
+백그라운드(스레드)에서 받은 뒤 on_loaded(url, path)로 알린다 — 화면 쪽은 자리만 잡아 둔
+ft.Image의 src만 바꿔 끼운다. 채팅 텍스트의 순서/지연은 이미지 다운로드와 무관하다.
+
+get(url) 반환:
+    경로      받아 둔 이미지
+    PENDING   받는 중 (이번 호출로 시작했을 수도 있음) — 자리표시자로 표시
+    None      받기 실패 — 표시하지 않음 (negative cache: TTL이 지나면 다시 시도)
+
+메모리 캐시는 최대 maxsize개 LRU — 밀려난 URL은 다음 get()에서 디스크 manifest로 다시 찾는다.
+실패한 URL은 negative_ttl(5초)부터 다시 실패할 때마다 2배씩(최대 10분) 기다린 뒤 재시도한다.
+
+cache(선택, DiskImageCache)를 주면 이전 실행에서 받아 둔 이미지는 manifest에서 바로 경로를
+돌려준다 (자리표시자 없음). 오래된 항목은 그 경로를 그대로 쓰면서 백그라운드에서 재검증한다.
+
+pool(선택, ImageFetchPool)을 주면 fetch를 기본 executor 대신 이미지 전용 풀에서 실행한다.
+get()은 VISIBLE, prefetch()는 PREFETCH 우선순위 — 미리 받는 중인 이미지가 화면에 필요해지면 앞당긴다.
+"""
+
+import asyncio
+from collections import OrderedDict
+from time import monotonic
+
+from image_fetcher import PREFETCH, VISIBLE
+
+PENDING = ""
+
+IMAGE_CACHE_SIZE = 2048   # URL 수
+NEGATIVE_TTL = 5.0        # 초 — 첫 실패 후 재시도까지
+NEGATIVE_TTL_MAX = 600.0  # 초
+
+
+class LRUDict:
+    """최대 maxsize개, 넘치면 가장 오래 안 쓴 항목부터 버림"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = max(1, maxsize)
+        self._data: OrderedDict = OrderedDict()
+        self.evicted = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key):
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def pop(self, key):
+        return self._data.pop(key, None)
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evicted += 1
+
+
+class ImageLoader:
+    """fetch(url) -> 경로 | None: 블로킹 다운로드 (스레드에서 실행)
+    on_loaded(url, path): 받기 성공 시 이벤트 루프에서 호출
+    spawn(coro_fn, *args): 태스크 실행기 (기본: 현재 루프의 create_task, 앱에서는 page.run_task)
+    cache: lookup(url) -> 경로 | None, is_stale(url) -> bool
+    pool: submit(url, fn, priority) -> Future, promote(url)
+    """
+
+    def __init__(self, fetch, on_loaded=None, spawn=None, cache=None, pool=None,
+                 maxsize: int = IMAGE_CACHE_SIZE, negative_ttl: float = NEGATIVE_TTL,
+                 negative_ttl_max: float = NEGATIVE_TTL_MAX):
+        self.fetch = fetch
+        self.on_loaded = on_loaded
+        self.spawn = spawn or self._create_task
+        self.cache = cache
+        self.pool = pool
+        self.negative_ttl = negative_ttl
+        self.negative_ttl_max = negative_ttl_max
+        self.paths = LRUDict(maxsize)  # url → 경로 (성공한 것만)
+        self._failures: dict[str, tuple[float, float]] = {}  # url → (다시 시도할 시각, 다음 TTL)
+        self._pending: set[str] = set()
+        self._tasks: set = set()
+        self.loaded = 0
+        self.failed = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _create_task(coro_fn, *args):
+        return asyncio.get_running_loop().create_task(coro_fn(*args))
+
+    def get(self, url: str) -> str | None:
+        return self._resolve(url, VISIBLE)
+
+    def prefetch(self, url: str):
+        """곧 보일 수 있는 이미지를 화면용 요청 뒤에 미리 받음"""
+        self._resolve(url, PREFETCH)
+
+    def _resolve(self, url: str, priority: int) -> str | None:
+        path = self.paths.get(url)
+        if path is not None:
+            self.hits += 1
+            return path
+        failure = self._failures.get(url)
+        if failure is not None and monotonic() < failure[0]:
+            self.negative_hits += 1
+            return None
+        if self.cache is not None:
+            path = self.cache.lookup(url)
+            if path is not None:
+                self.disk_hits += 1
+                self.paths.put(url, path)
+                if self.cache.is_stale(url):
+                    self._start(url, PREFETCH)  # 재검증 — 끝날 때까지 기존 파일 사용
+                return path
+        self.misses += 1
+        self._start(url, priority)
+        return PENDING
+
+    def _start(self, url: str, priority: int):
+        if url in self._pending:
+            if self.pool is not None:
+                self.pool.promote(url, priority)
+            return
+        self._pending.add(url)
+        task = self.spawn(self._load, url, priority)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load(self, url: str, priority: int = VISIBLE):
+        try:
+            if self.pool is None:
+                path = await asyncio.to_thread(self.fetch, url)
+            else:
+                path = await asyncio.wrap_future(self.pool.submit(url, self.fetch, priority))
+        except Exception:
+            path = None
+        finally:
+            self._pending.discard(url)
+        if path is None:
+            self.failed += 1
+            if url not in self.paths:  # 재검증 실패면 기존 경로 유지
+                self._remember_failure(url)
+            return
+        self._failures.pop(url, None)
+        self.paths.put(url, path)
+        self.loaded += 1
+        if self.on_loaded:
+            self.on_loaded(url, path)
+
+    def forget(self, urls):
+        """디스크 캐시 정리로 지워진 파일의 경로를 메모리 캐시에서 제거"""
+        for url in urls:
+            self.paths.pop(url)
+
+    def _remember_failure(self, url: str):
+        """실패 → negative_ttl 동안 None, 다시 실패할 때마다 TTL 2배 (최대 negative_ttl_max)"""
+        failure = self._failures.get(url)
+        ttl = failure[1] if failure is not None else self.negative_ttl
+        self._failures[url] = (monotonic() + ttl, min(ttl * 2, self.negative_ttl_max))
+        if len(self._failures) > self.paths.maxsize:  # 오래된 실패 기록부터 버림
+            del self._failures[next(iter(self._failures))]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.negative_hits + self.misses
+        return {
+            'size': len(self.paths),
+            'maxsize': self.paths.maxsize,
+            'failures': len(self._failures),
+            'pending': len(self._pending),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'negative_hits': self.negative_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            'evicted': self.paths.evicted,
+            'loaded': self.loaded,
+            'failed': self.failed,
+        }
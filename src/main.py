@@ -11,7 +11,7 @@ async def main() 사용 이유:
 """
 
 import asyncio
-import hashlib
+import datetime
 import json
 import os
 import platform
@@ -20,15 +20,39 @@ import sys
 import webbrowser
 from urllib.parse import quote
 
-import requests
 import flet as ft
 
+import api
+from chat_filter import ChatFilter
 from chat_logger import ChatLogger
+from chat_message import ChatMessage
+from chat_queue import OVERFLOW_POLICIES, ChatQueue
+from chat_row import DONATION_COLOR, MAX_BADGES, ChatRow, RowPool, SegmentCache, chat_theme
+from chat_view import ChatViewport
 from chat_worker import ChatWorker
-from config import COOKIES_PATH, BADGE_CACHE_DIR, EMOJI_CACHE_DIR, SETTINGS_PATH, BUG_REPORT_EMAIL
-
-MAX_DISPLAY_MESSAGES = 10_000
+from config import (
+    BASE_DIR, COOKIES_PATH, BADGE_CACHE_DIR, EMOJI_CACHE_DIR, SETTINGS_PATH, BUG_REPORT_EMAIL,
+    CAPTURE_DIR, CAPTURE_FRAMES, REPLAY_PATH, REPLAY_SPEED,
+)
+from frame_capture import FrameRecorder
+from image_cache import MAX_CACHE_AGE, MAX_CACHE_BYTES, DiskImageCache
+from image_fetcher import IMAGE_FETCH_WORKERS, ImageFetchPool
+from image_loader import IMAGE_CACHE_SIZE, ImageLoader
+from render_scheduler import RenderScheduler
+from spam_collapse import SpamCollapser
+from replay import ReplayWorker, parse_speed
+from time_format import DEFAULT_TIME_FORMAT, TimeFormatter
+
+MAX_BUFFER_MESSAGES = 100_000  # 메시지 버퍼 (컨트롤은 화면 근처 VIEWPORT_ROWS개만 생성)
+VIEWPORT_ROWS = 150
+VIEWPORT_PAGE = 50  # 구간 끝에 닿았을 때 한 번에 옮기는 row 수
+SCROLL_EDGE = 40  # px — 구간 위 끝에서 이만큼 안쪽이면 이전 메시지를 더 불러옴
 MAX_USER_MESSAGES = 500
+CHAT_BATCH_WINDOW = 0.05  # 초 — 이 시간 안에 들어온 프레임은 한 번의 page.update로 렌더링
+CHAT_QUEUE_SIZE = 2000  # 수신 → 렌더링 큐 최대 길이 (settings.json "chat_queue_size")
+CHAT_OVERFLOW_POLICY = "summarize"  # block / drop_oldest / summarize (settings.json "overflow_policy")
+RENDER_FPS = 30  # 초당 최대 화면 갱신 횟수 (settings.json "render_fps", 1~120)
+SEARCH_DEBOUNCE = 0.15  # 초 — 검색어 입력이 이 시간 동안 멈추면 검색 실행
 
 # ── 닉네임 색상 ──
 COLOR_CODE_MAP = {
@@ -67,41 +91,6 @@ def get_user_color(uid: str, color_code: str | None) -> str:
     return USER_COLOR_PALETTE[idx]
 
 
-# ── 이미지 캐시 ──
-_badge_cache: dict[str, str | None] = {}
-_emoji_cache: dict[str, str | None] = {}
-
-
-def _download_image(url: str, cache_dir: str, cache_dict: dict) -> str | None:
-    """URL → MD5 해시 파일명으로 로컬 캐시. 이미 있으면 즉시 반환."""
-    if url in cache_dict:
-        return cache_dict[url]
-
-    url_hash = hashlib.md5(url.encode()).hexdigest()
-    ext = ".gif" if ".gif" in url else ".png"
-    local_path = os.path.join(cache_dir, f"{url_hash}{ext}")
-
-    if os.path.exists(local_path):
-        cache_dict[url] = local_path
-        return local_path
-
-    try:
-        resp = requests.get(url, timeout=5)
-        if resp.status_code == 200:
-            with open(local_path, "wb") as f:
-                f.write(resp.content)
-            cache_dict[url] = local_path
-            return local_path
-    except Exception:
-        pass
-
-    cache_dict[url] = None
-    return None
-
-
-EMOJI_PATTERN = re.compile(r"\{:([^:]+):\}")
-
-
 def extract_streamer_id(url_or_id: str) -> str:
     """URL 또는 UID에서 스트리머 ID(32자 hex) 추출"""
     url_or_id = url_or_id.strip()
@@ -158,6 +147,20 @@ async def main(page: ft.Page):
             pass
 
     font_size: int = int(_settings.get("font_size", 13))
+    chat_queue_size: int = int(_settings.get("chat_queue_size", CHAT_QUEUE_SIZE))
+    overflow_policy: str = _settings.get("overflow_policy", CHAT_OVERFLOW_POLICY)
+    if overflow_policy not in OVERFLOW_POLICIES:
+        overflow_policy = CHAT_OVERFLOW_POLICY
+    render_fps: int = min(120, max(1, int(_settings.get("render_fps", RENDER_FPS))))
+    collapse_spam: bool = bool(_settings.get("collapse_spam", False))  # 도배 합치기 (옵트인)
+    image_fetch_workers: int = max(1, int(_settings.get("image_fetch_workers", IMAGE_FETCH_WORKERS)))
+    image_cache_size: int = max(1, int(_settings.get("image_cache_size", IMAGE_CACHE_SIZE)))  # 로더별 URL 수
+    image_cache_mb: float = float(_settings.get("image_cache_mb", MAX_CACHE_BYTES / 1024 / 1024))  # 폴더별
+    image_cache_days: float = float(_settings.get("image_cache_days", MAX_CACHE_AGE / 86400))
+    try:
+        time_formatter = TimeFormatter(_settings.get("time_format", DEFAULT_TIME_FORMAT))
+    except ValueError:
+        time_formatter = TimeFormatter()
 
     def _save_settings():
         s: dict = {}
@@ -168,6 +171,7 @@ async def main(page: ft.Page):
             except Exception:
                 pass
         s["font_size"] = font_size
+        s["collapse_spam"] = collapse_spam
         with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
             json.dump(s, f, indent=2, ensure_ascii=False)
 
@@ -176,186 +180,207 @@ async def main(page: ft.Page):
     chat_log = ChatLogger()
 
     # ── 채팅 메모리 ──
-    all_items: list[tuple[bool, ft.Control, dict, dict]] = []  # (is_donation, widget, chat_data, refs)
-    user_messages: dict[str, list] = {}  # uid → [chat_data, ...]
+    # 메시지 버퍼 + 화면 구간은 viewport(ChatViewport, chat_list 생성 후 초기화)가 관리
+    # 화면에 올라간 row의 widget.data = ChatRow (visible/size 변경에 사용할 컨트롤 참조)
+    user_messages: dict[str, list[ChatMessage]] = {}  # uid → [chat_data, ...]
     donation_only = False
     at_bottom = True  # 스크롤이 맨 아래에 있는지 여부
     search_query = ""
+    search_task = None  # 디바운스 대기 중인 검색 (page.run_task Future)
+    search_current: int | None = None  # 검색 결과 이동 중인 메시지 seq
     show_timestamp = True  # 타임스탬프 표시 여부
     show_badges = True  # 배지 표시 여부
 
-    def _item_matches_filter(is_don: bool, cd: dict) -> bool:
-        """donation_only + search_query 조합으로 표시 여부 판단"""
-        if donation_only and not is_don:
-            return False
-        if search_query:
-            q = search_query.lower()
-            if (
-                q not in cd.get("nickname", "").lower()
-                and q not in cd.get("message", "").lower()
-            ):
-                return False
-        return True
-
     def _rebuild_chat_list():
-        """현재 필터(donation_only + search_query)로 visible 토글"""
-        for is_don, widget, cd, _ in all_items:
-            widget.visible = _item_matches_filter(is_don, cd)
-        page.update()
-
-    # ChatWorker가 page.run_task()로 같은 이벤트 루프에서 실행되므로
-    # 아래 콜백에서 page.update() 호출이 안전함 (스레드 경합 없음)
-    async def on_chat_received(chat_data):
-        nonlocal donation_only, at_bottom, search_query
-        is_donation = chat_data["type"] == "후원"
-        uid = chat_data["uid"]
-
-        # ── 유저별 메시지 추적 ──
-        msgs = user_messages.setdefault(uid, [])
+        """필터(donation_only + search_query)가 바뀌었으면 통과 목록을 갱신하고 화면 구간을 최신 메시지부터 다시 구성"""
+        nonlocal at_bottom, search_current
+        if not chat_filter.set(donation_only, search_query):
+            return
+        if search_current is not None:  # refresh()가 재사용하는 row에 강조가 남지 않게
+            for widget in chat_list.controls:
+                widget.data.set_current(False)
+            search_current = None
+        _update_search_count()
+        viewport.refresh()
+        at_bottom = True
+        render.request(scroll=True)
+
+    def _record_message(chat_data: ChatMessage):
+        """유저별 기록 + 채팅 로그 (화면 표시 여부와 무관하게 모든 메시지)"""
+        msgs = user_messages.setdefault(chat_data.uid, [])
         msgs.append(chat_data)
         if len(msgs) > MAX_USER_MESSAGES:
             del msgs[:-MAX_USER_MESSAGES]
+        chat_log.log(chat_data)
 
-        # 닉네임 색상
-        if is_donation:
-            nick_color = "#ffcc00"
+    def _add_chat_row(chat_data: ChatMessage) -> bool:
+        """메시지 1건 → 버퍼에 추가 (page.update는 호출하지 않음, 이미지는 기다리지 않음)
+
+        반환: 화면 구간에 row가 추가되었는지 여부
+        """
+        _record_message(chat_data)
+        if collapse_spam and not chat_data.is_donation:
+            seq = spam_collapser.add(chat_data.message, viewport.first_seq, viewport.end_seq)
+            if seq is not None:  # 최근 row의 "×N"만 올림
+                control = viewport.control_for(seq)
+                if control is None:
+                    return False
+                control.data.set_count(spam_collapser.counts[seq])
+                return True
+        if viewport.append(chat_data):
+            return True
+        if not viewport.following:  # 이전 메시지를 보는 중 — 돌아왔을 때 바로 보이게
+            _prefetch_images(chat_data)
+        return False
+
+    def _build_row(seq: int, chat_data: ChatMessage) -> ft.Control:
+        """메시지 1건 → row 위젯 (풀에서 꺼낸 ChatRow에 써넣음, 없는 이미지는 자리표시자 + 백그라운드 다운로드)"""
+        if chat_data.is_donation:
+            nick_color = DONATION_COLOR
         else:
-            nick_color = get_user_color(uid, chat_data.get("colorCode"))
+            nick_color = get_user_color(chat_data.uid, chat_data.color_code)
+
+        segments = None
+        if chat_data.emojis:
+            segments = segment_cache.get(chat_data.message, chat_data.emojis)
+
+        row = row_pool.acquire()
+        row.bind(seq, chat_data, nick_color, chat_data.badges[:MAX_BADGES], segments,
+                 show_timestamp, show_badges)
+        count = spam_collapser.counts.get(seq)
+        if count:
+            row.set_count(count)
+        if seq == search_current:
+            row.set_current(True)
+        return row.control
+
+    def _on_image_loaded(url: str, path: str):
+        """받기가 끝난 이미지를 화면 구간의 자리표시자에 끼움 (row 순서는 그대로)"""
+        patched = False
+        for widget in chat_list.controls:
+            patched |= widget.data.patch_image(url, path)
+        if patched:
+            render.request(scroll=False)
+
+    # 디스크 캐시 manifest는 시작할 때 한 번 읽음 → 받아 둔 이미지는 첫 화면부터 바로 표시
+    # 다운로드는 이미지 전용 풀에서 (동시 수 제한, 호스트별 keep-alive 세션, 화면용 요청 우선)
+    image_pool = ImageFetchPool(image_fetch_workers)
+    badge_disk = DiskImageCache(BADGE_CACHE_DIR, http_get=image_pool.get)
+    emoji_disk = DiskImageCache(EMOJI_CACHE_DIR, http_get=image_pool.get)
+    badge_images = ImageLoader(badge_disk.fetch, on_loaded=_on_image_loaded, spawn=page.run_task,
+                               cache=badge_disk, pool=image_pool, maxsize=image_cache_size)
+    emoji_images = ImageLoader(emoji_disk.fetch, on_loaded=_on_image_loaded, spawn=page.run_task,
+                               cache=emoji_disk, pool=image_pool, maxsize=image_cache_size)
+
+    def _prefetch_images(chat_data: ChatMessage):
+        """화면 구간 밖에 쌓인 메시지의 이미지 → 화면용 요청 뒤에 미리 받아 둠"""
+        if show_badges:
+            for url in chat_data.badges[:MAX_BADGES]:
+                badge_images.prefetch(url)
+        if chat_data.emojis:
+            for url in chat_data.emojis.values():
+                emoji_images.prefetch(url)
+
+    async def _maintain_image_caches() -> dict:
+        """디스크 캐시를 용량/기간 예산에 맞춰 정리 (파일 I/O는 스레드에서 — UI는 막지 않음)"""
+        reports = {}
+        for name, disk, loader in (("badges", badge_disk, badge_images), ("emojis", emoji_disk, emoji_images)):
+            report = await asyncio.to_thread(
+                disk.maintain, int(image_cache_mb * 1024 * 1024), image_cache_days * 86400,
+            )
+            loader.forget(report.pop("removed"))
+            report["hit_rate"] = loader.stats()["hit_rate"]
+            reports[name] = report
+        return reports
+
+    async def show_cache_maintenance(e):
+        """이미지 캐시 정리 후 결과(크기, 파일 수, 적중률) 표시"""
+        reports = await _maintain_image_caches()
+        lines = []
+        for name, report in reports.items():
+            lines.append(
+                f"{name}: 파일 {report['files']}개 (manifest {report['entries']}개), "
+                f"{report['bytes'] / 1024 / 1024:.1f} MB, "
+                f"적중률 {report['hit_rate']:.0%}"
+            )
+            lines.append(
+                f"  정리: {report['evicted']}개 + manifest 밖 파일 {report['orphans']}개, "
+                f"{report['freed'] / 1024 / 1024:.1f} MB"
+            )
+        page.show_dialog(ft.SnackBar(ft.Text("\n".join(lines))))
 
-        # 시간
-        time_text = ft.Text(
-            f"[{chat_data['time']}] ",
-            size=font_size,
-            color=ft.Colors.GREY_500,
-            selectable=True,
-            no_wrap=True,
-            visible=show_timestamp,
-        )
+    def _flush_image_caches(e=None):
+        """저장 간격에 걸려 아직 안 쓴 manifest 변경을 기록"""
+        badge_disk.flush()
+        emoji_disk.flush()
 
-        # 배지 (최대 3개)
-        badge_controls = []
-        for badge_url in chat_data.get("badges", [])[:3]:
-            path = await asyncio.to_thread(
-                _download_image, badge_url, BADGE_CACHE_DIR, _badge_cache
-            )
-            if path:
-                badge_controls.append(
-                    ft.Image(src=path, width=18, height=18, visible=show_badges)
-                )
+    def _close_images(e=None):
+        _flush_image_caches()
+        image_pool.close()
 
-        # 닉네임
-        prefix = "[후원] " if is_donation else ""
-        nick_text = ft.Text(
-            f"{prefix}{chat_data['nickname']}",
-            size=font_size,
-            color=nick_color,
-            weight=ft.FontWeight.BOLD,
-            no_wrap=True,
-        )
+    async def _on_page_close(e=None):
+        """앱 종료: manifest 기록, 이미지 풀과 공용 API 클라이언트(keep-alive 연결) 닫기"""
+        _close_images()
+        await api.aclose()
 
-        # 메시지 (이모지 치환)
-        message = chat_data["message"]
-        emojis = chat_data.get("emojis", {})
-        msg_controls = []
-
-        if emojis:
-            parts = EMOJI_PATTERN.split(message)
-            # parts: [text, emoji_name, text, emoji_name, ...]
-            for i, part in enumerate(parts):
-                if i % 2 == 0:  # 2부분인데, % 가 아니라 i == 2로 해도 되지않아?
-                    # 텍스트 부분
-                    if part:
-                        sep = ": " if i == 0 and not msg_controls else ""
-                        msg_controls.append(
-                            ft.Text(
-                                f"{sep}{part}" if i == 0 else part,
-                                size=font_size,
-                                color=ft.Colors.WHITE,
-                                selectable=True,
-                            )
-                        )
-                else:
-                    # 이모지 이름
-                    if part in emojis:
-                        path = await asyncio.to_thread(
-                            _download_image, emojis[part], EMOJI_CACHE_DIR, _emoji_cache
-                        )
-                        if path:
-                            msg_controls.append(ft.Image(src=path, width=20, height=20))
-                            continue
-                    # 매칭 실패 시 원본 텍스트
-                    msg_controls.append(
-                        ft.Text(
-                            f"{{:{part}:}}",
-                            size=font_size,
-                            color=ft.Colors.WHITE,
-                            selectable=True,
-                        )
-                    )
-            # 첫 텍스트에 ": " 접두사
-            if msg_controls and isinstance(msg_controls[0], ft.Text):
-                if not msg_controls[0].value.startswith(": "):
-                    msg_controls[0].value = f": {msg_controls[0].value}"
-        else:
-            msg_controls.append(
-                ft.Text(
-                    f": {message}",
-                    size=font_size,
-                    color=ft.Colors.WHITE,
-                    selectable=True,
-                    expand=True,
-                )
-            )
+    async def _on_disconnect(e):
+        _flush_image_caches()
+        await api.aclose()  # 다시 연결되면 다음 API 호출에서 새로 만듦
 
-        # 닉네임 클릭 → UserChatDialog
-        _uid, _nick = uid, chat_data["nickname"]
-        nick_control = ft.GestureDetector(
-            content=nick_text,
-            on_tap=lambda e, u=_uid, n=_nick: show_user_dialog(u, n),
-            mouse_cursor=ft.MouseCursor.CLICK,
-        )
+    async def exit_app(e):
+        await _on_page_close()
+        await page.window.close()
 
-        # Row 조립: 시간 + 배지들 + 닉네임 + 메시지
-        controls = [time_text] + badge_controls + [nick_control] + msg_controls
+    page.on_close = _on_page_close
+    page.on_disconnect = _on_disconnect
 
-        row = ft.Row(
-            controls=controls,
-            spacing=0,
-            vertical_alignment=ft.CrossAxisAlignment.START,
-        )
+    def _release_row(control: ft.Control):
+        row_pool.release(control.data)
 
-        if is_donation:
-            container = ft.Container(
-                content=row,
-                bgcolor=ft.Colors.with_opacity(0.15, "#ffcc00"),
-                border_radius=4,
-                padding=ft.Padding(left=4, right=4, top=2, bottom=2),
-            )
-            widget = container
-        else:
-            widget = row
-
-        # refs: visible/size 변경에 사용할 컨트롤 참조
-        msg_text_refs = [c for c in msg_controls if isinstance(c, ft.Text)]
-        refs = {
-            "time": time_text,
-            "badges": badge_controls,
-            "texts": [time_text, nick_text] + msg_text_refs,
-        }
-
-        # ── 메모리 관리 ──
-        all_items.append((is_donation, widget, chat_data, refs))
-        if len(all_items) > MAX_DISPLAY_MESSAGES:
-            _, removed_widget, _, _ = all_items.pop(0)
-            chat_list.controls.remove(removed_widget)
-
-        widget.visible = _item_matches_filter(is_donation, chat_data)
-        chat_list.controls.append(widget)
-        chat_log.log(chat_data)
+    segment_cache = SegmentCache()
+    spam_collapser = SpamCollapser()
+    row_pool = RowPool(
+        lambda: ChatRow(show_user_dialog, badge_images.get, emoji_images.get),
+        maxsize=VIEWPORT_ROWS + 2 * VIEWPORT_PAGE,
+    )
+
+    page.run_task(_maintain_image_caches)  # 시작할 때 한 번 백그라운드 정리
+
+    # ChatWorker가 page.run_task()로 같은 이벤트 루프에서 실행되므로
+    # 아래 콜백에서 page.update() 호출이 안전함 (스레드 경합 없음)
+    async def _flush_render(scroll: bool):
+        """RenderScheduler의 flush: 모인 변경을 update 1회 + 스크롤 1회로 전송"""
         page.update()
-        if at_bottom and widget.visible:
+        if scroll and at_bottom:
             await chat_list.scroll_to(offset=-1, duration=0)
 
+    render = RenderScheduler(_flush_render, fps=render_fps)
+
+    async def on_chat_received(chat_data: ChatMessage):
+        visible = _add_chat_row(chat_data)
+        render.request(scroll=visible)
+
+    async def on_chat_batch(messages: list[ChatMessage]):
+        """프레임(또는 CHAT_BATCH_WINDOW) 단위 묶음 → 갱신 요청 1회"""
+        any_visible = False
+        for chat_data in messages:
+            any_visible |= _add_chat_row(chat_data)
+        render.request(scroll=any_visible)
+
+    def on_chat_dropped(messages: list[ChatMessage]):
+        """렌더링 큐가 넘쳐 화면에서 빠진 메시지 — 유저 기록/로그에는 남김"""
+        for chat_data in messages:
+            _record_message(chat_data)
+
+    skipped_total = 0
+
+    async def on_chat_skipped(count: int):
+        """summarize 정책: 생략된 건수를 상태 표시줄에 누적 표시"""
+        nonlocal skipped_total
+        skipped_total += count
+        status_text.value = f"화면 갱신 지연 — {skipped_total}건 생략 (로그/유저 기록에는 남음)"
+        status_text.color = ft.Colors.AMBER_400
+
     def on_status_changed(msg):
         if "연결 완료" in msg:
             status_text.color = ft.Colors.GREEN_400
@@ -364,8 +389,8 @@ async def main(page: ft.Page):
             connect_btn.disabled = False
             if worker:
                 chat_log.setup(worker.channelName)
-        elif "연결 실패" in msg or "재연결 실패" in msg:
-            status_text.color = ft.Colors.RED_400
+        elif "연결 실패" in msg or "재연결 실패" in msg or "재생 완료" in msg:
+            status_text.color = ft.Colors.RED_400 if "실패" in msg else ft.Colors.GREY_500
             connect_btn.content.value = "연결"
             connect_btn.bgcolor = ft.Colors.GREEN
             connect_btn.disabled = False
@@ -376,7 +401,7 @@ async def main(page: ft.Page):
         page.update()
 
     async def on_connect_clicked(e):
-        nonlocal worker
+        nonlocal worker, skipped_total
 
         # 해제 모드
         if worker and worker.running:
@@ -392,7 +417,23 @@ async def main(page: ft.Page):
             page.update()
             return
 
+        # 재생 모드 (.env REPLAY_PATH) — 라이브 대신 캡처 파일을 같은 경로로 재생
+        if REPLAY_PATH:
+            connect_btn.disabled = True
+            url_input.disabled = True
+            worker = ReplayWorker(
+                os.path.join(BASE_DIR, REPLAY_PATH),
+                on_chat_received,
+                on_status_changed,
+                speed=parse_speed(REPLAY_SPEED),
+                on_chat_batch=on_chat_batch,
+                time_formatter=time_formatter,
+            )
+            page.run_task(worker.run)
+            return
+
         # 연결 모드
+        skipped_total = 0
         raw = url_input.value or ""
         uid = extract_streamer_id(raw)
         if not uid:
@@ -408,7 +449,23 @@ async def main(page: ft.Page):
         status_text.color = ft.Colors.YELLOW_400
         page.update()
 
-        worker = ChatWorker(uid, cookies, on_chat_received, on_status_changed)
+        recorder = None
+        if CAPTURE_FRAMES:
+            stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+            recorder = FrameRecorder(os.path.join(CAPTURE_DIR, f"{uid}-{stamp}.chzcap"))
+
+        worker = ChatWorker(
+            uid,
+            cookies,
+            on_chat_received,
+            on_status_changed,
+            recorder=recorder,
+            on_chat_batch=on_chat_batch,
+            batch_window=CHAT_BATCH_WINDOW,
+            queue=ChatQueue(chat_queue_size, overflow_policy, on_drop=on_chat_dropped),
+            on_chat_skipped=on_chat_skipped,
+            time_formatter=time_formatter,
+        )
         page.run_task(worker.run)  # Flet 이벤트 루프에서 async 실행
 
     def show_user_dialog(uid: str, nickname: str):
@@ -418,16 +475,16 @@ async def main(page: ft.Page):
         if msgs:
             rows = []
             for cd in msgs:
-                is_don = cd["type"] == "후원"
+                is_don = cd.is_donation
                 time_ctrl = ft.Text(
-                    f"[{cd['time']}]",
+                    f"[{cd.time}]",
                     size=11,
                     color=ft.Colors.GREY_500,
                     no_wrap=True,
                 )
                 prefix = "[후원] " if is_don else ""
                 msg_ctrl = ft.Text(
-                    f"{prefix}{cd['message']}",
+                    f"{prefix}{cd.message}",
                     size=12,
                     color=ft.Colors.AMBER_300 if is_don else ft.Colors.WHITE,
                     selectable=True,
@@ -490,29 +547,37 @@ async def main(page: ft.Page):
         )
         page.show_dialog(dialog)
 
+    # 타임스탬프/배지 표시는 화면 구간(최대 VIEWPORT_ROWS개)의 row만 바꾸고,
+    # 이후 구간에 올라오는 row는 _build_row()의 bind()가 현재 설정을 적용한다
     def toggle_timestamp(e):
         nonlocal show_timestamp
         show_timestamp = not show_timestamp
         timestamp_menu_item.content.value = "타임스탬프 ✓" if show_timestamp else "타임스탬프"
-        for _, _, _, refs in all_items:
-            refs["time"].visible = show_timestamp
+        for widget in chat_list.controls:
+            widget.data.time_text.visible = show_timestamp
         page.update()
 
     def toggle_badges(e):
         nonlocal show_badges
         show_badges = not show_badges
         badge_menu_item.content.value = "배지 ✓" if show_badges else "배지"
-        for _, _, _, refs in all_items:
-            for badge in refs["badges"]:
+        for widget in chat_list.controls:
+            for badge in widget.data.active_badges:
                 badge.visible = show_badges
         page.update()
 
+    def toggle_collapse_spam(e):
+        """도배 합치기 on/off — 이후 들어오는 메시지부터 적용 (이미 합쳐진 row는 유지)"""
+        nonlocal collapse_spam
+        collapse_spam = not collapse_spam
+        collapse_menu_item.content.value = "도배 합치기 ✓" if collapse_spam else "도배 합치기"
+        page.update()
+        _save_settings()
+
     def apply_font_size(size: int):
         nonlocal font_size
         font_size = size
-        for _, _, _, refs in all_items:
-            for text in refs["texts"]:
-                text.size = font_size
+        chat_container.theme = chat_theme(font_size)  # 공용 테마 1개만 변경 (row는 상속)
         page.update()
         _save_settings()
 
@@ -574,6 +639,48 @@ async def main(page: ft.Page):
         )
         page.show_dialog(font_dialog)
 
+    def show_metrics_dialog(e):
+        """워커 런타임 지표 (큐 깊이/생략 건수, 캐시 적중률 등) + 화면 갱신 지표"""
+        groups = worker.stats() if worker else {}
+        groups["render"] = render.stats()
+        groups["row_pool"] = row_pool.stats()
+        groups["emoji_layout"] = segment_cache.stats()
+        groups["spam_collapse"] = spam_collapser.stats()
+        groups["badge_images"] = badge_images.stats()
+        groups["emoji_images"] = emoji_images.stats()
+        groups["badge_disk"] = badge_disk.stats()
+        groups["emoji_disk"] = emoji_disk.stats()
+        groups["image_fetch"] = image_pool.stats()
+        groups["filter"] = chat_filter.stats()
+        lines = []
+        for group, values in groups.items():
+            lines.append(group)
+            for key, value in values.items():
+                if isinstance(value, dict):  # LatencyStats.summary() (ms)
+                    value = ", ".join(
+                        f"{k}={v:.1f}" if isinstance(v, float) else f"{k}={v}" for k, v in value.items()
+                    )
+                elif isinstance(value, float):
+                    value = f"{value:.3f}"
+                lines.append(f"  {key}: {value}")
+        body = "\n".join(lines)
+
+        metrics_dialog = ft.AlertDialog(
+            title=ft.Text("성능 지표"),
+            content=ft.Container(
+                content=ft.Text(body, size=12, font_family="monospace", selectable=True),
+                width=360,
+            ),
+            actions=[
+                ft.TextButton(
+                    "닫기",
+                    on_click=lambda ev: (setattr(metrics_dialog, "open", False), page.update()),
+                ),
+            ],
+            actions_alignment=ft.MainAxisAlignment.END,
+        )
+        page.show_dialog(metrics_dialog)
+
     def show_bug_report_dialog(e):
         sys_info = (
             f"OS: {platform.system()} {platform.release()}, "
@@ -662,13 +769,23 @@ async def main(page: ft.Page):
         )
         _rebuild_chat_list()
 
+    def _cancel_search_task():
+        nonlocal search_task
+        if search_task:
+            search_task.cancel()
+            search_task = None
+
     def clear_chat(e):
-        nonlocal search_query
-        all_items.clear()
+        nonlocal search_query, search_current
+        _cancel_search_task()
+        viewport.clear()
+        spam_collapser.clear()
         user_messages.clear()
-        chat_list.controls.clear()
         search_query = ""
+        search_current = None
         search_field.value = ""
+        chat_filter.set(donation_only, search_query)
+        _update_search_count()
         page.update()
 
     def toggle_search(e=None):
@@ -677,15 +794,56 @@ async def main(page: ft.Page):
         if search_row.visible:
             search_field.focus()
         else:
+            _cancel_search_task()
             search_query = ""
             search_field.value = ""
             _rebuild_chat_list()
         page.update()
 
-    def on_search_changed(e):
+    def _update_search_count():
+        """검색 결과 수 / 현재 위치 표시 (예: 3/120)"""
+        if not search_query:
+            search_count_text.value = ""
+        elif search_current is None:
+            search_count_text.value = f"{chat_filter.match_position(viewport.end_seq)[1]}건"
+        else:
+            search_count_text.value = "{}/{}".format(*chat_filter.match_position(search_current))
+
+    async def _apply_search(query: str):
+        """입력이 SEARCH_DEBOUNCE초 동안 멈추면 검색 (그 사이 새 입력이 오면 취소됨)"""
         nonlocal search_query
-        search_query = search_field.value or ""
+        await asyncio.sleep(SEARCH_DEBOUNCE)
+        search_query = query
         _rebuild_chat_list()
+        page.update()
+
+    def on_search_changed(e):
+        nonlocal search_task
+        _cancel_search_task()
+        search_task = page.run_task(_apply_search, search_field.value or "")
+
+    async def _step_search(step: int):
+        """검색 결과 이동 (step -1: 위/이전, +1: 아래/다음, 끝에서 순환) — 결과 목록만 이분 탐색"""
+        nonlocal search_current, at_bottom
+        if not search_query:
+            return
+        seq = chat_filter.step_match(search_current, step)
+        if seq is None:
+            return
+        search_current = seq
+        viewport.show_around(seq)
+        for widget in chat_list.controls:
+            widget.data.set_current(widget.data.seq == seq)
+        at_bottom = False
+        _update_search_count()
+        page.update()
+        await chat_list.scroll_to(scroll_key=ft.ScrollKey(seq), duration=0)
+
+    async def search_prev(e=None):
+        await _step_search(-1)
+
+    async def search_next(e=None):
+        await _step_search(1)
 
     async def on_keyboard_event(e: ft.KeyboardEvent):
         if e.ctrl and e.key == "F":
@@ -736,12 +894,27 @@ async def main(page: ft.Page):
         focused_border_color=ft.Colors.BLUE_400,
         text_size=13,
         on_change=on_search_changed,
+        on_submit=search_prev,
     )
+    search_count_text = ft.Text("", size=12, color=ft.Colors.GREY_500)
 
     search_row = ft.Row(
         controls=[
             ft.Icon(ft.Icons.SEARCH, size=16, color=ft.Colors.GREY_500),
             search_field,
+            search_count_text,
+            ft.IconButton(
+                icon=ft.Icons.KEYBOARD_ARROW_UP,
+                icon_size=16,
+                tooltip="이전 결과 (Enter)",
+                on_click=search_prev,
+            ),
+            ft.IconButton(
+                icon=ft.Icons.KEYBOARD_ARROW_DOWN,
+                icon_size=16,
+                tooltip="다음 결과",
+                on_click=search_next,
+            ),
             ft.IconButton(
                 icon=ft.Icons.CLOSE,
                 icon_size=16,
@@ -753,10 +926,24 @@ async def main(page: ft.Page):
         visible=False,
     )
 
-    def on_chat_list_scroll(e: ft.OnScrollEvent):
+    async def on_chat_list_scroll(e: ft.OnScrollEvent):
+        """구간 끝에 닿으면 버퍼에서 row를 더 올리고, 보던 row가 제자리에 오도록 다시 스크롤"""
         nonlocal at_bottom
         at_bottom = e.pixels >= e.max_scroll_extent - 10
 
+        if e.pixels <= e.min_scroll_extent + SCROLL_EDGE and viewport.has_older():
+            anchor = viewport.first_row_seq()
+            if viewport.load_older():
+                page.update()
+                await chat_list.scroll_to(scroll_key=ft.ScrollKey(anchor), duration=0)
+        elif at_bottom and not viewport.following:
+            anchor = viewport.last_row_seq()
+            if viewport.load_newer():
+                page.update()
+                await chat_list.scroll_to(scroll_key=ft.ScrollKey(anchor), duration=0)
+        elif not at_bottom and viewport.following:
+            viewport.following = False  # 위쪽을 읽는 중 — 새 메시지는 버퍼에만 쌓음
+
     # ── 채팅 표시 영역 ──
     chat_list = ft.ListView(
         expand=True,
@@ -765,6 +952,12 @@ async def main(page: ft.Page):
         padding=ft.Padding.symmetric(horizontal=10, vertical=5),
         on_scroll=on_chat_list_scroll,
     )
+    chat_filter = ChatFilter(MAX_BUFFER_MESSAGES)
+    viewport = ChatViewport(
+        chat_list.controls, _build_row,
+        capacity=MAX_BUFFER_MESSAGES, window=VIEWPORT_ROWS, page_size=VIEWPORT_PAGE,
+        release_row=_release_row, index=chat_filter,
+    )
 
     chat_container = ft.Container(
         content=chat_list,
@@ -772,6 +965,7 @@ async def main(page: ft.Page):
         border=ft.Border.all(1, ft.Colors.GREY_800),
         border_radius=4,
         bgcolor=ft.Colors.with_opacity(0.3, ft.Colors.BLACK),
+        theme=chat_theme(font_size),
     )
 
     # ── 메뉴바 ──
@@ -793,6 +987,12 @@ async def main(page: ft.Page):
         on_click=toggle_badges,
     )
 
+    collapse_menu_item = ft.MenuItemButton(
+        content=ft.Text("도배 합치기 ✓" if collapse_spam else "도배 합치기"),
+        leading=ft.Icon(ft.Icons.LAYERS, size=18),
+        on_click=toggle_collapse_spam,
+    )
+
     menubar = ft.MenuBar(
         controls=[
             ft.SubmenuButton(
@@ -804,11 +1004,16 @@ async def main(page: ft.Page):
                         leading=ft.Icon(ft.Icons.DELETE_SWEEP, size=18),
                         on_click=clear_chat,
                     ),
+                    ft.MenuItemButton(
+                        content=ft.Text("이미지 캐시 정리"),
+                        leading=ft.Icon(ft.Icons.CLEANING_SERVICES, size=18),
+                        on_click=show_cache_maintenance,
+                    ),
                     ft.Divider(height=1),
                     ft.MenuItemButton(
                         content=ft.Text("종료"),
                         leading=ft.Icon(ft.Icons.EXIT_TO_APP, size=18),
-                        on_click=lambda e: page.window.close(),
+                        on_click=exit_app,
                     ),
                 ],
             ),
@@ -823,11 +1028,17 @@ async def main(page: ft.Page):
                     ft.Divider(height=1),
                     timestamp_menu_item,
                     badge_menu_item,
+                    collapse_menu_item,
                 ],
             ),
             ft.SubmenuButton(
                 content=ft.Text("도움말", size=13),
                 controls=[
+                    ft.MenuItemButton(
+                        content=ft.Text("성능 지표"),
+                        leading=ft.Icon(ft.Icons.SPEED, size=18),
+                        on_click=show_metrics_dialog,
+                    ),
                     ft.MenuItemButton(
                         content=ft.Text("버그 리포트"),
                         leading=ft.Icon(ft.Icons.BUG_REPORT, size=18),
@@ -867,4 +1078,5 @@ async def main(page: ft.Page):
     )
 
 
-ft.run(main)
+if __name__ == "__main__":
+    ft.run(main)
@@ -0,0 +1,47 @@
+"""성능 측정 헬퍼
+
+리플레이 벤치마크와 런타임 지표(큐 깊이, 캐시 적중률 등)에서 공통으로 사용.
+샘플은 최근 max_samples개만 보관하므로 장시간 실행해도 메모리가 늘지 않는다.
+"""
+
+from collections import deque
+
+
+class LatencyStats:
+    """지연 시간 샘플(초) 수집 + 백분위 계산"""
+
+    def __init__(self, max_samples: int = 100_000):
+        self._samples: deque[float] = deque(maxlen=max_samples)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds: float):
+        self._samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, p: float) -> float:
+        """nearest-rank 백분위 (p: 0~100). 샘플이 없으면 0.0"""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        idx = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+        return ordered[idx]
+
+    def summary(self) -> dict:
+        """count/mean/p50/p95/p99/max (ms 단위)"""
+        if not self._samples:
+            return {'count': 0, 'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+        return {
+            'count': self.count,
+            'mean': self.total / self.count * 1000,
+            'p50': self.percentile(50) * 1000,
+            'p95': self.percentile(95) * 1000,
+            'p99': self.percentile(99) * 1000,
+            'max': max(self._samples) * 1000,
+        }
+
+    def reset(self):
+        self._samples.clear()
+        self.count = 0
+        self.total = 0.0
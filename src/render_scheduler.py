@@ -0,0 +1,82 @@
+"""화면 갱신 스케줄러 (초당 최대 fps회)
+
+메시지가 들어올 때마다 page.update() + scroll_to()를 보내면 초당 수십 번 Flet 클라이언트로
+diff가 나간다. 대신 request()로 "갱신 필요"만 표시해 두고, 직전 갱신에서 1/fps초가 지난
+시점에 한 번 flush한다 — 그 사이의 추가/축출/visible 변경은 한 번의 update에 합쳐진다.
+한동안 갱신이 없었으면(idle) 다음 루프 틱에 바로 flush한다.
+
+flush(scroll)는 page.update()와 (scroll이면) 맨 아래 스크롤을 하는 async 콜백.
+"""
+
+import asyncio
+import logging
+import time
+
+from perf_stats import LatencyStats
+
+logger = logging.getLogger(__name__)
+
+
+class RenderScheduler:
+    def __init__(self, flush, fps: float = 30):
+        if fps <= 0:
+            raise ValueError('fps는 0보다 커야 합니다')
+        self.flush = flush
+        self.interval = 1 / fps
+        self._task: asyncio.Task | None = None
+        self._dirty = False
+        self._scroll = False
+        self._last_flush = float('-inf')
+        self.requests = 0
+        self.flushes = 0
+        self.merged = 0     # 이미 예약된 flush에 합쳐진 요청
+        self.overruns = 0   # flush가 프레임 간격보다 오래 걸린 횟수
+        self.failures = 0
+        self.flush_stats = LatencyStats(max_samples=10_000)
+
+    def request(self, scroll: bool = False):
+        """갱신 요청 (scroll: flush 때 맨 아래로 스크롤)"""
+        self.requests += 1
+        self._dirty = True
+        self._scroll |= scroll
+        if self._task is not None and not self._task.done():
+            self.merged += 1
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        while self._dirty:
+            delay = self._last_flush + self.interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            # flush 도중 들어온 요청은 다시 dirty로 남아 다음 프레임에 반영
+            self._dirty = False
+            scroll, self._scroll = self._scroll, False
+            start = self._last_flush = time.perf_counter()
+            try:
+                await self.flush(scroll)
+            except Exception:
+                self.failures += 1
+                logger.warning('화면 갱신 실패', exc_info=True)
+            elapsed = time.perf_counter() - start
+            self.flushes += 1
+            self.flush_stats.add(elapsed)
+            if elapsed > self.interval:
+                self.overruns += 1
+
+    async def drain(self):
+        """예약된 flush가 끝날 때까지 대기"""
+        while self._task is not None and not self._task.done():
+            await self._task
+
+    def stats(self) -> dict:
+        return {
+            'fps': round(1 / self.interval),
+            'requests': self.requests,
+            'flushes': self.flushes,
+            'merged': self.merged,
+            'overruns': self.overruns,
+            'failures': self.failures,
+            'flush': self.flush_stats.summary(),
+        }
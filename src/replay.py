@@ -0,0 +1,182 @@
+"""캡처 파일 재생 + 처리량 벤치마크
+
+FrameRecorder로 저장한 원본 프레임을 라이브 연결 없이 ChatWorker와 같은 파싱 경로
+(_handle_frame → _parse_chat_data → 콜백)로 흘려보낸다.
+
+- 앱에서: .env에 REPLAY_PATH(+ REPLAY_SPEED)를 설정하면 연결 버튼이 캡처 재생으로 동작
+  → main.py의 on_chat_received까지 실제 UI 경로로 측정
+- 터미널에서 (UI 없이 워커 단독 측정):
+    python src/replay.py capture/xxx.chzcap --speed max
+    python src/replay.py capture/xxx.chzcap --speed 4
+
+단계별 지연 시간:
+    decode   프레임 JSON 디코드
+    parse    chat_data → ChatMessage 변환
+    callback on_chat 콜백 1회 (앱에서는 UI 렌더링, on_chat_batch면 프레임 1개분)
+    e2e      프레임 수신 ~ 해당 메시지 콜백 완료
+
+재생은 프레임 단위로 전달한다 (batch_window 없이) — e2e가 프레임 기준으로 정확하도록.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+from chat_worker import ChatWorker
+from frame_capture import read_frames
+from perf_stats import LatencyStats
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('decode', 'parse', 'callback', 'e2e')
+
+
+def parse_speed(value) -> float:
+    """'max' / '0' → 0.0 (대기 없음), 그 외 배속 숫자"""
+    if value in (None, '', 'max'):
+        return 0.0
+    speed = float(value)
+    if speed < 0:
+        raise ValueError('speed는 0 이상이어야 합니다')
+    return speed
+
+
+class ReplayWorker(ChatWorker):
+    """캡처 파일을 읽어 ChatWorker 파싱 경로로 재생하는 워커
+
+    speed: 1.0 = 실시간, N = N배속, 0 = 대기 없이 최대 속도
+    """
+
+    def __init__(self, path, on_chat_receive_callback, on_status_callback, speed: float = 1.0,
+                 on_chat_batch=None, time_formatter=None):
+        super().__init__(
+            None, {}, self._timed(on_chat_receive_callback, 1), on_status_callback,
+            on_chat_batch=self._timed(on_chat_batch, None) if on_chat_batch else None,
+            time_formatter=time_formatter,
+        )
+        self.path = path
+        self.speed = speed
+        self.channelName = os.path.basename(path)
+        self.stage_stats = {stage: LatencyStats() for stage in STAGES}
+        self.frame_count = 0
+        self.message_count = 0
+        self.elapsed = 0.0
+        self._frame_start = 0.0
+
+    async def connect_chat(self):
+        self.on_status_callback(f'{self.channelName} 채팅창 연결 완료 (재생)')
+
+    async def run(self):
+        try:
+            await self.connect_chat()
+            frames = read_frames(self.path)
+        except Exception as e:
+            self.on_status_callback(f'연결 실패: {str(e)}')
+            return
+
+        wall_start = time.perf_counter()
+        try:
+            for frame_time, payload in frames:
+                if not self.running:
+                    break
+                if self.speed > 0:
+                    delay = wall_start + frame_time / self.speed - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                self._frame_start = time.perf_counter()
+                self.frame_count += 1
+                try:
+                    await self._handle_frame(payload)
+                except Exception:
+                    logger.warning('프레임 처리 실패 (#%d)', self.frame_count, exc_info=True)
+        except Exception as e:
+            self.on_status_callback(f'재생 중단: {str(e)}')
+        finally:
+            self.elapsed = time.perf_counter() - wall_start
+            self.running = False
+
+        self.on_status_callback(f'재생 완료 — {self.summary_line()}')
+
+    def _decode_frame(self, raw_message):
+        start = time.perf_counter()
+        decoded = super()._decode_frame(raw_message)
+        self.stage_stats['decode'].add(time.perf_counter() - start)
+        return decoded
+
+    async def _on_ping(self):
+        pass  # 재생 중에는 pong 불필요
+
+    def _parse_chat_data(self, chat_data, chat_type):
+        start = time.perf_counter()
+        parsed = super()._parse_chat_data(chat_data, chat_type)
+        self.stage_stats['parse'].add(time.perf_counter() - start)
+        return parsed
+
+    def _timed(self, callback, count):
+        """콜백 소요 시간 + 메시지별 e2e 기록용 래퍼 (count=None이면 batch list 길이)"""
+        async def wrapper(payload):
+            start = time.perf_counter()
+            await callback(payload)
+            done = time.perf_counter()
+            n = len(payload) if count is None else count
+            self.stage_stats['callback'].add(done - start)
+            for _ in range(n):
+                self.stage_stats['e2e'].add(done - self._frame_start)
+            self.message_count += n
+        return wrapper
+
+    def throughput(self) -> float:
+        """초당 처리 메시지 수"""
+        return self.message_count / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary_line(self) -> str:
+        e2e = self.stage_stats['e2e'].summary()
+        return (
+            f'{self.message_count}건 / {self.elapsed:.2f}s, '
+            f'{self.throughput():.0f} msg/s, e2e p99 {e2e["p99"]:.2f}ms'
+        )
+
+    def report(self) -> str:
+        """단계별 지연 시간 표 (ms)"""
+        lines = [
+            f'frames={self.frame_count} messages={self.message_count} '
+            f'elapsed={self.elapsed:.3f}s throughput={self.throughput():.1f} msg/s',
+            'profile cache: hit_rate={hit_rate:.1%} hits={hits} misses={misses} size={size}'.format(
+                **self.profile_cache.stats()
+            ),
+            f'{"stage":<10}{"count":>9}{"mean":>10}{"p50":>10}{"p95":>10}{"p99":>10}{"max":>10}',
+        ]
+        for stage in STAGES:
+            s = self.stage_stats[stage].summary()
+            lines.append(
+                f'{stage:<10}{s["count"]:>9}{s["mean"]:>10.3f}{s["p50"]:>10.3f}'
+                f'{s["p95"]:>10.3f}{s["p99"]:>10.3f}{s["max"]:>10.3f}'
+            )
+        return '\n'.join(lines)
+
+
+async def _replay_headless(path: str, speed: float) -> ReplayWorker:
+    async def on_chat(chat_data):
+        pass
+
+    worker = ReplayWorker(path, on_chat, lambda msg: logger.info(msg), speed=speed)
+    await worker.run()
+    return worker
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Chzzk 캡처 파일 재생 벤치마크')
+    parser.add_argument('path', help='FrameRecorder 캡처 파일')
+    parser.add_argument('--speed', default='max', help="재생 배속 (1, 4, ... 또는 'max')")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    worker = asyncio.run(_replay_headless(args.path, parse_speed(args.speed)))
+    print(worker.report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""n-gram 역색인 (검색어 → 메시지 seq 후보)
+
+한글은 공백 단위 토큰화가 잘 맞지 않으므로(조사·붙여쓰기) 글자 n-gram(기본 2글자)을 색인한다.
+메시지마다 키의 n-gram 집합을 만들어 gram → seq 목록(posting, 오름차순)에 추가한다.
+
+검색어를 포함하는 메시지는 검색어의 모든 n-gram posting에 들어 있으므로, 그중 가장 짧은
+posting이 후보 전체가 된다. 후보마다 키 포함 검사 1번으로 나머지 posting과의 교집합 +
+연속 여부를 한꺼번에 확정한다 (posting마다 이분 탐색하는 것보다 빠름).
+비용은 버퍼 길이가 아니라 가장 짧은 posting 길이에 비례한다.
+
+- 검색어가 n글자보다 짧으면 candidates()는 None (호출 쪽에서 다른 후보 사용)
+- 축출된 seq는 posting 앞부분에 모이므로 compact(first_seq)로 한 번에 잘라냄
+"""
+
+from bisect import bisect_left
+
+NGRAM = 2
+
+EMPTY: list[int] = []
+
+
+def ngrams(text: str, n: int = NGRAM) -> set[str]:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class NgramIndex:
+    def __init__(self, n: int = NGRAM):
+        self.n = n
+        self._postings: dict[str, list[int]] = {}
+        self.lookups = 0
+
+    def __len__(self):
+        return len(self._postings)
+
+    def add(self, seq: int, key: str):
+        """seq는 이전에 추가한 것보다 커야 함 (posting 오름차순 유지)"""
+        postings = self._postings
+        for gram in ngrams(key, self.n):
+            posting = postings.get(gram)
+            if posting is None:
+                postings[gram] = [seq]
+            else:
+                posting.append(seq)
+
+    def candidates(self, query: str) -> list[int] | None:
+        """query를 포함할 수 있는 seq 오름차순 (가장 짧은 posting — 축출된 seq가 앞에 남아 있을 수 있음)
+
+        검색어가 n글자 미만이면 None. 반환 목록은 색인 내부 목록이므로 수정하지 말 것.
+        """
+        if len(query) < self.n:
+            return None
+        self.lookups += 1
+        shortest = None
+        for gram in ngrams(query, self.n):
+            posting = self._postings.get(gram)
+            if not posting:
+                return EMPTY
+            if shortest is None or len(posting) < len(shortest):
+                shortest = posting
+        return shortest
+
+    def compact(self, first_seq: int):
+        """first_seq보다 오래된(축출된) seq를 모든 posting에서 제거, 빈 gram은 삭제"""
+        postings = self._postings
+        for gram in list(postings):
+            posting = postings[gram]
+            i = bisect_left(posting, first_seq)
+            if i == len(posting):
+                del postings[gram]
+            elif i:
+                del posting[:i]
+
+    def clear(self):
+        self._postings.clear()
+
+    def stats(self) -> dict:
+        return {
+            'grams': len(self._postings),
+            'postings': sum(len(posting) for posting in self._postings.values()),
+            'lookups': self.lookups,
+        }
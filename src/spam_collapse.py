@@ -0,0 +1,66 @@
+"""도배 합치기
+
+최근 window개 row 안에 같은(정규화 후 같은) 메시지가 있으면 새 row를 만들지 않고 그 row의
+"×N" 카운터만 올린다. 이모지 도배가 버퍼와 화면 구간을 밀어내지 않는다.
+유저별 기록과 채팅 로그는 합치기와 무관하게 모든 메시지를 남긴다 (main.py에서 먼저 기록).
+
+정규화: 공백 정리 + casefold + 연속 반복 이모지는 1개로, 같은 글자 3번 이상 반복은 2번으로
+    "ㅋㅋㅋㅋㅋ" == "ㅋㅋㅋ", "{:d_94:}{:d_94:}" == "{:d_94:}"
+"""
+
+import re
+
+COLLAPSE_WINDOW = 50
+
+_SPACES = re.compile(r"\s+")
+_EMOJI_RUN = re.compile(r"(\{:[^:]+:\})\1+")
+_CHAR_RUN = re.compile(r"(.)\1{2,}")
+
+
+def normalize(message: str) -> str:
+    text = _SPACES.sub(" ", message).strip().casefold()
+    text = _EMOJI_RUN.sub(r"\1", text)
+    return _CHAR_RUN.sub(r"\1\1", text)
+
+
+class SpamCollapser:
+    def __init__(self, window: int = COLLAPSE_WINDOW):
+        self.window = window
+        self._recent: dict[str, int] = {}  # 정규화 메시지 → 카운터 row seq (seq 오름차순 = 삽입 순)
+        self.counts: dict[int, int] = {}   # 카운터 row seq → 합쳐진 메시지 수 (2 이상만)
+        self.merged = 0
+
+    def add(self, message: str, first_seq: int, end_seq: int) -> int | None:
+        """메시지 1건 판정
+
+        first_seq / end_seq: 버퍼의 가장 오래된 seq / 다음에 추가될 seq
+        반환: 합쳐진 카운터 row의 seq (새 row를 만들지 않음), None이면 end_seq로 새 row 추가
+        """
+        recent = self._recent
+        while recent:
+            oldest = next(iter(recent))
+            if recent[oldest] >= end_seq - self.window:
+                break
+            del recent[oldest]
+        counts = self.counts
+        while counts:
+            oldest = next(iter(counts))
+            if oldest >= first_seq:
+                break
+            del counts[oldest]
+
+        key = normalize(message)
+        seq = recent.get(key)
+        if seq is None:
+            recent[key] = end_seq
+            return None
+        counts[seq] = counts.get(seq, 1) + 1
+        self.merged += 1
+        return seq
+
+    def clear(self):
+        self._recent.clear()
+        self.counts.clear()
+
+    def stats(self) -> dict:
+        return {'window': self.window, 'rows': len(self.counts), 'merged': self.merged}
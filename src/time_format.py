@@ -0,0 +1,74 @@
+"""채팅 시각 표시 문자열 캐시
+
+메시지마다 datetime.fromtimestamp().strftime()을 호출하는 대신 epoch 초 단위로
+포맷 결과를 캐시한다. 채팅이 몰릴 때는 수백 건이 같은 초를 공유하므로 대부분
+직전 초와 비교 한 번으로 끝난다.
+
+원본 msgTime(ms)은 ChatMessage.msg_time에 그대로 보관 → 정렬/지연 계산은 이 값으로.
+"""
+
+import datetime
+import time
+
+DEFAULT_TIME_FORMAT = '%H:%M:%S'
+
+
+def now_ms() -> int:
+    """msgTime이 없는 메시지용 현재 시각 (epoch ms)"""
+    return time.time_ns() // 1_000_000
+
+
+def _check_format(fmt: str) -> str:
+    if '%f' in fmt:
+        raise ValueError('초 미만 단위(%f)는 지원하지 않습니다')
+    return fmt
+
+
+class TimeFormatter:
+    """epoch ms → 표시 문자열 (초 단위 캐시)
+
+    fmt는 strftime 형식. 초 미만 단위(%f)는 캐시 키가 초라서 지원하지 않는다.
+    """
+
+    def __init__(self, fmt: str = DEFAULT_TIME_FORMAT, maxsize: int = 4096):
+        self.fmt = _check_format(fmt)
+        self.maxsize = maxsize
+        self._cache: dict[int, str] = {}
+        self._last_second = None
+        self._last_text = ''
+        self.hits = 0
+        self.misses = 0
+
+    def format(self, msg_time_ms: int) -> str:
+        second = msg_time_ms // 1000
+        if second == self._last_second:
+            self.hits += 1
+            return self._last_text
+
+        text = self._cache.get(second)
+        if text is None:
+            self.misses += 1
+            text = datetime.datetime.fromtimestamp(second).strftime(self.fmt)
+            if len(self._cache) >= self.maxsize:
+                self._cache.clear()  # 시각은 거의 단조 증가 → 오래된 초는 다시 쓰이지 않음
+            self._cache[second] = text
+        else:
+            self.hits += 1
+
+        self._last_second = second
+        self._last_text = text
+        return text
+
+    def set_format(self, fmt: str):
+        """표시 형식 변경 (이후 파싱되는 메시지부터 적용)"""
+        self.fmt = _check_format(fmt)
+        self._cache.clear()
+        self._last_second = None
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            'format': self.fmt,
+            'size': len(self._cache),
+            'hit_rate': self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,126 @@
+"""api.py: 공용 HTTP 클라이언트 재시도/쿠키/파싱 테스트 (httpx.MockTransport, 네트워크 없음)"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import api
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(api, 'BACKOFF', 0)
+
+
+def serve(responses):
+    """응답(또는 예외)을 순서대로 돌려주는 MockTransport + 받은 요청 목록"""
+    requests = []
+    responses = list(responses)
+
+    def handler(request):
+        requests.append(request)
+        item = responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return httpx.MockTransport(handler), requests
+
+
+def live_status(chat_channel_id):
+    return httpx.Response(200, json={'content': {'chatChannelId': chat_channel_id}})
+
+
+def run_async(transport, coro_fn):
+    async def scenario():
+        api._async_client = httpx.AsyncClient(transport=transport)
+        api._async_loop = asyncio.get_running_loop()
+        try:
+            return await coro_fn()
+        finally:
+            await api.aclose()
+
+    return asyncio.run(scenario())
+
+
+def test_async_fetch_sends_cookie_header():
+    transport, requests = serve([live_status('ch-1')])
+    result = run_async(transport, lambda: api.fetch_chatChannelId_async('uid', {'NID_AUT': 'a', 'NID_SES': 'b'}))
+
+    assert result == 'ch-1'
+    assert requests[0].headers['Cookie'] == 'NID_AUT=a; NID_SES=b'
+    assert requests[0].url.path == '/polling/v2/channels/uid/live-status'
+
+
+def test_async_retries_transport_error_and_5xx():
+    transport, requests = serve([
+        httpx.ConnectError('reset'),
+        httpx.Response(503),
+        live_status('ch-1'),
+    ])
+    assert run_async(transport, lambda: api.fetch_chatChannelId_async('uid', {})) == 'ch-1'
+    assert len(requests) == 3
+
+
+def test_async_gives_up_after_retries():
+    transport, requests = serve([httpx.Response(502)] * (api.RETRIES + 1))
+    with pytest.raises(httpx.HTTPStatusError):
+        run_async(transport, lambda: api.fetch_channelName_async('uid'))
+    assert len(requests) == api.RETRIES + 1
+
+
+def test_client_error_not_retried():
+    transport, requests = serve([httpx.Response(404)])
+    with pytest.raises(httpx.HTTPStatusError):
+        run_async(transport, lambda: api.fetch_channelName_async('uid'))
+    assert len(requests) == 1
+
+
+def test_offline_raises_value_error():
+    transport, _ = serve([live_status(None)])
+    with pytest.raises(ValueError):
+        run_async(transport, lambda: api.fetch_chatChannelId_async('uid', {}))
+
+
+def test_async_client_reused_within_loop():
+    async def scenario():
+        first = await api._get_async_client()
+        second = await api._get_async_client()
+        await api.aclose()
+        return first is second
+
+    assert asyncio.run(scenario())
+
+
+def test_async_client_closed_when_loop_changes():
+    async def create():
+        return await api._get_async_client()
+
+    first = asyncio.run(create())
+
+    async def recreate():
+        client = await api._get_async_client()
+        await api.aclose()
+        return client
+
+    second = asyncio.run(recreate())
+    assert second is not first
+    assert first.is_closed
+    assert api._async_client is None
+
+
+def test_sync_wrapper(monkeypatch):
+    transport, requests = serve([
+        httpx.Response(500),
+        httpx.Response(200, json={'content': {'accessToken': 'acc', 'extraToken': 'extra'}}),
+    ])
+    monkeypatch.setattr(api, '_client', httpx.Client(transport=transport))
+
+    assert api.fetch_accessToken('ch-1', {}) == ('acc', 'extra')
+    assert 'Cookie' not in requests[-1].headers
+    assert requests[-1].url.params['channelId'] == 'ch-1'
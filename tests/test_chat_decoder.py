@@ -0,0 +1,118 @@
+"""chat_decoder 백엔드 테스트 — 설치된 모든 백엔드가 같은 결과를 내야 함"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from chat_decoder import ProfileCache, ProfileFields, available_backends, get_decoder
+
+PROFILE = {
+    'userIdHash': 'abc',
+    'nickname': '반밤',
+    'userRoleCode': 'common_user',
+    'badge': None,
+    'activityBadges': [
+        {'badgeNo': 1, 'imageUrl': 'https://fan_03.png', 'activated': True},
+        {'badgeNo': 2, 'imageUrl': 'https://off.png', 'activated': False},
+    ],
+    'streamingProperty': {
+        'subscription': {'accumulativeMonth': 29, 'tier': 1, 'badge': {'imageUrl': 'https://sub/24.png'}},
+        'nicknameColor': {'colorCode': 'SG001'},
+        'activatedAchievementBadgeIds': [],
+    },
+    'viewerBadges': [],
+}
+
+EXPECTED = ProfileFields(
+    nickname='반밤',
+    user_role='common_user',
+    color_code='SG001',
+    badges=('https://sub/24.png', 'https://fan_03.png'),
+    subscription_month=29,
+    subscription_tier=1,
+)
+
+
+@pytest.fixture(params=available_backends())
+def decoder(request):
+    return get_decoder(request.param)
+
+
+def test_profile(decoder):
+    assert decoder.profile(json.dumps(PROFILE)) == EXPECTED
+
+
+def test_profile_minimal(decoder):
+    profile = decoder.profile(json.dumps({'nickname': '알리체', 'streamingProperty': {}}))
+    assert profile.nickname == '알리체'
+    assert profile.badges == ()
+    assert profile.color_code is None
+
+
+def test_profile_without_nickname_raises(decoder):
+    with pytest.raises(Exception):
+        decoder.profile(json.dumps({'userRoleCode': 'common_user'}))
+
+
+def test_profile_unexpected_types_fallback(decoder):
+    profile = dict(PROFILE, userRoleCode=3)
+    assert decoder.profile(json.dumps(profile)).user_role == 3
+
+
+def test_extras(decoder):
+    emojis, os_type = decoder.extras('{"osType":"PC","emojis":{"d_44":"https://b_04.gif"},"extraToken":"x"}')
+    assert emojis == {'d_44': 'https://b_04.gif'}
+    assert os_type == 'PC'
+
+
+def test_loads_bytes(decoder):
+    frame = decoder.loads('{"cmd":93101,"bdy":[{"msg":"헉"}]}'.encode('utf-8'))
+    assert frame['cmd'] == 93101
+    assert frame['bdy'][0]['msg'] == '헉'
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_decoder('nope')
+
+
+def test_json_always_available():
+    assert available_backends()[-1] == 'json'
+
+
+def test_only_fast_backends_want_bytes():
+    assert get_decoder('json').wants_bytes is False
+    for name in available_backends()[:-1]:
+        assert get_decoder(name).wants_bytes is True
+
+
+def test_profile_cache_lru():
+    decoder = get_decoder('json')
+    cache = ProfileCache(maxsize=2)
+    raw_a = json.dumps(dict(PROFILE, nickname='a'))
+    raw_b = json.dumps(dict(PROFILE, nickname='b'))
+    raw_c = json.dumps(dict(PROFILE, nickname='c'))
+
+    assert cache.profile('u1', raw_a, decoder).nickname == 'a'
+    assert cache.profile('u1', raw_a, decoder) is cache.profile('u1', raw_a, decoder)
+    cache.profile('u2', raw_b, decoder)
+    cache.profile('u1', raw_a, decoder)
+    cache.profile('u3', raw_c, decoder)  # u2 제거 (u1은 최근 사용)
+
+    assert cache.stats()['size'] == 2
+    hits = cache.hits
+    cache.profile('u1', raw_a, decoder)
+    assert cache.hits == hits + 1
+    cache.profile('u2', raw_b, decoder)
+    assert cache.misses == 4
+
+
+def test_profile_cache_does_not_store_failures():
+    cache = ProfileCache()
+    with pytest.raises(Exception):
+        cache.profile('u1', 'not-json', get_decoder('json'))
+    assert cache.stats()['size'] == 0
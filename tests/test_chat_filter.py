@@ -0,0 +1,196 @@
+"""chat_filter.py: 증분 필터 엔진(ChatFilter) 테스트"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from chat_filter import ChatFilter
+from chat_message import ChatMessage
+from chat_view import ChatViewport
+
+
+def make_chat(i, nickname=None, message=None, is_donation=False):
+    return ChatMessage(
+        time='00:00:00', type='후원' if is_donation else '채팅', uid=f'uid{i}',
+        nickname=nickname or f'User{i}', message=message or f'msg {i}',
+    )
+
+
+def make_filter(chats, capacity=1000):
+    chat_filter = ChatFilter(capacity)
+    for seq, chat in enumerate(chats):
+        chat_filter.add(seq, chat)
+    return chat_filter
+
+
+def test_no_filter_passes_everything():
+    chat_filter = make_filter([make_chat(i) for i in range(5)])
+
+    assert chat_filter.seqs() is None
+    assert chat_filter.add(5, make_chat(5))
+    assert not chat_filter.set(False, '')
+
+
+def test_search_is_case_insensitive_on_nickname_and_message():
+    chat_filter = make_filter([
+        make_chat(0, nickname='Alice'),
+        make_chat(1, message='hello ALICE'),
+        make_chat(2, nickname='Bob'),
+    ])
+
+    assert chat_filter.set(False, 'aLiCe')
+    assert chat_filter.seqs() == [0, 1]
+    assert chat_filter.add(3, make_chat(3, message='alice again'))
+    assert not chat_filter.add(4, make_chat(4))
+    assert chat_filter.seqs() == [0, 1, 3]
+
+
+def test_single_char_query_scans_then_narrows():
+    chat_filter = make_filter([make_chat(i, is_donation=(i % 4 == 0)) for i in range(100)])
+
+    chat_filter.set(False, '7')
+    assert chat_filter.full_scans == 1 and chat_filter.scanned == 100
+    chat_filter.set(True, '7')
+
+    assert chat_filter.full_scans == 1
+    assert chat_filter.narrowed == 1
+    assert chat_filter.seqs() == [72, 76]
+
+
+def test_longer_query_uses_ngram_index():
+    chat_filter = make_filter([make_chat(i, message=f'abc {i}' if i % 2 else 'xyz') for i in range(100)])
+
+    chat_filter.set(False, 'ab')
+    chat_filter.set(False, 'abc 1')
+
+    assert chat_filter.full_scans == 0
+    assert chat_filter.indexed == 2
+    assert chat_filter.seqs() == [1] + list(range(11, 20, 2))
+    # 'abc 1'의 2-gram은 모두 있지만 이어지지 않는 메시지는 제외
+    chat_filter.add(100, make_chat(100, message='abc c 1'))
+    chat_filter.set(False, 'abc')
+    chat_filter.set(False, 'abc 1')
+    assert 100 not in chat_filter.seqs()
+
+
+def test_hangul_query():
+    chat_filter = make_filter([
+        make_chat(0, message='안녕하세요'),
+        make_chat(1, message='하세요 안녕'),
+        make_chat(2, nickname='세요맨', message='ㅋㅋ'),
+    ])
+
+    chat_filter.set(False, '하세요')
+    assert chat_filter.seqs() == [0, 1]
+    chat_filter.set(False, '세요')
+    assert chat_filter.seqs() == [0, 1, 2]
+
+
+def test_step_match_wraps_around():
+    chat_filter = make_filter([make_chat(i) for i in range(30)])
+    chat_filter.set(False, 'user1')  # 1, 10~19
+
+    assert chat_filter.step_match(None, -1) == 19
+    assert chat_filter.step_match(19, -1) == 18
+    assert chat_filter.step_match(10, -1) == 1
+    assert chat_filter.step_match(1, -1) == 19
+    assert chat_filter.step_match(19, 1) == 1
+    assert chat_filter.match_position(10) == (2, 11)
+
+    chat_filter.set(False, '')
+    assert chat_filter.step_match(None, 1) is None
+
+
+def test_step_match_skips_evicted_results():
+    chat_filter = make_filter([make_chat(i) for i in range(16)], capacity=16)
+    chat_filter.set(False, 'user1')  # 1, 10~15
+    for seq in range(16, 27):  # 0~10 축출 (통과 목록 정리 전)
+        chat_filter.add(seq, make_chat(seq, nickname='x'))
+    assert chat_filter.first_seq == 11
+
+    # 현재 결과가 축출됐으면 다음은 남은 가장 오래된 결과
+    assert chat_filter.step_match(1, 1) == 11
+    assert chat_filter.step_match(10, 1) == 11
+    assert chat_filter.step_match(11, -1) == 15
+    assert chat_filter.match_position(11) == (1, 5)
+
+
+def test_clear_after_eviction_resets_length():
+    chat_filter = make_filter([make_chat(i) for i in range(105)], capacity=100)  # 축출 5건, 정리 전
+    chat_filter.clear()
+
+    assert len(chat_filter) == 0
+    assert chat_filter.stats()['matches'] == 0
+    chat_filter.add(105, make_chat(105))
+    assert len(chat_filter) == 1 and chat_filter.first_seq == 105
+
+
+def test_donation_only_uses_donation_index():
+    chats = [make_chat(i, is_donation=(i % 10 == 0)) for i in range(100)]
+    chat_filter = make_filter(chats)
+
+    chat_filter.set(True, '')
+    assert chat_filter.seqs() == list(range(0, 100, 10))
+    chat_filter.set(True, 'user5')
+    assert chat_filter.seqs() == [50]
+    # 검색어를 지우면(넓힘) 버퍼 전체 대신 후원 목록만 검사
+    chat_filter.set(True, '')
+    assert chat_filter.scanned == 10
+    assert chat_filter.seqs() == list(range(0, 100, 10))
+
+    chat_filter.set(False, '')
+    assert chat_filter.seqs() is None
+
+
+def test_eviction_compacts_lists():
+    chat_filter = ChatFilter(capacity=8)
+    chat_filter.set(True, '')
+    for seq in range(40):
+        chat_filter.add(seq, make_chat(seq, is_donation=True))
+
+    assert chat_filter.seqs()[-1] == 39
+    assert len(chat_filter.seqs()) < 16
+    assert chat_filter.stats()['index']['postings'] < 16 * 20
+    chat_filter.set(True, 'user')
+    assert chat_filter.seqs() == list(range(32, 40))
+    chat_filter.set(False, 'user3')
+    assert chat_filter.seqs() == list(range(32, 40))
+    assert chat_filter.step_match(32, -1) == 39
+
+
+def test_clear_keeps_filter_and_seq_alignment():
+    chat_filter = make_filter([make_chat(i) for i in range(5)])
+    chat_filter.set(False, 'user')
+    chat_filter.clear()
+
+    assert chat_filter.seqs() == []
+    assert chat_filter.add(5, make_chat(5))
+    assert chat_filter.seqs() == [5]
+    chat_filter.set(False, 'user5')
+    assert chat_filter.seqs() == [5]
+
+
+def test_viewport_integration_large_buffer():
+    count = 20_000
+    chat_filter = ChatFilter(count)
+    controls = []
+    viewport = ChatViewport(controls, lambda seq, entry: seq, capacity=count,
+                            window=150, page_size=50, index=chat_filter)
+    for i in range(count):
+        viewport.append(make_chat(i, is_donation=(i % 100 == 0)))
+
+    start = time.perf_counter()
+    for query in ('u', 'us', 'use', 'user', 'user1', 'user19'):
+        chat_filter.set(False, query)
+        viewport.refresh()
+    elapsed = time.perf_counter() - start
+
+    expected = [i for i in range(count) if 'user19' in f'user{i}']
+    assert controls == expected[-150:]
+    assert elapsed < 1.0
+
+    chat_filter.set(True, '')
+    viewport.refresh()
+    assert controls == list(range(0, count, 100))[-150:]
@@ -0,0 +1,129 @@
+"""ChatQueue (수신/렌더링 분리 큐) 테스트"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from chat_queue import ChatQueue
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_get_batch_returns_in_order():
+    async def go():
+        q = ChatQueue(maxsize=10)
+        await q.put([1, 2])
+        await q.put([3])
+        return await q.get_batch()
+
+    assert run(go()) == (0, [1, 2, 3])
+
+
+def test_get_batch_max_items():
+    async def go():
+        q = ChatQueue(maxsize=10)
+        await q.put(list(range(5)))
+        first = await q.get_batch(max_items=3)
+        second = await q.get_batch(max_items=3)
+        return first, second
+
+    assert run(go()) == ((0, [0, 1, 2]), (0, [3, 4]))
+
+
+def test_drop_oldest():
+    dropped = []
+
+    async def go():
+        q = ChatQueue(maxsize=3, policy='drop_oldest', on_drop=dropped.extend)
+        await q.put([1, 2, 3, 4, 5])
+        return q, await q.get_batch()
+
+    q, batch = run(go())
+    assert batch == (0, [3, 4, 5])
+    assert dropped == [1, 2]
+    assert q.stats()['dropped'] == 2
+    assert q.stats()['max_depth'] == 3
+
+
+def test_summarize_reports_skipped_count():
+    async def go():
+        q = ChatQueue(maxsize=2, policy='summarize')
+        await q.put([1, 2, 3])
+        await q.put([4])
+        return await q.get_batch(), len(q)
+
+    assert run(go()) == ((2, [3, 4]), 0)
+
+
+def test_block_waits_for_consumer():
+    async def go():
+        q = ChatQueue(maxsize=2, policy='block')
+        producer = asyncio.create_task(q.put([1, 2, 3, 4]))
+        await asyncio.sleep(0)
+        assert not producer.done()
+        assert len(q) == 2
+
+        got = []
+        while len(got) < 4:
+            _, batch = await q.get_batch()
+            got.extend(batch)
+        await producer
+        return got, q.stats()['dropped']
+
+    assert run(go()) == ([1, 2, 3, 4], 0)
+
+
+def test_get_batch_waits_for_items():
+    async def go():
+        q = ChatQueue(maxsize=10)
+        consumer = asyncio.create_task(q.get_batch())
+        await asyncio.sleep(0.01)
+        assert not consumer.done()
+        await q.put(['a'])
+        return await consumer
+
+    assert run(go()) == (0, ['a'])
+
+
+def test_window_collects_more():
+    async def go():
+        q = ChatQueue(maxsize=10)
+        await q.put([1])
+
+        async def later():
+            await asyncio.sleep(0.01)
+            await q.put([2])
+
+        task = asyncio.create_task(later())
+        batch = await q.get_batch(window=0.05)
+        await task
+        return batch
+
+    assert run(go()) == (0, [1, 2])
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        ChatQueue(policy='nope')
+
+
+def test_close_releases_blocked_put():
+    async def go():
+        dropped = []
+        q = ChatQueue(maxsize=2, policy='block', on_drop=dropped.extend)
+        producer = asyncio.create_task(q.put([1, 2, 3, 4]))
+        await asyncio.sleep(0)
+        assert not producer.done()
+
+        q.close()
+        await asyncio.wait_for(producer, 1)
+        await q.put([5])
+        return dropped, q.drain(), len(q)
+
+    assert run(go()) == ([3, 4, 5], [1, 2], 0)
@@ -0,0 +1,155 @@
+"""chat_row.py: 이모지 조각 분리, ChatRow 재사용/이미지 자리표시자, RowPool 테스트"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import flet as ft
+
+from chat_message import ChatMessage
+from chat_row import CHAT_TEXT_STYLE, ChatRow, RowPool, SegmentCache, chat_theme, message_segments
+from chat_view import ChatViewport
+from image_loader import PENDING
+
+
+def make_message(message='안녕', type='채팅', **kwargs):
+    return ChatMessage(time='12:00:00', type=type, uid='u1', nickname='닉', message=message, **kwargs)
+
+
+def test_segments_text_and_emoji():
+    emojis = {'a': 'https://e/a.png'}
+    assert message_segments('hi {:a:} there', emojis) == [
+        (False, ': hi '), (True, 'https://e/a.png'), (False, ' there'),
+    ]
+
+
+def test_segments_leading_emoji_has_no_prefix():
+    emojis = {'a': 'https://e/a.png'}
+    assert message_segments('{:a:}{:a:}', emojis) == [(True, 'https://e/a.png')] * 2
+
+
+def test_segments_unknown_emoji_kept_as_text():
+    emojis = {'b': 'https://e/b.png'}
+    assert message_segments('{:c:}!', emojis) == [(False, ': {:c:}'), (False, '!')]
+
+
+def test_segment_cache_reuses_layout():
+    cache = SegmentCache(maxsize=2)
+    emojis = {'d_94': 'https://e/94.gif'}
+    spam = '{:d_94:}{:d_94:}{:d_94:}'
+
+    first = cache.get(spam, emojis)
+    assert first == tuple(message_segments(spam, emojis))
+    assert cache.get(spam, dict(emojis)) is first
+    # 같은 이름이 다른 이미지로 매핑되면 별도 항목
+    assert cache.get(spam, {'d_94': 'https://e/other.gif'})[0] == (True, 'https://e/other.gif')
+    assert cache.stats() == {'size': 2, 'hit_rate': 1 / 3}
+
+
+def test_segment_cache_evicts_least_recently_used():
+    cache = SegmentCache(maxsize=2)
+    emojis = {'a': 'https://e/a.png'}
+    a = cache.get('{:a:}', emojis)
+    cache.get('x {:a:}', emojis)
+    cache.get('{:a:}', emojis)       # a를 최근으로
+    cache.get('y {:a:}', emojis)     # 'x {:a:}' 축출
+
+    assert cache.get('{:a:}', emojis) is a
+    assert cache.misses == 3
+    cache.get('x {:a:}', emojis)
+    assert cache.misses == 4
+
+
+def bind(row, message, segments=None, badges=(), seq=1):
+    row.bind(seq, message, '#fff', list(badges), segments, True, True)
+
+
+def test_row_bind_plain_and_donation():
+    row = ChatRow(lambda uid, nick: None)
+    bind(row, make_message(badges=('/cache/b.png',)), badges=['/cache/b.png'])
+
+    assert row.control.data is row
+    assert row.row.controls == [row.time_text, row.badges[0], row.nick, row.message_text]
+    assert row.message_text.value == ': 안녕'
+    assert row.control.bgcolor is None
+
+    bind(row, make_message('후원합니다', type='후원'), seq=2)
+    assert row.row.controls == [row.time_text, row.nick, row.message_text]
+    assert row.nick_text.value == '[후원] 닉'
+    assert row.control.bgcolor is not None
+    assert row.control.key == ft.ScrollKey(2)
+
+
+def test_row_reuses_segment_controls():
+    row = ChatRow(lambda uid, nick: None)
+    segments = [(False, ': a'), (True, '/x.png'), (False, 'b')]
+    bind(row, make_message(), segments)
+    first_controls = list(row.row.controls)
+
+    bind(row, make_message(), [(False, ': c'), (True, '/y.png'), (False, 'd')])
+    assert [id(c) for c in row.row.controls] == [id(c) for c in first_controls]
+    assert [t.value for t in row.message_texts] == [': c', 'd']
+    assert row.message_texts[-1].value == 'd'
+
+
+def test_pending_images_render_as_placeholders_then_patch():
+    paths = {'https://b/1.png': '/cache/1.png', 'https://b/bad.png': None}
+    row = ChatRow(lambda uid, nick: None,
+                  resolve_badge=lambda url: paths.get(url, PENDING),
+                  resolve_emoji=lambda url: paths.get(url, PENDING))
+    badges = ['https://b/1.png', 'https://b/bad.png', 'https://b/2.png']
+    bind(row, make_message(), [(False, ': a'), (True, 'https://e/x.png')], badges=badges)
+
+    # 실패한 배지는 빠지고, 받는 중인 것은 자리표시자 (텍스트는 그대로 표시)
+    assert [b.src for b in row.active_badges] == ['/cache/1.png', PENDING]
+    assert row.row.controls[-1].src == PENDING
+    assert row.row.controls[-2].value == ': a'
+
+    assert row.patch_image('https://e/x.png', '/cache/x.png')
+    assert row.row.controls[-1].src == '/cache/x.png'
+    assert not row.patch_image('https://e/x.png', '/cache/x.png')
+    assert row.patch_image('https://b/2.png', '/cache/2.png')
+    assert row.active_badges[1].src == '/cache/2.png'
+
+    # 재사용 후에는 이전 메시지의 대기 이미지를 끼우지 않음
+    bind(row, make_message(), badges=['https://b/3.png'])
+    assert not row.patch_image('https://e/x.png', '/cache/x.png')
+
+
+def test_font_size_comes_from_shared_theme():
+    row = ChatRow(lambda uid, nick: None)
+    bind(row, make_message(), [(False, ': a'), (True, '/x.png')])
+
+    texts = [row.time_text, row.nick_text, row.count_text] + row.message_texts
+    assert all(text.size is None and text.theme_style == CHAT_TEXT_STYLE for text in texts)
+    assert chat_theme(17).text_theme.body_medium.size == 17
+
+
+def test_nick_tap_uses_current_message():
+    taps = []
+    row = ChatRow(lambda uid, nick: taps.append((uid, nick)))
+    bind(row, make_message())
+    row._on_nick_tap(None)
+
+    assert taps == [('u1', '닉')]
+
+
+def test_pool_with_viewport_recycles_rows():
+    pool = RowPool(lambda: ChatRow(lambda uid, nick: None), maxsize=20)
+
+    def build(seq, message):
+        row = pool.acquire()
+        bind(row, message, seq=seq)
+        return row.control
+
+    controls = []
+    viewport = ChatViewport(controls, build, capacity=100, window=10, page_size=5,
+                            release_row=lambda control: pool.release(control.data))
+    for i in range(200):
+        viewport.append(make_message(str(i)))
+
+    assert len(controls) == 10
+    assert pool.created == 11
+    assert pool.stats()['reuse_rate'] > 0.9
+    assert [c.data.message_text.value for c in controls] == [f': {i}' for i in range(190, 200)]
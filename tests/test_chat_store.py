@@ -0,0 +1,57 @@
+"""chat_store.py: 링 버퍼 테스트"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from chat_store import RingBuffer
+
+
+def test_append_until_full():
+    ring = RingBuffer(3)
+    assert not ring.append('a')
+    assert not ring.append('b')
+
+    assert len(ring) == 2
+    assert list(ring) == ['a', 'b']
+    assert (ring.first_seq, ring.end_seq) == (0, 2)
+
+
+def test_wraps_and_evicts_oldest():
+    ring = RingBuffer(3)
+    evicted = [ring.append(i) for i in range(7)]
+
+    assert evicted == [False, False, False, True, True, True, True]
+    assert list(ring) == [4, 5, 6]
+    assert ring.first_seq == 4
+    assert [ring.get(seq) for seq in range(4, 7)] == [4, 5, 6]
+
+
+def test_get_out_of_range():
+    ring = RingBuffer(2)
+    for i in range(5):
+        ring.append(i)
+
+    with pytest.raises(IndexError):
+        ring.get(2)
+    with pytest.raises(IndexError):
+        ring.get(5)
+
+
+def test_clear_continues_seq():
+    ring = RingBuffer(3)
+    for i in range(4):
+        ring.append(i)
+    ring.clear()
+
+    assert len(ring) == 0 and list(ring) == []
+    ring.append('x')
+    assert ring.get(4) == 'x'
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
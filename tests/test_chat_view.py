@@ -0,0 +1,207 @@
+"""chat_view.py: 가상화 채팅 목록(ChatViewport) 테스트 — 컨트롤 대신 (seq, 항목) 튜플 사용"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from chat_view import ChatViewport
+
+
+def make_viewport(count=0, capacity=1000, window=10, page_size=4):
+    controls = []
+    viewport = ChatViewport(controls, lambda seq, entry: (seq, entry),
+                            capacity=capacity, window=window, page_size=page_size)
+    for i in range(count):
+        viewport.append(i)
+    return viewport, controls
+
+
+def seqs(controls):
+    return [seq for seq, _ in controls]
+
+
+def test_following_keeps_latest_window():
+    viewport, controls = make_viewport(25)
+
+    assert len(viewport) == 25
+    assert seqs(controls) == list(range(15, 25))
+    assert viewport.append(25)
+    assert seqs(controls) == list(range(16, 26))
+
+
+def test_capacity_evicts_buffer_and_rows():
+    viewport, controls = make_viewport(30, capacity=20)
+
+    assert len(viewport) == 20
+    assert viewport.first_seq == 10
+    assert viewport.get(10) == 10
+    assert seqs(controls) == list(range(20, 30))
+
+
+def test_load_older_prepends_and_trims_tail():
+    viewport, controls = make_viewport(30)
+
+    assert viewport.load_older() == 4
+    assert seqs(controls) == list(range(16, 26))
+    assert not viewport.following
+    assert viewport.has_older()
+
+
+def test_frozen_window_buffers_new_messages():
+    viewport, controls = make_viewport(30)
+    viewport.following = False
+
+    assert not viewport.append(30)
+    assert seqs(controls) == list(range(20, 30))
+    assert len(viewport) == 31
+
+
+def test_load_newer_returns_to_following():
+    viewport, controls = make_viewport(30)
+    viewport.load_older()
+    viewport.load_older()
+    for i in range(30, 33):
+        viewport.append(i)
+
+    while not viewport.following:
+        assert viewport.load_newer()
+    assert seqs(controls) == list(range(23, 33))
+    assert viewport.append(33)
+    assert seqs(controls)[-1] == 33
+
+
+def test_scroll_back_to_start():
+    viewport, controls = make_viewport(30)
+    while viewport.has_older():
+        viewport.load_older()
+
+    assert seqs(controls) == list(range(0, 10))
+
+
+class MultipleIndex:
+    """테스트용 index — divisor의 배수만 통과 (divisor가 None이면 전체)"""
+
+    def __init__(self):
+        self.divisor = None
+        self._seqs = []
+
+    def add(self, seq, entry):
+        self._seqs.append(seq)
+        return self.divisor is None or entry % self.divisor == 0
+
+    def seqs(self):
+        if self.divisor is None:
+            return None
+        return [seq for seq in self._seqs if seq % self.divisor == 0]
+
+    def clear(self):
+        self._seqs.clear()
+
+
+def test_filter_materializes_matching_only():
+    index = MultipleIndex()
+    controls = []
+    viewport = ChatViewport(controls, lambda seq, entry: (seq, entry),
+                            capacity=1000, window=10, page_size=4, index=index)
+    for i in range(50):
+        viewport.append(i)
+    index.divisor = 5
+    viewport.refresh()
+
+    assert seqs(controls) == list(range(0, 50, 5))
+    assert viewport.append(50)
+    assert not viewport.append(51)
+    assert seqs(controls) == list(range(5, 55, 5))
+
+    index.divisor = None
+    viewport.refresh()
+    assert seqs(controls) == list(range(42, 52))
+
+
+def test_refresh_reuses_rows_already_on_screen():
+    index = MultipleIndex()
+    released = []
+    controls = []
+    viewport = ChatViewport(controls, lambda seq, entry: (seq, entry),
+                            capacity=1000, window=10, page_size=4,
+                            release_row=released.append, index=index)
+    for i in range(20):
+        viewport.append(i)
+    released.clear()
+    index.divisor = 2
+    viewport.refresh()
+
+    # 화면에 있던 10~19 중 짝수 5개는 그대로, 홀수 5개만 반납, 0~8 짝수 5개만 새로 생성
+    assert seqs(controls) == list(range(0, 20, 2))
+    assert viewport.last_delta == (5, 5)
+    assert sorted(seq for seq, _ in released) == [11, 13, 15, 17, 19]
+
+
+def test_filtered_scroll_skips_non_matching():
+    index = MultipleIndex()
+    controls = []
+    viewport = ChatViewport(controls, lambda seq, entry: (seq, entry),
+                            capacity=1000, window=10, page_size=4, index=index)
+    for i in range(100):
+        viewport.append(i)
+    index.divisor = 3
+    viewport.refresh()
+
+    assert viewport.load_older() == 4
+    assert seqs(controls) == list(range(60, 90, 3))
+    while not viewport.following:
+        viewport.load_newer()
+    assert seqs(controls) == list(range(72, 100, 3))
+
+
+def test_show_around_centers_match():
+    index = MultipleIndex()
+    controls = []
+    viewport = ChatViewport(controls, lambda seq, entry: (seq, entry),
+                            capacity=1000, window=10, page_size=4, index=index)
+    for i in range(100):
+        viewport.append(i)
+    index.divisor = 2
+    viewport.refresh()
+
+    viewport.show_around(40)
+    assert seqs(controls) == list(range(30, 50, 2))
+    assert not viewport.following
+    assert not viewport.append(100)
+
+    viewport.show_around(98)
+    assert seqs(controls) == list(range(80, 101, 2))[-10:]
+    assert viewport.following
+
+
+def test_eviction_while_scrolled_back():
+    viewport, controls = make_viewport(20, capacity=20)
+    while viewport.has_older():
+        viewport.load_older()
+    for i in range(20, 25):
+        viewport.append(i)
+
+    assert seqs(controls) == list(range(5, 10))
+    assert viewport.load_older() == 0
+    viewport.load_newer()
+    assert seqs(controls)[0] >= viewport.first_seq
+
+
+def test_clear_keeps_seq_increasing():
+    viewport, controls = make_viewport(12)
+    viewport.clear()
+
+    assert controls == [] and len(viewport) == 0
+    viewport.append('new')
+    assert controls == [(12, 'new')]
+
+
+def test_large_buffer_keeps_rows_bounded():
+    viewport, controls = make_viewport(100_000, capacity=100_000, window=150, page_size=50)
+
+    assert len(controls) == 150
+    for _ in range(10):
+        viewport.load_older()
+    assert len(controls) == 150
+    assert seqs(controls)[0] == 100_000 - 150 - 500
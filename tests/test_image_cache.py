@@ -0,0 +1,267 @@
+"""image_cache.py: 디스크 이미지 캐시 manifest / 조건부 재검증 테스트"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+import image_cache
+from image_cache import MANIFEST_NAME, DiskImageCache
+
+URL = 'https://img/badge.png'
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def responses(monkeypatch):
+    """requests.get 대신 준비한 응답을 차례로 돌려주고, 받은 헤더를 기록"""
+    queue = []
+    sent = []
+
+    def fake_get(url, headers=None, timeout=None):
+        sent.append(headers or {})
+        return queue.pop(0)
+
+    monkeypatch.setattr(image_cache.requests, 'get', fake_get)
+    return queue, sent
+
+
+def test_download_writes_file_and_manifest(tmp_path, responses):
+    queue, _ = responses
+    queue.append(FakeResponse(200, b'png', {'ETag': '"v1"', 'Content-Type': 'image/png'}))
+    cache = DiskImageCache(str(tmp_path))
+
+    path = cache.fetch(URL)
+    cache.flush()
+
+    assert open(path, 'rb').read() == b'png'
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding='utf-8'))
+    entry = manifest['entries'][URL]
+    assert entry['etag'] == '"v1"' and entry['size'] == 3
+    assert cache.stats()['downloaded'] == 1
+
+
+def test_startup_lookup_uses_manifest_only(tmp_path, responses):
+    queue, _ = responses
+    queue.append(FakeResponse(200, b'png', {'ETag': '"v1"'}))
+    first = DiskImageCache(str(tmp_path))
+    path = first.fetch(URL)
+    first.flush()
+
+    restarted = DiskImageCache(str(tmp_path))
+    assert restarted.lookup(URL) == path
+    assert restarted.lookup('https://img/other.png') is None
+    assert not restarted.is_stale(URL)
+
+
+def test_stale_entry_revalidates_with_etag(tmp_path, responses):
+    queue, sent = responses
+    queue.append(FakeResponse(200, b'png', {'ETag': '"v1"', 'Last-Modified': 'Mon'}))
+    cache = DiskImageCache(str(tmp_path), revalidate_after=0)
+    path = cache.fetch(URL)
+    assert cache.is_stale(URL)
+
+    queue.append(FakeResponse(304))
+    assert cache.fetch(URL) == path
+    assert sent[-1] == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon'}
+    assert open(path, 'rb').read() == b'png'
+    assert cache.stats()['revalidated'] == 1
+
+    queue.append(FakeResponse(200, b'new', {'ETag': '"v2"'}))
+    assert cache.fetch(URL) == path
+    assert open(path, 'rb').read() == b'new'
+    assert cache.entries[URL]['etag'] == '"v2"'
+    assert cache.stats()['refreshed'] == 1
+
+
+def test_failed_revalidation_keeps_file(tmp_path, responses):
+    queue, _ = responses
+    queue.append(FakeResponse(200, b'png'))
+    cache = DiskImageCache(str(tmp_path), revalidate_after=0)
+    path = cache.fetch(URL)
+
+    queue.append(FakeResponse(500))
+    assert cache.fetch(URL) == path
+
+
+def test_legacy_file_registered_without_request(tmp_path, responses):
+    _, sent = responses
+    legacy = tmp_path / image_cache._file_name(URL)
+    legacy.write_bytes(b'old')
+    cache = DiskImageCache(str(tmp_path))
+
+    assert cache.fetch(URL) == str(legacy)
+    assert sent == []
+    assert cache.lookup(URL) == str(legacy)
+
+
+def test_corrupt_manifest_starts_empty(tmp_path):
+    (tmp_path / MANIFEST_NAME).write_text('{broken', encoding='utf-8')
+    assert DiskImageCache(str(tmp_path)).entries == {}
+
+
+def test_concurrent_fetches_share_one_download(tmp_path, monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def slow_get(url, headers=None, timeout=None):
+        calls.append(url)
+        release.wait(5)
+        return FakeResponse(200, b'png')
+
+    monkeypatch.setattr(image_cache.requests, 'get', slow_get)
+    cache = DiskImageCache(str(tmp_path))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.fetch(URL))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while cache.deduped < 4:
+        time.sleep(0.005)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [URL]
+    assert len(results) == 5 and len(set(results)) == 1
+    assert cache.stats()['deduped'] == 4
+    assert not cache._inflight
+
+
+def test_writes_leave_no_temp_files(tmp_path, responses):
+    queue, _ = responses
+    queue.append(FakeResponse(200, b'png'))
+    cache = DiskImageCache(str(tmp_path))
+    cache.fetch(URL)
+    cache.flush()
+
+    assert sorted(os.listdir(tmp_path)) == sorted([MANIFEST_NAME, image_cache._file_name(URL)])
+
+
+def test_failed_write_keeps_previous_file(tmp_path, responses, monkeypatch):
+    queue, _ = responses
+    queue.append(FakeResponse(200, b'old'))
+    cache = DiskImageCache(str(tmp_path), revalidate_after=0)
+    path = cache.fetch(URL)
+
+    def broken_replace(src, dst):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(image_cache.os, 'replace', broken_replace)
+    queue.append(FakeResponse(200, b'new'))
+    assert cache.fetch(URL) == path
+    assert open(path, 'rb').read() == b'old'
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.tmp')] == []
+
+
+def cache_with_files(tmp_path, sizes_and_access):
+    """url → (크기, last_access)로 파일과 manifest 항목을 만든 캐시"""
+    cache = DiskImageCache(str(tmp_path))
+    for url, (size, last_access) in sizes_and_access.items():
+        name = image_cache._file_name(url)
+        (tmp_path / name).write_bytes(b'x' * size)
+        cache.entries[url] = {'file': name, 'size': size, 'fetched_at': last_access,
+                              'last_access': last_access}
+    return cache
+
+
+def test_maintain_evicts_least_recently_used_over_budget(tmp_path):
+    now = time.time()
+    cache = cache_with_files(tmp_path, {
+        'https://img/old.png': (100, now - 30),
+        'https://img/mid.png': (100, now - 20),
+        'https://img/new.png': (100, now - 10),
+    })
+
+    report = cache.maintain(max_bytes=150, max_age=3600)
+
+    assert report['removed'] == ['https://img/old.png', 'https://img/mid.png']
+    assert report['entries'] == 1 and report['bytes'] == 100 and report['freed'] == 200
+    assert list(cache.entries) == ['https://img/new.png']
+    assert sorted(os.listdir(tmp_path)) == sorted([MANIFEST_NAME, image_cache._file_name('https://img/new.png')])
+    assert DiskImageCache(str(tmp_path)).usage() == (1, 100)  # manifest에도 반영
+
+
+def test_maintain_removes_expired_and_orphans(tmp_path):
+    now = time.time()
+    cache = cache_with_files(tmp_path, {
+        'https://img/stale.png': (10, now - 100),
+        'https://img/fresh.png': (10, now),
+    })
+    orphan = tmp_path / 'orphan.png'
+    orphan.write_bytes(b'xx')
+    os.utime(orphan, (now - 100, now - 100))
+    recent_orphan = tmp_path / 'legacy.png'
+    recent_orphan.write_bytes(b'xx')
+    fresh_tmp = tmp_path / 'abc.tmp'
+    fresh_tmp.write_bytes(b'x')
+
+    report = cache.maintain(max_bytes=10_000, max_age=50)
+
+    assert report['removed'] == ['https://img/stale.png']
+    assert report['orphans'] == 1
+    assert not orphan.exists()
+    assert recent_orphan.exists() and fresh_tmp.exists()
+
+
+def test_maintain_keeps_recent_legacy_files_for_adoption(tmp_path, responses):
+    _, sent = responses
+    legacy = tmp_path / image_cache._file_name(URL)
+    legacy.write_bytes(b'old')
+    old = time.time() - 40 * 24 * 3600
+    stale_tmp = tmp_path / 'x.tmp'
+    stale_tmp.write_bytes(b'x')
+    os.utime(stale_tmp, (old, old))
+    cache = DiskImageCache(str(tmp_path))
+
+    report = cache.maintain()
+
+    assert report['orphans'] == 1 and not stale_tmp.exists()
+    assert report['files'] == 1 and report['bytes'] == 3  # manifest 밖 파일도 합계에 포함
+    assert legacy.exists()
+    assert cache.fetch(URL) == str(legacy)  # 네트워크 요청 없이 등록
+    assert sent == []
+
+
+def test_maintain_removes_old_legacy_files(tmp_path):
+    old = time.time() - 40 * 24 * 3600
+    legacy = tmp_path / image_cache._file_name(URL)
+    legacy.write_bytes(b'old')
+    os.utime(legacy, (old, old))
+
+    report = DiskImageCache(str(tmp_path)).maintain()
+
+    assert not legacy.exists()
+    assert report['orphans'] == 1 and report['freed'] == 3
+    assert report['files'] == 0 and report['bytes'] == 0
+
+
+def test_maintain_size_budget_includes_legacy_files(tmp_path):
+    now = time.time()
+    cache = cache_with_files(tmp_path, {'https://img/new.png': (100, now - 10)})
+    legacy = tmp_path / image_cache._file_name('https://img/legacy.png')
+    legacy.write_bytes(b'x' * 100)
+    os.utime(legacy, (now - 20, now - 20))  # manifest 항목보다 오래 전에 사용
+
+    report = cache.maintain(max_bytes=150, max_age=3600)
+
+    assert report['removed'] == [] and report['orphans'] == 1
+    assert not legacy.exists()
+    assert report['entries'] == report['files'] == 1 and report['bytes'] == 100
+
+
+def test_maintain_skips_inflight_downloads(tmp_path):
+    cache = cache_with_files(tmp_path, {'https://img/busy.png': (100, 0)})
+    cache._inflight['https://img/busy.png'] = object()
+
+    assert cache.maintain(max_bytes=0, max_age=0)['removed'] == []
@@ -0,0 +1,133 @@
+"""image_fetcher.py: 이미지 다운로드 풀 (우선순위, 중복 합치기, 호스트별 세션) 테스트"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import image_fetcher
+from image_fetcher import PREFETCH, VISIBLE, ImageFetchPool
+
+
+def blocked_pool():
+    """작업 스레드 1개가 gate에 막혀 있는 풀 — 이후 submit은 모두 대기열에 쌓임"""
+    pool = ImageFetchPool(workers=1)
+    gate = threading.Event()
+    started = threading.Event()
+
+    def block(url):
+        started.set()
+        gate.wait(5)
+
+    pool.submit('block', block)
+    started.wait(5)
+    return pool, gate
+
+
+def test_visible_runs_before_prefetch():
+    pool, gate = blocked_pool()
+    order = []
+    futures = [
+        pool.submit('p1', order.append, PREFETCH),
+        pool.submit('v1', order.append, VISIBLE),
+        pool.submit('p2', order.append, PREFETCH),
+        pool.submit('v2', order.append, VISIBLE),
+    ]
+    assert pool.stats()['queued'] == 4
+    gate.set()
+    for future in futures:
+        future.result(5)
+
+    assert order == ['v1', 'v2', 'p1', 'p2']
+    pool.close()
+
+
+def test_same_url_shares_future_and_promotes():
+    pool, gate = blocked_pool()
+    order = []
+    other = pool.submit('b', order.append, PREFETCH)
+    prefetch = pool.submit('a', order.append, PREFETCH)
+    assert pool.submit('a', order.append, PREFETCH) is prefetch
+    pool.promote('a')  # 먼저 대기하던 b보다 앞으로
+    gate.set()
+    other.result(5)
+    pool.close()
+
+    assert order == ['a', 'b']
+    assert pool.stats()['promoted'] == 1
+
+
+def test_failure_propagates_to_future():
+    pool = ImageFetchPool(workers=2)
+
+    def fail(url):
+        raise OSError(url)
+
+    future = pool.submit('x', fail)
+    assert isinstance(future.exception(5), OSError)
+    assert pool.stats()['queued'] == 0
+    pool.close()
+
+
+def test_get_reuses_session_per_host(monkeypatch):
+    created = []
+
+    class FakeResponse:
+        content = b'12345'
+
+    class FakeSession:
+        def __init__(self):
+            created.append(self)
+
+        def mount(self, prefix, adapter):
+            pass
+
+        def get(self, url, headers=None, timeout=None):
+            return FakeResponse()
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(image_fetcher.requests, 'Session', FakeSession)
+    pool = ImageFetchPool()
+    pool.get('https://cdn-a/1.png')
+    pool.get('https://cdn-a/2.png')
+    pool.get('https://cdn-b/1.png')
+
+    stats = pool.stats()
+    assert len(created) == 2
+    assert stats['sessions'] == 2 and stats['requests'] == 3 and stats['bytes'] == 15
+    assert stats['latency_ms']['count'] == 3
+
+
+def test_close_cancels_queued_jobs_and_refuses_new_sessions(monkeypatch):
+    created = []
+
+    class FakeSession:
+        def __init__(self):
+            created.append(self)
+            self.closed = False
+
+        def mount(self, prefix, adapter):
+            pass
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(image_fetcher.requests, 'Session', FakeSession)
+    pool, gate = blocked_pool()
+    pool._session('https://cdn-a/1.png')
+    queued = pool.submit('q', lambda url: url, PREFETCH)
+
+    pool.close()
+    gate.set()
+
+    assert queued.cancelled()
+    assert created[0].closed
+    with pytest.raises(RuntimeError):
+        pool._session('https://cdn-b/1.png')  # 실행 중이던 작업이 새 세션을 만들지 않음
+    assert len(created) == 1
+    assert pool.stats()['sessions'] == 0
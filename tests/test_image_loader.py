@@ -0,0 +1,205 @@
+"""image_loader.py: 백그라운드 이미지 로더(ImageLoader) 테스트"""
+
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures import Future
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import image_loader
+from image_fetcher import PREFETCH, VISIBLE
+from image_loader import PENDING, ImageLoader
+
+
+def test_get_returns_immediately_and_notifies():
+    async def scenario():
+        release = threading.Event()
+        calls = []
+
+        def fetch(url):
+            calls.append(url)
+            release.wait(5)
+            return f'/cache/{url}'
+
+        loaded = []
+        loader = ImageLoader(fetch, on_loaded=lambda url, path: loaded.append((url, path)))
+
+        assert loader.get('a') == PENDING
+        assert loader.get('a') == PENDING  # 받는 중에는 다시 시작하지 않음
+        await asyncio.sleep(0.01)
+        assert loaded == []
+
+        release.set()
+        while not loaded:
+            await asyncio.sleep(0.01)
+        assert loaded == [('a', '/cache/a')]
+        assert calls == ['a']
+        assert loader.get('a') == '/cache/a'
+        assert loader.stats()['pending'] == 0
+
+    asyncio.run(scenario())
+
+
+def test_failed_fetch_is_cached_as_none():
+    async def scenario():
+        def fetch(url):
+            raise OSError('network down')
+
+        loaded = []
+        loader = ImageLoader(fetch, on_loaded=lambda url, path: loaded.append(url))
+        loader.get('x')
+        while loader.stats()['pending']:
+            await asyncio.sleep(0.01)
+
+        assert loader.get('x') is None
+        assert loaded == []
+        assert loader.failed == 1
+
+    asyncio.run(scenario())
+
+
+class FakeCache:
+    def __init__(self, paths, stale=()):
+        self.paths = paths
+        self.stale = set(stale)
+
+    def lookup(self, url):
+        return self.paths.get(url)
+
+    def is_stale(self, url):
+        return url in self.stale
+
+
+def test_cached_image_returned_without_fetch():
+    async def scenario():
+        calls = []
+        loader = ImageLoader(lambda url: calls.append(url), cache=FakeCache({'a': '/disk/a'}))
+
+        assert loader.get('a') == '/disk/a'
+        await asyncio.sleep(0.01)
+        assert calls == []
+
+    asyncio.run(scenario())
+
+
+def test_stale_image_revalidates_in_background():
+    async def scenario():
+        def fetch(url):
+            raise OSError('offline')
+
+        loader = ImageLoader(fetch, cache=FakeCache({'a': '/disk/a'}, stale={'a'}))
+
+        assert loader.get('a') == '/disk/a'  # 재검증 중에도 기존 파일
+        while loader.stats()['pending']:
+            await asyncio.sleep(0.01)
+        assert loader.get('a') == '/disk/a'  # 재검증 실패해도 유지
+        assert loader.failed == 1
+
+    asyncio.run(scenario())
+
+
+def test_pool_prefetch_then_visible_promotes():
+    async def scenario():
+        class FakePool:
+            def __init__(self):
+                self.submitted = []
+                self.promoted = []
+
+            def submit(self, url, fn, priority):
+                self.submitted.append((url, priority))
+                future = Future()
+                future.set_result(fn(url))
+                return future
+
+            def promote(self, url, priority):
+                self.promoted.append((url, priority))
+
+        pool = FakePool()
+        loaded = []
+        loader = ImageLoader(lambda url: f'/cache/{url}', pool=pool,
+                             on_loaded=lambda url, path: loaded.append(url))
+
+        loader.prefetch('a')
+        assert loader.get('a') == PENDING  # 받는 중 → 우선순위만 올림
+        while not loaded:
+            await asyncio.sleep(0.01)
+
+        assert pool.submitted == [('a', PREFETCH)]
+        assert pool.promoted == [('a', VISIBLE)]
+        assert loader.get('a') == '/cache/a'
+
+    asyncio.run(scenario())
+
+
+def test_memory_cache_is_bounded_lru():
+    async def scenario():
+        disk = FakeCache({url: f'/disk/{url}' for url in 'abc'})
+        loader = ImageLoader(lambda url: None, cache=disk, maxsize=2)
+
+        loader.get('a')
+        loader.get('b')
+        loader.get('a')   # a를 최근으로
+        loader.get('c')   # b 밀려남
+        assert 'b' not in loader.paths and 'a' in loader.paths
+        assert loader.get('b') == '/disk/b'  # 디스크 manifest에서 다시 찾음
+
+        stats = loader.stats()
+        assert stats['size'] == 2 and stats['evicted'] == 2
+        assert stats['hits'] == 1 and stats['disk_hits'] == 4
+
+    asyncio.run(scenario())
+
+
+def test_failure_negative_cache_with_backoff(monkeypatch):
+    async def scenario():
+        now = [1000.0]
+        monkeypatch.setattr(image_loader, 'monotonic', lambda: now[0])
+        result = [None]
+        calls = []
+
+        def fetch(url):
+            calls.append(url)
+            return result[0]
+
+        loader = ImageLoader(fetch, negative_ttl=5, negative_ttl_max=12)
+
+        async def load_once():
+            assert loader.get('a') == PENDING
+            while loader.stats()['pending']:
+                await asyncio.sleep(0.01)
+
+        await load_once()
+        assert loader.get('a') is None  # TTL 안에서는 다시 받지 않음
+        assert loader.stats()['negative_hits'] == 1
+
+        now[0] += 5
+        await load_once()            # 두 번째 실패 → TTL 10초
+        now[0] += 9
+        assert loader.get('a') is None
+        now[0] += 1
+        await load_once()            # 세 번째 실패 → TTL 최대 12초
+        assert loader._failures['a'] == (now[0] + 12, 12)
+
+        result[0] = '/cache/a'
+        now[0] += 12
+        await load_once()
+        assert loader.get('a') == '/cache/a'
+        assert 'a' not in loader._failures
+        assert len(calls) == 4
+
+    asyncio.run(scenario())
+
+
+def test_forget_drops_paths_removed_from_disk():
+    async def scenario():
+        disk = FakeCache({'a': '/disk/a'})
+        loader = ImageLoader(lambda url: None, cache=disk)
+        assert loader.get('a') == '/disk/a'
+
+        del disk.paths['a']
+        loader.forget(['a', 'unknown'])
+        assert loader.get('a') == PENDING
+
+    asyncio.run(scenario())
@@ -0,0 +1,99 @@
+"""render_scheduler.py: 갱신 합치기/프레임 간격 테스트"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from render_scheduler import RenderScheduler
+
+
+class Recorder:
+    def __init__(self, delay=0.0, fail=False):
+        self.calls = []
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self, scroll):
+        self.calls.append((time.perf_counter(), scroll))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError('update 실패')
+
+
+def test_burst_is_merged_into_one_flush():
+    flush = Recorder()
+
+    async def scenario():
+        scheduler = RenderScheduler(flush, fps=30)
+        for i in range(100):
+            scheduler.request(scroll=(i == 50))
+        await scheduler.drain()
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+
+    assert [scroll for _, scroll in flush.calls] == [True]
+    assert scheduler.stats()['merged'] == 99
+    assert scheduler.stats()['flushes'] == 1
+
+
+def test_flushes_are_spaced_by_interval():
+    flush = Recorder()
+
+    async def scenario():
+        scheduler = RenderScheduler(flush, fps=50)
+        for _ in range(3):
+            scheduler.request()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+        await scheduler.drain()
+
+    asyncio.run(scenario())
+
+    assert len(flush.calls) == 2
+    assert flush.calls[1][0] - flush.calls[0][0] >= 0.02 - 0.002
+
+
+def test_request_during_flush_schedules_another():
+    flush = Recorder(delay=0.01)
+
+    async def scenario():
+        scheduler = RenderScheduler(flush, fps=200)
+        scheduler.request()
+        await asyncio.sleep(0.005)  # flush 진행 중
+        scheduler.request(scroll=True)
+        await scheduler.drain()
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+
+    assert [scroll for _, scroll in flush.calls] == [False, True]
+    assert scheduler.overruns == 2
+
+
+def test_failure_is_counted_and_loop_continues():
+    flush = Recorder(fail=True)
+
+    async def scenario():
+        scheduler = RenderScheduler(flush, fps=100)
+        scheduler.request()
+        await scheduler.drain()
+        scheduler.request()
+        await scheduler.drain()
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+
+    assert scheduler.failures == 2
+    assert len(flush.calls) == 2
+
+
+def test_invalid_fps():
+    with pytest.raises(ValueError):
+        RenderScheduler(Recorder(), fps=0)
@@ -0,0 +1,122 @@
+"""프레임 캡처 + 재생(ReplayWorker) 테스트"""
+
+import asyncio
+import gzip
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from frame_capture import FrameRecorder, read_frames
+from replay import ReplayWorker, parse_speed
+from test_step3 import make_chat_data
+
+
+def make_frame(cmd, bdy=None):
+    frame = {'ver': '1', 'cmd': cmd}
+    if bdy is not None:
+        frame['bdy'] = bdy
+    return json.dumps(frame)
+
+
+def write_capture(path, frames):
+    recorder = FrameRecorder(str(path))
+    for frame in frames:
+        recorder.write(frame)
+    recorder.close()
+    return recorder
+
+
+def test_capture_roundtrip(tmp_path):
+    path = tmp_path / 'cap' / 'test.chzcap'
+    frames = [make_frame(0), make_frame(93101, [make_chat_data(msg='한글 메시지')]).encode('utf-8')]
+    recorder = write_capture(path, frames)
+
+    assert recorder.frame_count == 2
+    loaded = list(read_frames(str(path)))
+    assert [payload for _, payload in loaded] == [frames[0].encode('utf-8'), frames[1]]
+    assert loaded[0][0] <= loaded[1][0]
+
+
+def test_truncated_capture_reads_complete_records(tmp_path):
+    path = tmp_path / 'test.chzcap'
+    write_capture(path, [make_frame(0), make_frame(0)])
+    data = gzip.decompress(path.read_bytes())
+    path.write_bytes(gzip.compress(data[:-3]))
+
+    assert len(list(read_frames(str(path)))) == 1
+
+
+def test_replay_runs_parsing_path(tmp_path):
+    path = tmp_path / 'test.chzcap'
+    write_capture(path, [
+        make_frame(0),
+        make_frame(93101, [make_chat_data(msg='a'), make_chat_data(msg='b')]),
+        make_frame(93102, [{'uid': 'anonymous', 'msg': '후원', 'msgTime': 1700000000000}]),
+        make_frame(94008),
+    ])
+
+    received, statuses = [], []
+
+    async def on_chat(chat_data):
+        received.append(chat_data)
+
+    worker = ReplayWorker(str(path), on_chat, statuses.append, speed=0)
+    asyncio.run(worker.run())
+
+    assert [c.message for c in received] == ['a', 'b', '후원']
+    assert received[2].type == '후원'
+    assert worker.frame_count == 4
+    assert worker.message_count == 3
+    assert worker.stage_stats['decode'].count == 4
+    assert worker.stage_stats['e2e'].count == 3
+    assert '재생 완료' in statuses[-1]
+    assert 'e2e' in worker.report()
+
+
+def test_parse_speed():
+    assert parse_speed('max') == 0.0
+    assert parse_speed('4') == 4.0
+
+
+def test_replay_batch_callback(tmp_path):
+    path = tmp_path / 'test.chzcap'
+    write_capture(path, [
+        make_frame(93101, [make_chat_data(msg='a'), make_chat_data(msg='b')]),
+        make_frame(93101, [make_chat_data(msg='c')]),
+    ])
+
+    batches = []
+
+    async def on_batch(messages):
+        batches.append([m.message for m in messages])
+
+    async def on_chat(chat_data):
+        raise AssertionError('batch 모드에서는 단건 콜백을 쓰지 않음')
+
+    worker = ReplayWorker(str(path), on_chat, lambda msg: None, speed=0, on_chat_batch=on_batch)
+    asyncio.run(worker.run())
+
+    assert batches == [['a', 'b'], ['c']]
+    assert worker.message_count == 3
+    assert worker.stage_stats['callback'].count == 2
+    assert worker.stage_stats['e2e'].count == 3
+
+
+def test_stop_during_replay(tmp_path):
+    path = tmp_path / 'test.chzcap'
+    write_capture(path, [make_frame(93101, [make_chat_data(msg=str(i))]) for i in range(50)])
+    received = []
+
+    async def on_chat(chat_data):
+        received.append(chat_data)
+        if len(received) == 3:
+            await worker.stop()  # 연결 해제 버튼 (stats() 호출 포함)
+
+    worker = ReplayWorker(str(path), on_chat, lambda msg: None, speed=0)
+    asyncio.run(worker.run())
+
+    assert len(received) == 3
+    assert not worker.running
+    assert isinstance(worker.stats(), dict)
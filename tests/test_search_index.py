@@ -0,0 +1,39 @@
+"""search_index.py: n-gram 역색인(NgramIndex) 테스트"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from search_index import NgramIndex, ngrams
+
+
+def make_index(keys):
+    index = NgramIndex()
+    for seq, key in enumerate(keys):
+        index.add(seq, key)
+    return index
+
+
+def test_ngrams():
+    assert ngrams('안녕하세요') == {'안녕', '녕하', '하세', '세요'}
+    assert ngrams('a') == set()
+
+
+def test_candidates_is_shortest_posting():
+    index = make_index(['ㅋㅋㅋ 안녕', '안녕하세요', 'ㅋㅋ', '하세요'])
+
+    assert index.candidates('안녕') == [0, 1]
+    assert index.candidates('안녕하') == [1]
+    assert index.candidates('하세요') == [1, 3]
+    assert index.candidates('없는말') == []
+    assert index.candidates('ㅋ') is None
+
+
+def test_compact_drops_evicted_seqs():
+    index = make_index(['ab', 'abc', 'cd', 'ab'])
+    index.compact(2)
+
+    assert index.candidates('ab') == [3]
+    assert index.candidates('bc') == []
+    assert index.stats()['grams'] == 2
@@ -0,0 +1,80 @@
+"""spam_collapse.py: 도배 합치기(SpamCollapser) 테스트"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from chat_message import ChatMessage
+from chat_row import ChatRow
+from chat_view import ChatViewport
+from spam_collapse import SpamCollapser, normalize
+
+
+def test_normalize():
+    assert normalize('ㅋㅋㅋㅋㅋ') == normalize('ㅋㅋㅋ')
+    assert normalize('{:d_94:}{:d_94:}{:d_94:}') == normalize('{:d_94:}')
+    assert normalize('  GG   wp ') == normalize('gg wp')
+    assert normalize('{:d_94:}{:d_44:}') != normalize('{:d_94:}')
+    assert normalize('ㅋㅋ') != normalize('ㅎㅎ')
+
+
+def test_merges_within_window():
+    collapser = SpamCollapser(window=3)
+
+    assert collapser.add('ㅋㅋㅋ', 0, 0) is None      # seq 0에 새 row
+    assert collapser.add('ㅋㅋㅋㅋ', 0, 1) == 0
+    assert collapser.add('ㅋㅋㅋ', 0, 1) == 0
+    assert collapser.counts == {0: 3}
+
+    for seq, message in enumerate(['a', 'b', 'c'], start=1):
+        assert collapser.add(message, 0, seq) is None
+    # row 3개가 지나 window 밖 → 새 row
+    assert collapser.add('ㅋㅋㅋ', 0, 4) is None
+    assert collapser.merged == 2
+
+
+def test_counts_dropped_after_eviction():
+    collapser = SpamCollapser(window=10)
+    collapser.add('x', 0, 0)
+    collapser.add('x', 0, 1)
+    collapser.add('y', 1, 1)
+
+    assert collapser.counts == {}
+
+
+def test_counter_row_in_viewport():
+    collapser = SpamCollapser()
+    controls = []
+
+    def build(seq, message):
+        row = ChatRow(lambda uid, nick: None)
+        row.bind(seq, message, '#fff', (), None, True, True)
+        count = collapser.counts.get(seq)
+        if count:
+            row.set_count(count)
+        return row.control
+
+    viewport = ChatViewport(controls, build, capacity=100, window=8, page_size=4)
+    appended = 0
+    for i in range(30):
+        text = 'ㅋㅋㅋ' if i % 3 else f'대화 {i}'
+        message = ChatMessage(time='00:00:00', type='채팅', uid='u', nickname='n', message=text)
+        seq = collapser.add(message.message, viewport.first_seq, viewport.end_seq)
+        if seq is None:
+            viewport.append(message)
+            appended += 1
+        elif (control := viewport.control_for(seq)) is not None:
+            control.data.set_count(collapser.counts[seq])
+
+    assert appended == 11  # 대화 10건 + ㅋㅋㅋ row 1개
+    assert collapser.counts == {1: 20}
+    # 카운터 row(seq 1)는 화면 구간 밖으로 밀려남 — 다시 올라오면 카운터가 그대로 표시됨
+    assert viewport.control_for(1) is None
+    while viewport.has_older():
+        viewport.load_older()
+    row = viewport.control_for(1).data
+    assert row.count == 20
+    assert row.row.controls[-1] is row.count_text
+    assert row.count_text.value == ' ×20'
+    assert viewport.control_for(0).data.count == 1
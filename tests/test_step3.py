@@ -1,11 +1,15 @@
 """Step 3: ChatWorker 메시지 파싱 테스트"""
 
+import asyncio
+import datetime
 import sys
 import os
 import json
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from chat_message import EMPTY_BADGES, EMPTY_EMOJIS
+from chat_queue import ChatQueue
 from chat_worker import ChatWorker
 
 
@@ -40,20 +44,24 @@ class TestProcessChatData:
 
     def setup_method(self):
         self.received = []
-        self.worker = ChatWorker.__new__(ChatWorker)
-        self.worker.on_chat_receive_callback = lambda data: self.received.append(data)
-        self.worker.on_status_callback = lambda msg: None
+        self.worker = ChatWorker('test_uid', {}, self._on_chat, lambda msg: None)
+
+    async def _on_chat(self, data):
+        self.received.append(data)
+
+    def process(self, raw, chat_type):
+        asyncio.run(self.worker._process_chat_data(raw, chat_type))
 
     def test_basic_chat(self):
         raw = make_chat_data(msg='테스트 메시지')
-        self.worker._process_chat_data(raw, '채팅')
+        self.process(raw, '채팅')
 
         assert len(self.received) == 1
         result = self.received[0]
-        assert result['nickname'] == '테스터'
-        assert result['message'] == '테스트 메시지'
-        assert result['type'] == '채팅'
-        assert result['uid'] == 'user123'
+        assert result.nickname == '테스터'
+        assert result.message == '테스트 메시지'
+        assert result.type == '채팅'
+        assert result.uid == 'user123'
 
     def test_anonymous_donor(self):
         raw = {
@@ -61,16 +69,29 @@ class TestProcessChatData:
             'msg': '후원합니다',
             'msgTime': 1700000000000,
         }
-        self.worker._process_chat_data(raw, '후원')
+        self.process(raw, '후원')
 
         assert len(self.received) == 1
-        assert self.received[0]['nickname'] == '익명의 후원자'
-        assert self.received[0]['type'] == '후원'
+        assert self.received[0].nickname == '익명의 후원자'
+        assert self.received[0].type == '후원'
+
+    def test_msg_time_kept_raw(self):
+        self.process(make_chat_data(msg_time=1700000000123), '채팅')
+
+        result = self.received[0]
+        assert result.msg_time == 1700000000123
+        assert result.time == datetime.datetime.fromtimestamp(1700000000).strftime('%H:%M:%S')
+
+    def test_custom_time_format(self):
+        self.worker.time_formatter.set_format('%H:%M')
+        self.process(make_chat_data(msg_time=1700000000123), '채팅')
+
+        assert self.received[0].time == datetime.datetime.fromtimestamp(1700000000).strftime('%H:%M')
 
     def test_color_code(self):
         raw = make_chat_data()
-        self.worker._process_chat_data(raw, '채팅')
-        assert self.received[0]['colorCode'] == 'CC000'
+        self.process(raw, '채팅')
+        assert self.received[0].color_code == 'CC000'
 
     def test_subscription_badge(self):
         profile_extras = {
@@ -84,12 +105,12 @@ class TestProcessChatData:
             },
         }
         raw = make_chat_data(profile_extras=profile_extras)
-        self.worker._process_chat_data(raw, '채팅')
+        self.process(raw, '채팅')
 
         result = self.received[0]
-        assert result['subscription_month'] == 12
-        assert result['subscription_tier'] == 1
-        assert 'https://badge.example.com/sub.png' in result['badges']
+        assert result.subscription_month == 12
+        assert result.subscription_tier == 1
+        assert 'https://badge.example.com/sub.png' in result.badges
 
     def test_activity_badges(self):
         profile_extras = {
@@ -100,36 +121,56 @@ class TestProcessChatData:
             ],
         }
         raw = make_chat_data(profile_extras=profile_extras)
-        self.worker._process_chat_data(raw, '채팅')
+        self.process(raw, '채팅')
 
-        badges = self.received[0]['badges']
+        badges = self.received[0].badges
         assert 'https://badge1.png' in badges
         assert 'https://badge2.png' not in badges
         assert 'https://badge3.png' in badges
 
     def test_emojis(self):
         raw = make_chat_data(extras={'emojis': {'smile': 'https://emoji.png'}, 'osType': 'PC'})
-        self.worker._process_chat_data(raw, '채팅')
+        self.process(raw, '채팅')
 
         result = self.received[0]
-        assert result['emojis'] == {'smile': 'https://emoji.png'}
-        assert result['os_type'] == 'PC'
+        assert result.emojis == {'smile': 'https://emoji.png'}
+        assert result.os_type == 'PC'
+
+    def test_shared_empty_containers(self):
+        """배지/이모지가 없으면 공용 빈 컨테이너를 참조"""
+        self.process(make_chat_data(extras={'emojis': {}, 'osType': 'PC'}), '채팅')
+        self.process(make_chat_data(uid='other'), '채팅')
+
+        for result in self.received:
+            assert result.badges is EMPTY_BADGES
+            assert result.emojis is EMPTY_EMOJIS
 
     def test_time_format(self):
         # 2023-11-14 18:13:20 KST (UTC+9)
         raw = make_chat_data(msg_time=1700000000000)
-        self.worker._process_chat_data(raw, '채팅')
+        self.process(raw, '채팅')
         # 시간 형식만 확인 (타임존에 따라 값이 달라짐)
-        assert len(self.received[0]['time']) == 8  # HH:MM:SS
-        assert self.received[0]['time'].count(':') == 2
+        assert len(self.received[0].time) == 8  # HH:MM:SS
+        assert self.received[0].time.count(':') == 2
 
     def test_missing_msg_skipped(self):
         """msg 필드 없으면 스킵"""
         raw = make_chat_data()
         del raw['msg']
-        self.worker._process_chat_data(raw, '채팅')
+        self.process(raw, '채팅')
         assert len(self.received) == 0
 
+    def test_profile_cache_reused(self):
+        """같은 uid + 같은 profile 문자열은 한 번만 파싱"""
+        raw = make_chat_data(msg='1')
+        self.process(raw, '채팅')
+        self.process(dict(raw, msg='2'), '채팅')
+        self.process(make_chat_data(uid='other', msg='3'), '채팅')
+
+        assert [r.message for r in self.received] == ['1', '2', '3']
+        assert self.worker.profile_cache.hits == 1
+        assert self.worker.profile_cache.misses == 2
+
     def test_malformed_profile_skipped(self):
         """프로필 파싱 실패 시 스킵"""
         raw = {
@@ -138,7 +179,7 @@ class TestProcessChatData:
             'msg': '메시지',
             'msgTime': 1700000000000,
         }
-        self.worker._process_chat_data(raw, '채팅')
+        self.process(raw, '채팅')
         assert len(self.received) == 0
 
 
@@ -147,8 +188,333 @@ class TestChatWorkerLifecycle:
 
     def test_create_and_stop(self):
         worker = ChatWorker('test_uid', {}, lambda d: None, lambda m: None)
-        assert worker.daemon is True
+        assert worker.ws is None
         assert worker.running is True
 
-        worker.stop()
+        asyncio.run(worker.stop())
         assert worker.running is False
+
+
+def make_frame(chats, cmd=93101):
+    return json.dumps({'ver': '1', 'cmd': cmd, 'bdy': chats}).encode('utf-8')
+
+
+class FakeWebSocket:
+    """미리 정한 프레임을 돌려주고, 다 쓰면 대기하는 ws 대역"""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.decode_args = []
+
+    async def recv(self, decode=None):
+        self.decode_args.append(decode)
+        if self.frames:
+            return self.frames.pop(0)
+        await asyncio.sleep(3600)
+
+
+class TestBatchDelivery:
+    """on_chat_batch: 프레임/시간 창 단위 묶음 전달"""
+
+    def setup_method(self):
+        self.single = []
+        self.batches = []
+
+    async def _on_chat(self, data):
+        self.single.append(data)
+
+    async def _on_batch(self, messages):
+        self.batches.append(messages)
+
+    def make_worker(self, batch_window=0.0):
+        return ChatWorker('test_uid', {}, self._on_chat, lambda msg: None,
+                          on_chat_batch=self._on_batch, batch_window=batch_window)
+
+    def test_frame_delivered_as_one_batch(self):
+        worker = self.make_worker()
+        frame = make_frame([make_chat_data(msg='a'), make_chat_data(msg='b'), {'uid': 'x'}])
+        asyncio.run(worker._handle_frame(frame))
+
+        assert self.single == []
+        assert [[m.message for m in batch] for batch in self.batches] == [['a', 'b']]
+
+    def test_window_collects_following_frames(self):
+        worker = self.make_worker(batch_window=0.05)
+        worker.ws = FakeWebSocket([
+            make_frame([make_chat_data(msg='b')]),
+            json.dumps({'ver': '2', 'cmd': 10000}).encode('utf-8'),
+            make_frame([make_chat_data(msg='c')], cmd=93102),
+        ])
+
+        async def go():
+            await worker._handle_frame(make_frame([make_chat_data(msg='a')]))
+            await worker._collect_window()
+
+        asyncio.run(go())
+
+        assert len(self.batches) == 1
+        assert [m.message for m in self.batches[0]] == ['a', 'b', 'c']
+        assert self.batches[0][2].is_donation
+
+    def test_recv_decodes_text_only_for_stdlib_json(self):
+        from chat_decoder import available_backends, get_decoder
+
+        for name in available_backends():
+            worker = self.make_worker()
+            worker.decoder = get_decoder(name)
+            worker.ws = FakeWebSocket([b'{}'])
+            asyncio.run(worker._recv())
+            # 표준 json은 str(decode=True), orjson/msgspec은 bytes(decode=False)
+            assert worker.ws.decode_args == [name == 'json']
+
+
+class TestQueuedDelivery:
+    """queue 사용 시 수신 루프와 렌더링 태스크 분리"""
+
+    def test_render_task_drains_queue(self):
+        batches = []
+        rendered = asyncio.Event()
+
+        async def on_batch(messages):
+            batches.append([m.message for m in messages])
+            rendered.set()
+
+        worker = ChatWorker('test_uid', {}, None, lambda msg: None,
+                            on_chat_batch=on_batch, queue=ChatQueue(maxsize=10))
+
+        async def go():
+            render_task = asyncio.create_task(worker._render_loop())
+            await worker._handle_frame(make_frame([make_chat_data(msg='a'), make_chat_data(msg='b')]))
+            assert batches == []  # 수신 쪽은 큐에 넣기만 함
+            await asyncio.wait_for(rendered.wait(), 1)
+            render_task.cancel()
+
+        asyncio.run(go())
+        assert batches == [['a', 'b']]
+        assert worker.stats()['queue']['depth'] == 0
+
+    def test_stop_unblocks_receiver_and_hands_over_queue(self):
+        dropped = []
+
+        async def on_batch(messages):
+            pass
+
+        worker = ChatWorker('test_uid', {}, None, lambda msg: None, on_chat_batch=on_batch,
+                            queue=ChatQueue(maxsize=1, policy='block', on_drop=dropped.extend))
+
+        async def go():
+            frame = make_frame([make_chat_data(msg='a'), make_chat_data(msg='b')])
+            receiver = asyncio.create_task(worker._handle_frame(frame))
+            await asyncio.sleep(0)
+            assert not receiver.done()  # 렌더링 태스크 없이 큐가 가득 참
+
+            await worker.stop()
+            await asyncio.wait_for(receiver, 1)
+
+        asyncio.run(go())
+        assert sorted(m.message for m in dropped) == ['a', 'b']
+        assert len(worker.queue) == 0
+
+
+class ClosableWebSocket(FakeWebSocket):
+    def __init__(self, frames=()):
+        super().__init__(frames)
+        self.sent = []
+        self.closed = False
+
+    async def send(self, data):
+        self.sent.append(data)
+
+    async def close(self):
+        self.closed = True
+
+
+class TestLiveStatusPoll:
+    """방송 상태 폴링: ping 처리와 분리, 채팅 수신 중엔 건너뜀"""
+
+    def make_worker(self, monkeypatch, channel_id):
+        import api
+        self.fetch_calls = 0
+
+        async def fetch(streamer, cookies):
+            self.fetch_calls += 1
+            if channel_id is None:
+                raise ValueError('chatChannelId가 없습니다')
+            return channel_id
+
+        monkeypatch.setattr(api, 'fetch_chatChannelId_async', fetch)
+
+        async def on_chat(data):
+            pass
+
+        worker = ChatWorker('test_uid', {}, on_chat, lambda msg: None, poll_interval=30)
+        worker.chatChannelId = 'old'
+        worker.ws = ClosableWebSocket()
+        return worker
+
+    def test_ping_only_sends_pong(self, monkeypatch):
+        worker = self.make_worker(monkeypatch, 'new')
+        asyncio.run(worker._handle_frame(make_frame([], cmd=0)))
+
+        assert len(worker.ws.sent) == 1
+        assert self.fetch_calls == 0
+
+    def test_channel_change_closes_socket(self, monkeypatch):
+        worker = self.make_worker(monkeypatch, 'new')
+        asyncio.run(worker._poll_live_status())
+
+        assert self.fetch_calls == 1
+        assert worker.ws.closed
+
+    def test_same_channel_keeps_socket(self, monkeypatch):
+        worker = self.make_worker(monkeypatch, 'old')
+        asyncio.run(worker._poll_live_status())
+
+        assert self.fetch_calls == 1
+        assert not worker.ws.closed
+
+    def test_broadcast_end_closes_socket(self, monkeypatch):
+        worker = self.make_worker(monkeypatch, None)
+        asyncio.run(worker._poll_live_status())
+
+        assert worker.ws.closed
+
+    def test_skips_poll_while_chat_arrives(self, monkeypatch):
+        worker = self.make_worker(monkeypatch, 'new')
+
+        async def scenario():
+            await worker._handle_frame(make_frame([make_chat_data()]))
+            await worker._poll_live_status()
+
+        asyncio.run(scenario())
+
+        assert self.fetch_calls == 0
+        assert not worker.ws.closed
+        assert worker.stats()['live_poll'] == {'polls': 0, 'skipped': 1}
+
+    def test_poll_delay_jitter(self, monkeypatch):
+        worker = self.make_worker(monkeypatch, 'old')
+        worker.poll_jitter = 0.2
+        delays = [worker._next_poll_delay() for _ in range(200)]
+
+        assert all(24 <= d <= 36 for d in delays)
+        assert len(set(delays)) > 1
+
+
+class HandshakeWebSocket(ClosableWebSocket):
+    """connect_chat()의 인증/최근 채팅 요청에 응답하는 ws 대역"""
+
+    def __init__(self):
+        super().__init__([json.dumps({'bdy': {'sid': 'sid-1'}}), json.dumps({'bdy': {}})])
+
+
+class FakeConnect:
+    """websockets.connect() 대역 — 실제처럼 코루틴이 아닌 awaitable 객체"""
+
+    def __init__(self, ws):
+        self.ws = ws
+
+    def __await__(self):
+        yield from asyncio.sleep(0).__await__()
+        return self.ws
+
+
+class TestConnectBootstrap:
+    """connect_chat(): 병렬 요청 + userIdHash/채널명 캐시 + 연결 지표"""
+
+    def setup_method(self):
+        import chat_worker
+        chat_worker.clear_bootstrap_cache()
+        self.calls = []
+
+    def make_worker(self, monkeypatch, channel_ids=('ch-1',)):
+        import api
+        import chat_worker
+        ids = list(channel_ids)
+
+        def record(name, value):
+            async def fetch(*args):
+                self.calls.append(name)
+                return value() if callable(value) else value
+            return fetch
+
+        monkeypatch.setattr(api, 'fetch_userIdHash_async', record('userIdHash', 'hash'))
+        monkeypatch.setattr(api, 'fetch_chatChannelId_async', record('chatChannelId', lambda: ids.pop(0)))
+        monkeypatch.setattr(api, 'fetch_channelName_async', record('channelName', '채널'))
+        monkeypatch.setattr(api, 'fetch_accessToken_async', record('accessToken', ('acc', 'extra')))
+
+        monkeypatch.setattr(chat_worker.websockets, 'connect', lambda url: FakeConnect(HandshakeWebSocket()))
+
+        async def on_chat(data):
+            pass
+
+        self.statuses = []
+        return ChatWorker('test_uid', {'NID_AUT': 'a'}, on_chat, self.statuses.append)
+
+    def test_connect_sets_session_values(self, monkeypatch):
+        worker = self.make_worker(monkeypatch)
+        asyncio.run(worker.connect_chat())
+
+        assert (worker.userIdHash, worker.chatChannelId, worker.channelName) == ('hash', 'ch-1', '채널')
+        assert (worker.accessToken, worker.extraToken) == ('acc', 'extra')
+        assert worker.sid == 'sid-1'
+        assert self.statuses[-1] == '채널 채팅창 연결 완료'
+        assert worker.stats()['connect']['count'] == 1
+
+    def test_reconnect_fetches_only_channel_token(self, monkeypatch):
+        worker = self.make_worker(monkeypatch, channel_ids=('ch-1', 'ch-2'))
+
+        async def scenario():
+            await worker.connect_chat()
+            self.calls.clear()
+            await worker.connect_chat()
+
+        asyncio.run(scenario())
+
+        assert sorted(self.calls) == ['accessToken', 'chatChannelId']
+        assert worker.chatChannelId == 'ch-2'
+        assert worker.stats()['connect']['count'] == 2
+
+    def test_failed_bootstrap_closes_pending_socket(self, monkeypatch):
+        import api
+        import chat_worker
+        worker = self.make_worker(monkeypatch)
+        sockets = []
+
+        def connect(url):
+            sockets.append(HandshakeWebSocket())
+            return FakeConnect(sockets[-1])
+
+        async def offline(*args):
+            raise ValueError('chatChannelId가 없습니다')
+
+        monkeypatch.setattr(chat_worker.websockets, 'connect', connect)
+        monkeypatch.setattr(api, 'fetch_chatChannelId_async', offline)
+
+        async def scenario():
+            try:
+                await worker.connect_chat()
+            except ValueError:
+                pass
+            else:
+                raise AssertionError('ValueError 전파되어야 함')
+
+        asyncio.run(scenario())
+
+        assert worker.ws is None
+        assert all(ws.closed for ws in sockets)
+
+    def test_time_to_first_message(self, monkeypatch):
+        worker = self.make_worker(monkeypatch)
+
+        async def scenario():
+            await worker.connect_chat()
+            await worker._handle_frame(make_frame([make_chat_data()]))
+            await worker._handle_frame(make_frame([make_chat_data()]))
+
+        asyncio.run(scenario())
+
+        connect = worker.stats()['connect']
+        assert connect['bootstrap']['count'] == 1
+        assert connect['first_message']['count'] == 1
+        assert connect['first_message']['max'] >= connect['bootstrap']['max']
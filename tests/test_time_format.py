@@ -0,0 +1,63 @@
+"""time_format.py: 초 단위 시각 문자열 캐시 테스트"""
+
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from time_format import TimeFormatter
+
+BASE_MS = 1700000000000
+
+
+def expected(ms, fmt='%H:%M:%S'):
+    return datetime.datetime.fromtimestamp(ms / 1000).strftime(fmt)
+
+
+def test_matches_strftime():
+    formatter = TimeFormatter()
+    for ms in (BASE_MS, BASE_MS + 999, BASE_MS + 1000, BASE_MS + 3_600_123):
+        assert formatter.format(ms) == expected(ms)
+
+
+def test_same_second_is_cached():
+    formatter = TimeFormatter()
+    texts = [formatter.format(BASE_MS + i) for i in range(0, 1000, 10)]
+
+    assert len(set(texts)) == 1
+    assert all(t is texts[0] for t in texts)
+    assert formatter.misses == 1
+    assert formatter.stats()['hit_rate'] > 0.98
+
+
+def test_out_of_order_second_hits_cache():
+    formatter = TimeFormatter()
+    formatter.format(BASE_MS)
+    formatter.format(BASE_MS + 5000)
+    formatter.format(BASE_MS + 100)
+
+    assert formatter.misses == 2
+
+
+def test_cache_is_bounded():
+    formatter = TimeFormatter(maxsize=10)
+    for i in range(25):
+        formatter.format(BASE_MS + i * 1000)
+
+    assert formatter.stats()['size'] <= 10
+
+
+def test_set_format():
+    formatter = TimeFormatter()
+    formatter.format(BASE_MS)
+    formatter.set_format('%H:%M')
+
+    assert formatter.format(BASE_MS) == expected(BASE_MS, '%H:%M')
+
+
+def test_subsecond_format_rejected():
+    with pytest.raises(ValueError):
+        TimeFormatter('%H:%M:%S.%f')